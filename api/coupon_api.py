@@ -9,17 +9,30 @@ PRD 기반 REST API 엔드포인트
 - 잔액 조회
 - 사용·정산
 - 회수 처리
+
+금액 단위:
+- 요청 금액(base_amount)은 쿠폰 단위 (정수 또는 "12.5" 같은 10진 문자열)
+- 응답 금액은 기본 단위 정수 (1 / 10^decimals 쿠폰, ASA 금액과 동일)
 """
 
 import sys
 sys.path.append("..")
 
-from flask import Flask, request, jsonify
+import atexit
+import json
+from dataclasses import asdict
+from typing import Dict, List, Tuple
+
+from flask import Flask, request, jsonify, Response, stream_with_context
 from flask_cors import CORS
 from algosdk.v2client import algod
 
-from contracts.esg_coupon_asa import ESGCouponASA
+from contracts.algod_cache import CachedAlgodClient
+from contracts.coupon_units import CouponUnits
+from contracts.esg_coupon_asa import ESGCouponASA, NOT_OPTED_IN_ERROR
 from contracts.reserve_manager import ReserveManager
+from policies.budget_solver import SCALING_METHODS
+from policies.reward_rules import parse_context
 from policies.reward_calculator import (
     RewardCalculator,
     IncomeLevel,
@@ -27,19 +40,172 @@ from policies.reward_calculator import (
     ActivityType
 )
 from verification.invariants import InvariantVerifier
+from verification.verification_jobs import VerificationJobManager
 from security.multisig_handler import MultiSigHandler
+from services.config_service import shared_config
 
 
 app = Flask(__name__)
 CORS(app)
 
-# Algorand 클라이언트
-algod_client = algod.AlgodClient("", "https://testnet-api.algonode.cloud")
+# ASA 설정 (공유 설정 서비스가 변경 시에만 다시 읽음)
+ASA_CONFIG_FILE = "../config/asa_config.json"
+
+# 잔액 일괄 조회 제한
+MAX_BALANCE_BATCH = 1000        # 요청당 최대 주소 수
+BALANCE_BATCH_TIMEOUT = 5.0     # 요청당 최대 대기 시간 (초)
+
+# 대량 발급 제한 (요청당 최대 행 수)
+MAX_BULK_ROWS = 10000
+
+# 예산·발급 저장소 (스냅샷 + 저널, 저널 항목 수 기준 자동 스냅샷)
+BUDGET_CONFIG_FILE = "./config/budget_config.json"
+BUDGET_JOURNAL_FILE = "./config/budget_journal.jsonl"
+BUDGET_CHECKPOINT_INTERVAL = 10000
+
+# 발급 예산 기간, 온체인 전송 전 기록에 쓰는 트랜잭션 ID
+ISSUE_PERIOD = "2025-Q1"
+SIMULATED_TX_ID = "TX_SIMULATED"
+
+# Algorand 클라이언트 (자산·잔액 조회 캐시, ASA 서비스와 불변식 검증이 공유)
+algod_client = CachedAlgodClient(
+    algod.AlgodClient("", "https://testnet-api.algonode.cloud")
+)
+
+
+def _load_coupon_units() -> CouponUnits:
+    """ASA 금액 단위 (asa_config.json의 decimals, ASA 생성 전이면 정수 단위)"""
+    try:
+        return CouponUnits(shared_config.get(ASA_CONFIG_FILE).get("decimals") or 0)
+    except FileNotFoundError:
+        return CouponUnits()
+
+
+def asset_info_data(asset_id: int, asset_info: Dict) -> Dict:
+    """쿠폰 정보 응답 (algod 자산 조회 결과)"""
+    params = asset_info["params"]
+    return {
+        "asset_id": asset_id,
+        "name": params["name"],
+        "unit_name": params["unit-name"],
+        "total_supply": params["total"],
+        "decimals": params["decimals"],
+        "creator": params["creator"],
+        "manager": params["manager"],
+        "reserve": params["reserve"],
+        "freeze": params["freeze"],
+        "clawback": params["clawback"]
+    }
+
+
+def balance_data(address: str, asset_id: int, balance: int) -> Dict:
+    """잔액 조회 응답 (기본 단위 + 쿠폰 단위 표시)"""
+    return {
+        "address": address,
+        "asset_id": asset_id,
+        "balance": balance,
+        "balance_display": coupon_units.format(balance),
+        "decimals": coupon_units.decimals
+    }
+
+
+def parse_balance_batch(data: Dict) -> Tuple[List[str], float]:
+    """
+    잔액 일괄 조회 요청 검증
+
+    Returns:
+        (주소 목록, 대기 시간(초, 최대 BALANCE_BATCH_TIMEOUT))
+
+    Raises:
+        ValueError: 요청 형식 오류
+    """
+    addresses = data.get("addresses")
+    if not isinstance(addresses, list) or not all(isinstance(a, str) for a in addresses):
+        raise ValueError("addresses는 주소 문자열 목록이어야 합니다.")
+    if len(addresses) > MAX_BALANCE_BATCH:
+        raise ValueError(f"한 번에 최대 {MAX_BALANCE_BATCH}개 주소까지 조회할 수 있습니다.")
+    try:
+        timeout = min(float(data.get("timeout", BALANCE_BATCH_TIMEOUT)), BALANCE_BATCH_TIMEOUT)
+    except (TypeError, ValueError):
+        raise ValueError(f"timeout 형식 오류: {data.get('timeout')!r}")
+    return addresses, timeout
+
+
+def balance_batch_data(asset_id: int, results: List[Dict]) -> Dict:
+    """잔액 일괄 조회 응답 (주소별 결과에 쿠폰 단위 표시 추가)"""
+    for result in results:
+        if result["success"]:
+            result["balance_display"] = coupon_units.format(result["balance"])
+    succeeded = sum(1 for r in results if r["success"])
+    return {
+        "asset_id": asset_id,
+        "decimals": coupon_units.decimals,
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results
+    }
+
+
+def issue_reward(data: Dict) -> Dict:
+    """
+    발급 요청의 차등 보상 계산 (규칙 평가 정보가 없으면 캐시된 견적 사용)
+
+    Raises:
+        ValueError: 금액·등급 형식 오류
+    """
+    base_amount = coupon_units.to_base(data.get("base_amount", 1000))
+
+    context = parse_context(data.get("context"))
+    if context:
+        return reward_calculator.calculate_reward(
+            base_amount=base_amount,
+            income_level=IncomeLevel(data.get("income_level", "middle")),
+            region_type=RegionType(data.get("region_type", "urban")),
+            activity_type=ActivityType(data.get("activity_type", "basic")),
+            context=context
+        )
+    return reward_calculator.quote(
+        base_amount,
+        data.get("income_level", "middle"),
+        data.get("region_type", "urban"),
+        data.get("activity_type", "basic")
+    ).result
+
+
+def issue_data(record, reward_result: Dict) -> Dict:
+    """쿠폰 발급 응답 (발급 기록 + 보상 계산 내역)"""
+    return {
+        "record_id": record.record_id,
+        "user_id": record.user_id,
+        "amount_issued": record.amount,
+        "amount_issued_display": coupon_units.format(record.amount),
+        "decimals": coupon_units.decimals,
+        "reward_breakdown": reward_result,
+        "tx_id": record.tx_id
+    }
+
 
 # 서비스 초기화
-asa_service = ESGCouponASA(algod_address="https://testnet-api.algonode.cloud")
-reserve_manager = ReserveManager()
-reward_calculator = RewardCalculator()
+coupon_units = _load_coupon_units()
+asa_service = ESGCouponASA(algod_client=algod_client)
+asa_service.units = coupon_units
+# 콜드 스타트 시 예산·집계값만 로드 (발급 이력은 조회 API 최초 호출 시 적재)
+# 발급은 저널에 한 줄씩 추가하고 BUDGET_CHECKPOINT_INTERVAL건마다 스냅샷으로 합침
+reserve_manager = ReserveManager(
+    config_file=BUDGET_CONFIG_FILE,
+    journal_file=BUDGET_JOURNAL_FILE,
+    checkpoint_interval=BUDGET_CHECKPOINT_INTERVAL,
+    lazy_history=True,
+    units=coupon_units
+)
+atexit.register(reserve_manager.close)
+# 가중치 정책 파일 변경 시 재배포 없이 새 스냅샷으로 교체
+reward_calculator = RewardCalculator(policy_file="../config/reward_policy.json")
+reward_calculator.start_policy_watcher()
+# 불변식 검증은 백그라운드 작업으로 실행 (작업마다 계정 설정을 다시 반영)
+verification_jobs = VerificationJobManager(
+    lambda asset_id: InvariantVerifier(algod_client, asset_id, reserve_manager=reserve_manager)
+)
 
 
 @app.route('/health', methods=['GET'])
@@ -60,27 +226,13 @@ def get_coupon_info():
     """
     try:
         # Asset ID (config에서 로드)
-        import json
-        with open("../config/asa_config.json", 'r') as f:
-            config = json.load(f)
-            asset_id = config["asset_id"]
+        asset_id = shared_config.get(ASA_CONFIG_FILE)["asset_id"]
 
         asset_info = asa_service.get_asset_info(asset_id)
 
         return jsonify({
             "success": True,
-            "data": {
-                "asset_id": asset_id,
-                "name": asset_info["params"]["name"],
-                "unit_name": asset_info["params"]["unit-name"],
-                "total_supply": asset_info["params"]["total"],
-                "decimals": asset_info["params"]["decimals"],
-                "creator": asset_info["params"]["creator"],
-                "manager": asset_info["params"]["manager"],
-                "reserve": asset_info["params"]["reserve"],
-                "freeze": asset_info["params"]["freeze"],
-                "clawback": asset_info["params"]["clawback"]
-            }
+            "data": asset_info_data(asset_id, asset_info)
         })
 
     except Exception as e:
@@ -97,26 +249,59 @@ def get_balance(address: str):
     PRD 2.1: 수령(Receive) 상태 확인
     """
     try:
-        import json
-        with open("../config/asa_config.json", 'r') as f:
-            config = json.load(f)
-            asset_id = config["asset_id"]
+        asset_id = shared_config.get(ASA_CONFIG_FILE)["asset_id"]
 
         balance = asa_service.get_account_asset_balance(address, asset_id)
 
         if balance is None:
             return jsonify({
                 "success": False,
-                "error": "계정이 ASA를 opt-in하지 않았습니다."
+                "error": NOT_OPTED_IN_ERROR
             }), 404
 
         return jsonify({
             "success": True,
-            "data": {
-                "address": address,
-                "asset_id": asset_id,
-                "balance": balance
-            }
+            "data": balance_data(address, asset_id, balance)
+        })
+
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
+@app.route('/api/coupon/balances', methods=['POST'])
+def get_balances():
+    """
+    잔액 일괄 조회 (가맹점·지자체 대시보드)
+    PRD 2.1: 수령(Receive) 상태 확인
+
+    요청 예시:
+    {
+        "addresses": ["ALGORAND_ADDRESS_1", "ALGORAND_ADDRESS_2"],
+        "timeout": 3.0
+    }
+
+    timeout(선택, 최대 5초) 안에 조회하지 못한 주소는 실패로 표시하고
+    나머지 결과를 반환한다 (주소별 success/error).
+    """
+    try:
+        addresses, timeout = parse_balance_batch(request.json or {})
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
+
+    try:
+        asset_id = shared_config.get(ASA_CONFIG_FILE)["asset_id"]
+
+        results = asa_service.get_account_asset_balances(addresses, asset_id, timeout=timeout)
+
+        return jsonify({
+            "success": True,
+            "data": balance_batch_data(asset_id, results)
         })
 
     except Exception as e:
@@ -135,8 +320,20 @@ def calculate_reward():
     try:
         data = request.json
 
-        # 파라미터 추출
-        base_amount = data.get("base_amount", 1000)
+        # 파라미터 추출 (쿠폰 단위 → 기본 단위)
+        base_amount = coupon_units.to_base(data.get("base_amount", 1000))
+        context = parse_context(data.get("context"))
+
+        # 규칙 평가 정보가 없으면 캐시된 견적 응답을 그대로 반환
+        if not context:
+            quote = reward_calculator.quote(
+                base_amount,
+                data.get("income_level", "middle"),
+                data.get("region_type", "urban"),
+                data.get("activity_type", "basic")
+            )
+            return Response(quote.body, mimetype="application/json")
+
         income_level = IncomeLevel(data.get("income_level", "middle"))
         region_type = RegionType(data.get("region_type", "urban"))
         activity_type = ActivityType(data.get("activity_type", "basic"))
@@ -146,7 +343,8 @@ def calculate_reward():
             base_amount=base_amount,
             income_level=income_level,
             region_type=region_type,
-            activity_type=activity_type
+            activity_type=activity_type,
+            context=context
         )
 
         return jsonify({
@@ -182,56 +380,174 @@ def issue_coupon():
         data = request.json
 
         user_id = data.get("user_id")
-        user_address = data.get("user_address")
-        base_amount = data.get("base_amount", 1000)
-
-        # 차등 보상 계산
-        income_level = IncomeLevel(data.get("income_level", "middle"))
-        region_type = RegionType(data.get("region_type", "urban"))
-        activity_type = ActivityType(data.get("activity_type", "basic"))
-
-        reward_result = reward_calculator.calculate_reward(
-            base_amount=base_amount,
-            income_level=income_level,
-            region_type=region_type,
-            activity_type=activity_type
-        )
-
+        reward_result = issue_reward(data)
         final_amount = reward_result["final_amount"]
 
-        # 발급 가능 여부 확인
-        check = reserve_manager.check_issuance_allowed(
+        # 발급 예약 (한도 확인 + 선점을 원자적으로 수행)
+        hold = reserve_manager.reserve_issuance(
             user_id=user_id,
             amount=final_amount,
-            period="2025-Q1"
+            period=ISSUE_PERIOD,
+            region=reward_result["region_type"]
         )
 
-        if not check["allowed"]:
+        if not hold["allowed"]:
             return jsonify({
                 "success": False,
-                "error": check["reason"]
+                "error": hold["reason"]
             }), 403
 
-        # Reserve에서 발급 (실제로는 private key 필요 - 보안상 별도 처리)
-        # result = asa_service.transfer_from_reserve(...)
+        try:
+            # Reserve에서 발급 (실제로는 private key 필요 - 보안상 별도 처리)
+            # result = asa_service.transfer_from_reserve(...)
 
-        # 발급 기록
-        record = reserve_manager.record_issuance(
-            user_id=user_id,
-            amount=final_amount,
-            reason=data.get("reason", "보상 지급"),
-            tx_id="TX_SIMULATED",  # 실제로는 블록체인 TX ID
-            period="2025-Q1"
-        )
+            # 발급 기록 (예약 확정)
+            record = reserve_manager.commit_hold(
+                hold["hold_id"],
+                reason=data.get("reason", "보상 지급"),
+                tx_id=SIMULATED_TX_ID  # 실제로는 블록체인 TX ID
+            )
+        except Exception:
+            reserve_manager.release_hold(hold["hold_id"])
+            raise
+
+        return jsonify({
+            "success": True,
+            "data": issue_data(record, reward_result)
+        })
+
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
+@app.route('/api/coupon/issue/bulk', methods=['POST'])
+def issue_coupons_bulk():
+    """
+    쿠폰 대량 발급 (캠페인 일괄 지급)
+    PRD 2.1: 발급(Issue) S0→S1→S2
+
+    요청 예시:
+    {
+        "period": "2025-Q1",
+        "reason": "2025 Q1 탄소중립 캠페인",
+        "scaling": "water_fill",
+        "rows": [
+            {
+                "user_id": "user001",
+                "user_address": "ALGORAND_ADDRESS",
+                "base_amount": 1000,
+                "income_level": "low",
+                "region_type": "rural",
+                "activity_type": "carbon_neutral",
+                "context": {"hour": 8, "merchant_category": "local_market", "streak_days": 12}
+            }
+        ]
+    }
+
+    context (선택): 추가 보상 규칙 평가 정보 (policies.reward_rules)
+
+    scaling (선택): 예산 초과 시 거절 대신 "uniform"(비율) 또는
+    "water_fill"(1인 상한) 방식으로 행별 금액을 조정해 예산을 모두 사용
+
+    rows는 요청당 최대 MAX_BULK_ROWS행 (초과 시 400)
+    """
+    try:
+        data = request.json
+        period = data.get("period", "2025-Q1")
+        default_reason = data.get("reason", "보상 지급")
+        rows = data.get("rows", [])
+        scaling = data.get("scaling")
+        if not isinstance(rows, list):
+            return jsonify({
+                "success": False,
+                "error": "rows는 발급 행 목록이어야 합니다."
+            }), 400
+        if len(rows) > MAX_BULK_ROWS:
+            return jsonify({
+                "success": False,
+                "error": f"한 번에 최대 {MAX_BULK_ROWS}행까지 발급할 수 있습니다."
+            }), 400
+        if scaling is not None and scaling not in SCALING_METHODS:
+            return jsonify({
+                "success": False,
+                "error": f"알 수 없는 조정 방식: {scaling}"
+            }), 400
+
+        # 행별 입력 검증 (입력 오류 행은 바로 실패 처리)
+        results = [None] * len(rows)
+        positions = []
+        columns = ([], [], [], [])
+        contexts = {"hour": [], "merchant_category": [], "streak_days": []}
+        for index, row in enumerate(rows):
+            try:
+                if not isinstance(row, dict):
+                    raise ValueError("행은 JSON 객체여야 합니다.")
+                user_id = row.get("user_id")
+                if not isinstance(user_id, str) or not user_id:
+                    raise ValueError("user_id는 비어 있지 않은 문자열이어야 합니다.")
+                base_amount = coupon_units.to_base(row.get("base_amount", 1000))
+                values = (
+                    base_amount,
+                    IncomeLevel(row.get("income_level", "middle")),
+                    RegionType(row.get("region_type", "urban")),
+                    ActivityType(row.get("activity_type", "basic"))
+                )
+                context = parse_context(row.get("context"))
+            except (ValueError, TypeError) as e:
+                results[index] = {
+                    "index": index,
+                    "user_id": row.get("user_id") if isinstance(row, dict) else None,
+                    "success": False,
+                    "error": str(e)
+                }
+                continue
+
+            positions.append(index)
+            for column, value in zip(columns, values):
+                column.append(value)
+            for key, column in contexts.items():
+                column.append(context.get(key))
+
+        # 보상 일괄 계산
+        rewards = reward_calculator.calculate_rewards_batch(*columns, contexts=contexts)
+
+        issuances = []
+        for i, index in enumerate(positions):
+            row = rows[index]
+            issuances.append({
+                "user_id": row.get("user_id"),
+                "amount": int(rewards["final_amounts"][i]),
+                "reason": row.get("reason", default_reason),
+                "tx_id": SIMULATED_TX_ID,  # 실제로는 블록체인 TX ID
+                "region": columns[2][i].value
+            })
+
+        # Reserve에서 일괄 발급 (실제로는 private key 필요 - 보안상 별도 처리)
+        # asa_service.transfer_from_reserve_batch(...)
+
+        # 검증·저장을 한 번에 수행
+        for index, result in zip(
+            positions,
+            reserve_manager.record_issuances_bulk(issuances, period, scaling=scaling)
+        ):
+            result["index"] = index
+            results[index] = result
+
+        accepted = sum(1 for r in results if r["success"])
 
         return jsonify({
             "success": True,
             "data": {
-                "record_id": record.record_id,
-                "user_id": user_id,
-                "amount_issued": final_amount,
-                "reward_breakdown": reward_result,
-                "tx_id": record.tx_id
+                "period": period,
+                "policy_version": rewards["policy_version"],
+                "decimals": coupon_units.decimals,
+                "scaling": scaling,
+                "accepted": accepted,
+                "rejected": len(results) - accepted,
+                "results": results
             }
         })
 
@@ -291,24 +607,89 @@ def get_user_summary(user_id: str):
         }), 500
 
 
+@app.route('/api/coupon/issuances', methods=['GET'])
+def query_issuances():
+    """
+    기간별 발급 내역 조회 (감사용)
+    PRD 2.2: 배분 이력 추적
+
+    쿼리 파라미터: start, end (ISO 시각, end 미포함), user_id, period
+    결과는 한 건씩 직렬화하여 스트리밍한다.
+    """
+    try:
+        records = reserve_manager.query_issuances(
+            start=request.args.get("start"),
+            end=request.args.get("end"),
+            user_id=request.args.get("user_id"),
+            period=request.args.get("period")
+        )
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
+
+    def generate():
+        yield '{"success": true, "data": ['
+        for i, record in enumerate(records):
+            yield ("," if i else "") + json.dumps(asdict(record), ensure_ascii=False)
+        yield ']}'
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
+
+
 @app.route('/api/coupon/verify-invariants', methods=['POST'])
 def verify_invariants():
     """
-    불변식 검증
+    불변식 검증 작업 등록
     PRD 4.2: 필수 불변식
+
+    검증은 백그라운드에서 실행되며 작업 ID를 즉시 반환한다 (202).
+    같은 자산의 검증이 진행 중이면 그 작업을 공유한다 (shared=true).
+    진행 상황은 GET /api/coupon/verify-invariants/<job_id>,
+    최근 완료 결과는 GET /api/coupon/verify-invariants/latest로 조회한다.
     """
     try:
-        import json
-        with open("../config/asa_config.json", 'r') as f:
-            config = json.load(f)
-            asset_id = config["asset_id"]
+        asset_id = shared_config.get(ASA_CONFIG_FILE)["asset_id"]
 
-        verifier = InvariantVerifier(algod_client, asset_id)
-        results = verifier.verify_all_invariants()
+        job, created = verification_jobs.submit(asset_id)
 
         return jsonify({
             "success": True,
-            "data": results
+            "data": {
+                "job": job,
+                "shared": not created,
+                "status_url": f"/api/coupon/verify-invariants/{job['job_id']}",
+                "latest": verification_jobs.latest(asset_id)
+            }
+        }), 202
+
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
+@app.route('/api/coupon/verify-invariants/latest', methods=['GET'])
+def get_latest_verification():
+    """
+    최근 완료된 불변식 검증 결과 (age_seconds: 완료 후 경과 시간)
+    PRD 4.2: 필수 불변식
+    """
+    try:
+        asset_id = shared_config.get(ASA_CONFIG_FILE)["asset_id"]
+
+        latest = verification_jobs.latest(asset_id)
+        if latest is None:
+            return jsonify({
+                "success": False,
+                "error": "완료된 검증 결과가 없습니다."
+            }), 404
+
+        return jsonify({
+            "success": True,
+            "data": latest
         })
 
     except Exception as e:
@@ -318,6 +699,25 @@ def verify_invariants():
         }), 500
 
 
+@app.route('/api/coupon/verify-invariants/<job_id>', methods=['GET'])
+def get_verification_job(job_id: str):
+    """
+    불변식 검증 작업 상태·진행 상황 조회
+    PRD 4.2: 필수 불변식
+    """
+    job = verification_jobs.get(job_id)
+    if job is None:
+        return jsonify({
+            "success": False,
+            "error": "검증 작업을 찾을 수 없습니다."
+        }), 404
+
+    return jsonify({
+        "success": True,
+        "data": job
+    })
+
+
 @app.route('/api/admin/top-recipients', methods=['GET'])
 def get_top_recipients():
     """
@@ -326,7 +726,11 @@ def get_top_recipients():
     """
     try:
         limit = int(request.args.get("limit", 10))
-        top_recipients = reserve_manager.get_top_recipients(limit)
+        top_recipients = reserve_manager.get_top_recipients(
+            limit,
+            period=request.args.get("period"),
+            region=request.args.get("region")
+        )
 
         return jsonify({
             "success": True,
@@ -340,6 +744,30 @@ def get_top_recipients():
         }), 500
 
 
+@app.route('/api/admin/reward-quote-cache', methods=['GET'])
+def get_reward_quote_cache_stats():
+    """
+    보상 견적 캐시 통계
+    관리자용 API
+    """
+    return jsonify({
+        "success": True,
+        "data": reward_calculator.quote_cache_stats()
+    })
+
+
+@app.route('/api/admin/algod-cache', methods=['GET'])
+def get_algod_cache_stats():
+    """
+    algod 조회 캐시 통계
+    관리자용 API
+    """
+    return jsonify({
+        "success": True,
+        "data": algod_client.cache_stats()
+    })
+
+
 @app.errorhandler(404)
 def not_found(error):
     return jsonify({
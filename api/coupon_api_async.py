@@ -0,0 +1,582 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+디지털 쿠폰 API (ASGI / asyncio)
+PRD 8: 성능 및 제약사항 - 대량 잔액 조회
+
+api/coupon_api.py와 같은 경로·요청·응답 형식을 ASGI로 제공한다.
+
+- algod 조회 경로(쿠폰 정보, 잔액, 잔액 일괄 조회)는 비동기 algod 클라이언트
+  (keep-alive 연결 풀 + 조회 캐시)로 이벤트 루프에서 처리한다.
+  조회를 기다리는 동안 스레드를 점유하지 않으므로 한 프로세스가 수천 건의
+  조회를 동시에 진행할 수 있다.
+- 쿠폰 발급은 한도 확인·기록 저장만 스레드 풀에서 실행하고, 온체인 전송과
+  확정 대기(wait_for_confirmation)는 비동기 클라이언트로 이벤트 루프에서
+  기다리므로 확정을 기다리는 발급 요청도 스레드를 점유하지 않는다.
+- 나머지 경로(보상 계산·대량 발급·예산·이력·검증·관리자 통계)는 로컬 계산·
+  저장소 작업이므로 기존 Flask 앱을 WSGI→ASGI 어댑터로 그대로 제공한다.
+  요청마다 스레드 풀의 스레드에서 병렬 실행한다.
+  서비스 인스턴스(예산 관리, 보상 계산기)는 Flask 앱과 공유한다.
+
+실행 (api/ 디렉토리에서, 예산·발급 저장소를 공유하므로 워커 1개):
+    uvicorn coupon_api_async:app --host 0.0.0.0 --port 5000
+"""
+
+import sys
+sys.path.append("..")
+
+import asyncio
+import functools
+import io
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from algosdk import encoding
+from algosdk.error import AlgodHTTPError, TransactionRejectedError
+from algosdk.transaction import AssetTransferTxn
+
+from api.coupon_api import (
+    app as flask_app,
+    ASA_CONFIG_FILE,
+    ISSUE_PERIOD,
+    SIMULATED_TX_ID,
+    asset_info_data,
+    balance_data,
+    balance_batch_data,
+    issue_data,
+    issue_reward,
+    parse_balance_batch,
+    reserve_manager
+)
+from contracts.algod_cache import AsyncCachedAlgodClient
+from contracts.async_algod import AsyncAlgodClient
+from contracts.esg_coupon_asa import (
+    INVALID_ADDRESS_ERROR,
+    LOOKUP_TIMEOUT_ERROR,
+    NOT_OPTED_IN_ERROR,
+    balance_outcome
+)
+from contracts.reserve_manager import IssuanceHoldError
+from services.config_service import shared_config
+
+
+ALGOD_ADDRESS = "https://testnet-api.algonode.cloud"
+
+# 프로세스 전체 algod 동시 조회 상한 (초과분은 코루틴으로 대기, 스레드 사용 없음)
+MAX_INFLIGHT_LOOKUPS = 4096
+
+# Flask 요청·저장소 작업을 실행할 스레드 수
+SYNC_WORKERS = 32
+
+# 발급 전송 확정 대기 라운드 수 (ESGCouponASA.transfer_from_reserve와 동일)
+CONFIRMATION_ROUNDS = 4
+
+# 전송된 발급의 기록 저장 재시도 (저장소 오류 시)
+RECORD_ATTEMPTS = 3
+RECORD_RETRY_DELAY = 0.1        # 초
+
+# 비동기 algod 클라이언트 (연결 풀·조회 캐시는 프로세스 수명 동안 재사용)
+async_algod_client = AsyncCachedAlgodClient(AsyncAlgodClient("", ALGOD_ADDRESS))
+
+# 발급 서명 계정 (주소, 개인키) - 보안상 배포 시 별도 주입,
+# 없으면 coupon_api와 같이 온체인 전송 없이 기록만 저장
+reserve_signer: Optional[Tuple[str, str]] = None
+
+sync_executor = ThreadPoolExecutor(max_workers=SYNC_WORKERS, thread_name_prefix="coupon-sync")
+
+
+class ThreadPoolWsgiToAsgi:
+    """
+    WSGI→ASGI 어댑터 (요청별 병렬 실행)
+
+    요청 본문을 모두 받은 뒤 WSGI 앱을 sync_executor의 스레드에서 실행하고,
+    응답 조각은 생성되는 대로 이벤트 루프로 보낸다 (스트리밍 응답 지원).
+    """
+
+    def __init__(self, wsgi_application: Callable):
+        self.wsgi_application = wsgi_application
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            raise ValueError(f"WSGI 앱은 HTTP 요청만 처리합니다: {scope['type']}")
+
+        body = await _read_body(receive)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            sync_executor, self.run_wsgi_app, scope, body, send, loop
+        )
+
+    def run_wsgi_app(self, scope: Dict, body: bytes, send, loop: asyncio.AbstractEventLoop):
+        """WSGI 앱 실행 (작업 스레드), send는 이벤트 루프에서 실행하고 완료까지 대기"""
+        def send_message(message: Dict):
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        response_start = {}
+        started = False
+
+        def start_response(status: str, response_headers, exc_info=None):
+            if exc_info and started:
+                raise exc_info[1].with_traceback(exc_info[2])
+            response_start.update({
+                "type": "http.response.start",
+                "status": int(status.split(" ", 1)[0]),
+                "headers": [
+                    (name.lower().encode("latin-1"), value.encode("latin-1"))
+                    for name, value in response_headers
+                ]
+            })
+            return write
+
+        def write(data: bytes):
+            nonlocal started
+            if not started:
+                send_message(response_start)
+                started = True
+            if data:
+                send_message({"type": "http.response.body", "body": data, "more_body": True})
+
+        response = self.wsgi_application(self.build_environ(scope, body), start_response)
+        try:
+            for chunk in response:
+                write(chunk)
+            write(b"")
+            send_message({"type": "http.response.body", "body": b""})
+        finally:
+            close = getattr(response, "close", None)
+            if close is not None:
+                close()
+
+    @staticmethod
+    def build_environ(scope: Dict, body: bytes) -> Dict:
+        """ASGI scope → WSGI environ (PEP 3333)"""
+        root_path = scope.get("root_path", "")
+        path = scope["path"]
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        server_name, server_port = scope.get("server") or ("localhost", 80)
+
+        environ = {
+            "REQUEST_METHOD": scope["method"],
+            "SCRIPT_NAME": root_path.encode("utf-8").decode("latin-1"),
+            "PATH_INFO": path.encode("utf-8").decode("latin-1"),
+            "QUERY_STRING": scope.get("query_string", b"").decode("ascii"),
+            "SERVER_NAME": server_name,
+            "SERVER_PORT": str(server_port),
+            "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": scope.get("scheme", "http"),
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False
+        }
+        if scope.get("client"):
+            environ["REMOTE_ADDR"] = scope["client"][0]
+            environ["REMOTE_PORT"] = str(scope["client"][1])
+
+        for name, value in scope.get("headers", []):
+            name = name.decode("latin-1").upper().replace("-", "_")
+            if name == "CONTENT_TYPE" or name == "CONTENT_LENGTH":
+                key = name
+            else:
+                key = f"HTTP_{name}"
+            value = value.decode("latin-1")
+            # 같은 이름의 헤더는 쉼표로 합침
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+
+        return environ
+
+
+# 비동기 경로 외의 요청은 Flask 앱으로 전달
+wsgi_app = ThreadPoolWsgiToAsgi(flask_app)
+
+_lookup_slots: Optional[asyncio.Semaphore] = None
+
+
+def _slots() -> asyncio.Semaphore:
+    """동시 조회 세마포어 (이벤트 루프 안에서 최초 생성)"""
+    global _lookup_slots
+    if _lookup_slots is None:
+        _lookup_slots = asyncio.Semaphore(MAX_INFLIGHT_LOOKUPS)
+    return _lookup_slots
+
+
+async def run_sync(func: Callable, *args, **kwargs):
+    """동기 함수(저장소·계산 작업)를 sync_executor에서 실행"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(sync_executor, functools.partial(func, *args, **kwargs))
+
+
+async def asset_holding(address: str, asset_id: int) -> Optional[int]:
+    """
+    단일 자산 보유량 조회 (ESGCouponASA._asset_holding의 비동기 버전)
+
+    Returns:
+        int: 보유량 (기본 단위), opt-in 전이면 None
+    """
+    async with _slots():
+        try:
+            info = await async_algod_client.account_asset_info(address, asset_id)
+        except AlgodHTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+    return info["asset-holding"]["amount"]
+
+
+async def asset_balances(addresses: Sequence[str], asset_id: int, timeout: float) -> List[Dict]:
+    """
+    여러 계정의 ASA 잔액 일괄 조회 (ESGCouponASA.get_account_asset_balances의 비동기 버전)
+
+    중복 주소는 한 번만 조회하고, timeout(초) 안에 끝나지 않은 주소는
+    실패로 표시한다. 결과는 addresses 순서.
+    """
+    outcomes: Dict[str, Dict] = {}
+    tasks = {}
+    for address in dict.fromkeys(addresses):
+        if not encoding.is_valid_address(address):
+            outcomes[address] = {"success": False, "error": INVALID_ADDRESS_ERROR}
+        else:
+            tasks[asyncio.ensure_future(asset_holding(address, asset_id))] = address
+
+    done, pending = await asyncio.wait(tasks, timeout=timeout) if tasks else (set(), set())
+    for task in pending:
+        task.cancel()
+        outcomes[tasks[task]] = {"success": False, "error": LOOKUP_TIMEOUT_ERROR}
+    for task in done:
+        address = tasks[task]
+        try:
+            outcomes[address] = balance_outcome(task.result())
+        except Exception as e:
+            outcomes[address] = {"success": False, "error": str(e)}
+
+    return [{"address": address, **outcomes[address]} for address in addresses]
+
+
+async def send_from_reserve(recipient_address: str, amount: int, asset_id: int) -> str:
+    """
+    Reserve에서 쿠폰 전송 (ESGCouponASA.transfer_from_reserve의 비동기 버전, 확정 대기 제외)
+
+    서명 계정이 없으면 전송하지 않고 SIMULATED_TX_ID를 반환한다.
+
+    Returns:
+        str: 전송한 트랜잭션 ID
+
+    Raises:
+        AlgodHTTPError
+    """
+    if reserve_signer is None:
+        return SIMULATED_TX_ID
+
+    reserve_address, reserve_private_key = reserve_signer
+    params = await async_algod_client.suggested_params()
+    txn = AssetTransferTxn(
+        sender=reserve_address,
+        sp=params,
+        receiver=recipient_address,
+        amt=amount,
+        index=asset_id
+    )
+
+    return await async_algod_client.send_transaction(txn.sign(reserve_private_key))
+
+
+async def confirm_transfer(tx_id: str, recipient_address: str):
+    """
+    전송 확정 대기 후 두 계정의 조회 캐시 무효화
+
+    Raises:
+        ConfirmationTimeoutError, TransactionRejectedError
+    """
+    if tx_id == SIMULATED_TX_ID:
+        return
+
+    await async_algod_client.wait_for_confirmation(tx_id, CONFIRMATION_ROUNDS)
+    async_algod_client.invalidate_account(reserve_signer[0])
+    async_algod_client.invalidate_account(recipient_address)
+
+
+def record_transfer(
+    hold_id: str,
+    tx_id: str,
+    reason: str,
+    user_id: str,
+    amount: int,
+    region: Optional[str]
+):
+    """
+    전송된 발급 기록 (예약 확정)
+
+    쿠폰은 이미 전송되었으므로 예약이 만료·해제되었으면 같은 tx_id로
+    직접 기록하고, 저장소 오류는 RECORD_ATTEMPTS회까지 재시도한다.
+    """
+    for attempt in range(1, RECORD_ATTEMPTS + 1):
+        try:
+            return reserve_manager.commit_hold(hold_id, reason=reason, tx_id=tx_id)
+        except IssuanceHoldError:
+            break
+        except OSError:
+            if attempt == RECORD_ATTEMPTS:
+                raise
+            time.sleep(RECORD_RETRY_DELAY)
+
+    return reserve_manager.record_issuance(
+        user_id=user_id,
+        amount=amount,
+        reason=reason,
+        tx_id=tx_id,
+        period=ISSUE_PERIOD,
+        region=region
+    )
+
+
+# ----------------------------------------------------------------------
+# 비동기 경로 (응답 형식은 coupon_api.py의 같은 경로와 동일)
+# ----------------------------------------------------------------------
+
+async def get_coupon_info(request: Dict):
+    """쿠폰 정보 조회"""
+    try:
+        asset_id = shared_config.get(ASA_CONFIG_FILE)["asset_id"]
+        asset_info = await async_algod_client.asset_info(asset_id)
+
+        return {
+            "success": True,
+            "data": asset_info_data(asset_id, asset_info)
+        }, 200
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }, 500
+
+
+async def get_balance(request: Dict):
+    """잔액 조회"""
+    address = request["params"]["address"]
+    try:
+        asset_id = shared_config.get(ASA_CONFIG_FILE)["asset_id"]
+        balance = await asset_holding(address, asset_id)
+
+        if balance is None:
+            return {
+                "success": False,
+                "error": NOT_OPTED_IN_ERROR
+            }, 404
+
+        return {
+            "success": True,
+            "data": balance_data(address, asset_id, balance)
+        }, 200
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }, 500
+
+
+async def get_balances(request: Dict):
+    """잔액 일괄 조회 (요청 형식은 coupon_api.get_balances 참조)"""
+    try:
+        data = json.loads(request["body"] or b"{}")
+        if not isinstance(data, dict):
+            raise ValueError("요청 본문은 JSON 객체여야 합니다.")
+        addresses, timeout = parse_balance_batch(data)
+    except ValueError as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }, 400
+
+    try:
+        asset_id = shared_config.get(ASA_CONFIG_FILE)["asset_id"]
+        results = await asset_balances(addresses, asset_id, timeout)
+
+        return {
+            "success": True,
+            "data": balance_batch_data(asset_id, results)
+        }, 200
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }, 500
+
+
+async def issue_coupon(request: Dict):
+    """
+    쿠폰 발급 (요청 형식은 coupon_api.issue_coupon 참조)
+
+    예약 → 온체인 전송 → 확정 대기 → 예약 확정 순서로 처리한다.
+    전송 전에 실패하거나 요청이 취소되면 예약을 해제하고, 전송 이후에는
+    요청이 취소되거나 확정 대기 시간이 지나도 tx_id로 기록한다
+    (트랜잭션 풀에서 거부된 경우만 예약 해제).
+    """
+    try:
+        data = json.loads(request["body"] or b"{}")
+        if not isinstance(data, dict):
+            raise ValueError("요청 본문은 JSON 객체여야 합니다.")
+
+        user_id = data.get("user_id")
+        reward_result = await run_sync(issue_reward, data)
+        final_amount = reward_result["final_amount"]
+
+        # 발급 예약 (한도 확인 + 선점을 원자적으로 수행)
+        hold = await run_sync(
+            reserve_manager.reserve_issuance,
+            user_id=user_id,
+            amount=final_amount,
+            period=ISSUE_PERIOD,
+            region=reward_result["region_type"]
+        )
+
+        if not hold["allowed"]:
+            return {
+                "success": False,
+                "error": hold["reason"]
+            }, 403
+
+        recipient_address = data.get("user_address")
+        try:
+            asset_id = shared_config.get(ASA_CONFIG_FILE)["asset_id"]
+            tx_id = await send_from_reserve(recipient_address, final_amount, asset_id)
+        except BaseException:
+            # 취소(CancelledError) 포함, 예약 해제는 잠금만 사용하므로 바로 실행
+            reserve_manager.release_hold(hold["hold_id"])
+            raise
+
+        # 발급 기록 (예약 확정), 요청이 취소되어도 끝까지 저장
+        record_sent = functools.partial(
+            run_sync,
+            record_transfer,
+            hold["hold_id"],
+            tx_id,
+            data.get("reason", "보상 지급"),
+            user_id,
+            final_amount,
+            reward_result["region_type"]
+        )
+        try:
+            await confirm_transfer(tx_id, recipient_address)
+        except TransactionRejectedError:
+            reserve_manager.release_hold(hold["hold_id"])
+            raise
+        except BaseException:
+            await asyncio.shield(record_sent())
+            raise
+        record = await asyncio.shield(record_sent())
+
+        return {
+            "success": True,
+            "data": issue_data(record, reward_result)
+        }, 200
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }, 500
+
+
+# (메서드, 경로 조각) → 처리 함수, "<name>" 조각은 경로 변수
+ROUTES = [
+    ("GET", ("api", "coupon", "info"), get_coupon_info),
+    ("GET", ("api", "coupon", "balance", "<address>"), get_balance),
+    ("POST", ("api", "coupon", "balances"), get_balances),
+    ("POST", ("api", "coupon", "issue"), issue_coupon),
+]
+
+
+def match_route(method: str, path: str):
+    """비동기 경로 조회 (없으면 None → Flask 앱으로 전달)"""
+    parts = tuple(path.strip("/").split("/"))
+    for route_method, pattern, handler in ROUTES:
+        if route_method != method or len(pattern) != len(parts):
+            continue
+        params = {}
+        for expected, actual in zip(pattern, parts):
+            if expected.startswith("<"):
+                if not actual:
+                    break
+                params[expected[1:-1]] = actual
+            elif expected != actual:
+                break
+        else:
+            return handler, params
+    return None
+
+
+async def _read_body(receive: Callable[[], Awaitable[Dict]]) -> bytes:
+    chunks = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunks.append(message.get("body", b""))
+        more_body = message.get("more_body", False)
+    return b"".join(chunks)
+
+
+async def _send_json(send, payload: Dict, status: int):
+    # Flask jsonify와 같은 직렬화, CORS 헤더는 flask_cors 기본값과 동일
+    body = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"access-control-allow-origin", b"*")
+        ]
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _lifespan(receive, send):
+    """서버 시작·종료 (종료 시 algod 연결 풀 정리)"""
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await async_algod_client.aclose()
+            sync_executor.shutdown(wait=False)
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    """ASGI 진입점"""
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+
+    route = match_route(scope["method"], scope["path"]) if scope["type"] == "http" else None
+    if route is None:
+        await wsgi_app(scope, receive, send)
+        return
+
+    handler, params = route
+    body = await _read_body(receive) if scope["method"] == "POST" else b""
+    payload, status = await handler({"params": params, "body": body})
+    await _send_json(send, payload, status)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    print("=" * 60)
+    print("PAM-Talk 디지털 쿠폰 API 서버 (ASGI)")
+    print("=" * 60)
+    print("주소: http://localhost:5000")
+    print("문서: http://localhost:5000/health")
+    print("=" * 60)
+
+    uvicorn.run(app, host='0.0.0.0', port=5000)
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+핫패스 마이크로 벤치마크 (오프라인)
+보상 계산·발급 한도·순위·한도 불변식 검증 경로의 연산당 시간 측정
+
+측정 항목:
+- reward.calculate_reward              : 보상 1건 계산
+- reward.calculate_rewards_batch       : 일괄 계산 (행당 시간)
+- reserve.check_issuance_allowed[N]    : 발급 기록 N건 적재 후 한도 확인
+- reserve.record_issuance[N]           : 발급 기록 N건 적재 후 1건 추가 (저널 모드)
+- reserve.get_top_recipients[N]        : 상위 수혜자 조회
+- invariants.verify_limit_compliance[N]: 한도 불변식 검증 (메모리 원장 대역)
+
+네트워크·실제 설정 파일을 사용하지 않으며(임시 디렉토리 저널 모드),
+측정값은 반복 중 최솟값(연산당 초)이다. 기준선 JSON과 비교해
+threshold 비율을 넘게 느려진 항목이 있으면 종료 코드 1을 반환한다.
+
+사용법 (저장소 루트에서):
+    python -m benchmarks.hot_paths                     # 측정 후 기준선과 비교
+    python -m benchmarks.hot_paths --update-baseline   # 기준선 갱신
+    python -m benchmarks.hot_paths --sizes 1000,100000 --threshold 0.5
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+from algosdk.error import AlgodHTTPError
+
+from contracts.reserve_manager import ReserveManager
+from policies.reward_calculator import (
+    RewardCalculator,
+    IncomeLevel,
+    RegionType,
+    ActivityType
+)
+from verification.invariants import InvariantVerifier
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 미설치 시 목록 입력으로 측정
+    np = None
+
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+BENCH_PERIOD = "2025-Q1"
+BENCH_ASSET_ID = 1001
+USERS_PER_RECORD = 10      # 발급 기록 N건 → 사용자 N / 10명
+PRELOAD_CHUNK = 100_000    # 대량 적재 묶음 크기
+
+
+class LocalLedger:
+    """
+    algod 클라이언트 대역 (메모리 원장)
+
+    InvariantVerifier·ESGCouponASA가 쓰는 조회 메서드만 algod 응답과 같은
+    형태로 흉내 낸다.
+    """
+
+    def __init__(self, asset_id: int, total: int, holdings: Optional[Dict[str, int]] = None):
+        self.asset_id = asset_id
+        self.total = total
+        self.holdings = dict(holdings or {})
+
+    def asset_info(self, asset_id: int) -> Dict:
+        return {
+            "index": asset_id,
+            "params": {
+                "total": self.total,
+                "decimals": 0,
+                "unit-name": "ESG",
+                "metadata-hash": "bG9jYWwtbGVkZ2Vy"
+            }
+        }
+
+    def account_info(self, address: str) -> Dict:
+        return {
+            "address": address,
+            "amount": 0,
+            "assets": [
+                {"asset-id": self.asset_id, "amount": self.holdings[address], "is-frozen": False}
+            ] if address in self.holdings else []
+        }
+
+    def account_asset_info(self, address: str, asset_id: int) -> Dict:
+        if address not in self.holdings or asset_id != self.asset_id:
+            raise AlgodHTTPError("account asset information not found", code=404)
+        return {
+            "asset-holding": {
+                "asset-id": asset_id,
+                "amount": self.holdings[address],
+                "is-frozen": False
+            }
+        }
+
+
+def measure(
+    fn: Callable[[int], None],
+    number: int,
+    repeat: int = 5
+) -> float:
+    """
+    연산당 시간 (반복 중 최솟값, 초)
+
+    fn(i)를 i = 0..number-1 로 호출하는 구간을 repeat회 측정한다.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in range(number):
+            fn(i)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def bench_rewards(
+    calculator: RewardCalculator,
+    batch_rows: int = 100_000,
+    repeat: int = 5
+) -> Dict[str, float]:
+    """보상 계산 (단건·일괄)"""
+    rng = random.Random(7)
+    incomes = list(IncomeLevel)
+    regions = list(RegionType)
+    activities = list(ActivityType)
+    cases = [
+        (rng.randrange(100, 5000), rng.choice(incomes), rng.choice(regions), rng.choice(activities))
+        for _ in range(1024)
+    ]
+
+    results = {
+        "reward.calculate_reward": measure(
+            lambda i: calculator.calculate_reward(*cases[i & 1023]),
+            number=20_000, repeat=repeat
+        )
+    }
+
+    columns = [
+        [rng.randrange(100, 5000) for _ in range(batch_rows)],
+        [rng.randrange(len(incomes)) for _ in range(batch_rows)],
+        [rng.randrange(len(regions)) for _ in range(batch_rows)],
+        [rng.randrange(len(activities)) for _ in range(batch_rows)]
+    ]
+    if np is not None:
+        columns = [np.asarray(column, dtype=np.int64) for column in columns]
+    per_batch = measure(
+        lambda i: calculator.calculate_rewards_batch(*columns),
+        number=1, repeat=repeat
+    )
+    results["reward.calculate_rewards_batch"] = per_batch / batch_rows
+    return results
+
+
+def build_manager(workdir: str, size: int) -> ReserveManager:
+    """임시 디렉토리에 발급 기록 size건을 적재한 저널 모드 관리자"""
+    manager = ReserveManager(
+        config_file=os.path.join(workdir, "budget_config.json"),
+        journal_file=os.path.join(workdir, "budget_journal.jsonl")
+    )
+    n_users = max(size // USERS_PER_RECORD, 1)
+    manager.set_budget(BENCH_PERIOD, total_budget=10 ** 15, per_person_limit=10 ** 9)
+
+    rng = random.Random(size)
+    for start in range(0, size, PRELOAD_CHUNK):
+        rows = [
+            {
+                "user_id": f"user{rng.randrange(n_users):07d}",
+                "amount": rng.randrange(100, 5000),
+                "reason": "benchmark",
+                "tx_id": f"TX{i:08d}",
+                "region": "urban"
+            }
+            for i in range(start, min(start + PRELOAD_CHUNK, size))
+        ]
+        manager.record_issuances_bulk(rows, BENCH_PERIOD)
+    return manager
+
+
+def bench_reserve(size: int, repeat: int = 5) -> Dict[str, float]:
+    """발급 한도·기록·순위·한도 불변식 (발급 기록 size건 기준)"""
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir, open(os.devnull, "w") as devnull:
+        # 발급·검증 경로의 진행 출력은 측정에서 제외
+        with redirect_stdout(devnull):
+            manager = build_manager(workdir, size)
+            n_users = max(size // USERS_PER_RECORD, 1)
+            rng = random.Random(1)
+            users = [f"user{rng.randrange(n_users):07d}" for _ in range(1024)]
+
+            results[f"reserve.check_issuance_allowed[{size}]"] = measure(
+                lambda i: manager.check_issuance_allowed(users[i & 1023], 1000, BENCH_PERIOD),
+                number=5_000, repeat=repeat
+            )
+            results[f"reserve.record_issuance[{size}]"] = measure(
+                lambda i: manager.record_issuance(
+                    users[i & 1023], 100, "benchmark", f"TXB{i}", BENCH_PERIOD, "urban"
+                ),
+                number=500, repeat=repeat
+            )
+            results[f"reserve.get_top_recipients[{size}]"] = measure(
+                lambda i: manager.get_top_recipients(limit=10, period=BENCH_PERIOD),
+                number=200, repeat=repeat
+            )
+
+            ledger = LocalLedger(BENCH_ASSET_ID, total=10 ** 12)
+            verifier = InvariantVerifier(
+                ledger, BENCH_ASSET_ID,
+                config_file=os.path.join(workdir, "accounts_config.json"),
+                reserve_manager=manager
+            )
+            results[f"invariants.verify_limit_compliance[{size}]"] = measure(
+                lambda i: verifier.verify_limit_compliance(),
+                number=50, repeat=repeat
+            )
+            manager.close()
+    return results
+
+
+def run_suite(sizes: Sequence[int] = DEFAULT_SIZES, repeat: int = 5) -> Dict[str, float]:
+    """전체 측정 (항목명 → 연산당 초)"""
+    results = bench_rewards(RewardCalculator(), repeat=repeat)
+    for size in sizes:
+        results.update(bench_reserve(size, repeat=repeat))
+    return results
+
+
+def compare(
+    results: Dict[str, float],
+    baseline: Dict[str, float],
+    threshold: float = DEFAULT_THRESHOLD
+) -> List[Dict]:
+    """
+    기준선 대비 회귀 항목
+
+    current > baseline × (1 + threshold) 인 항목만 반환한다.
+    기준선에 없는 항목은 비교하지 않는다.
+    """
+    regressions = []
+    for name, current in sorted(results.items()):
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        ratio = current / reference
+        if ratio > 1 + threshold:
+            regressions.append({
+                "name": name,
+                "baseline": reference,
+                "current": current,
+                "ratio": ratio
+            })
+    return regressions
+
+
+def load_baseline(path: str) -> Optional[Dict]:
+    """기준선 파일 (없으면 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(path: str, results: Dict[str, float]) -> Dict:
+    """기준선 저장 (측정 환경 포함)"""
+    data = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": environment(),
+        "unit": "seconds_per_op",
+        "results": {name: results[name] for name in sorted(results)}
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return data
+
+
+def environment() -> Dict:
+    """측정 환경 요약"""
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "numpy": np.__version__ if np is not None else None
+    }
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:10.2f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:10.2f} ms"
+    return f"{seconds:10.2f} s "
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """측정 → 기준선 비교 (회귀 시 1 반환)"""
+    parser = argparse.ArgumentParser(description="핫패스 마이크로 벤치마크")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="발급 기록 적재 규모 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="기준선 JSON 경로")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="회귀 판정 비율 (0.25 = 25%% 이상 느려지면 실패)")
+    parser.add_argument("--update-baseline", action="store_true", help="측정값으로 기준선 갱신")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    results = run_suite(sizes, repeat=args.repeat)
+
+    baseline = load_baseline(args.baseline)
+    reference = baseline["results"] if baseline else {}
+    for name, seconds in sorted(results.items()):
+        line = f"{name:<48}{_format_seconds(seconds)}"
+        if name in reference:
+            line += f"   (기준 대비 {seconds / reference[name]:.2f}x)"
+        print(line)
+
+    if args.update_baseline:
+        save_baseline(args.baseline, results)
+        print(f"\n[OK] 기준선 저장: {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print(f"\n[WARN] 기준선 없음: {args.baseline} (--update-baseline으로 생성)")
+        return 0
+    if baseline.get("environment") != environment():
+        print(f"\n[WARN] 기준선 측정 환경이 다름: {baseline.get('environment')}")
+
+    regressions = compare(results, reference, args.threshold)
+    if regressions:
+        print(f"\n[FAIL] 성능 회귀 {len(regressions)}건 (허용 {args.threshold:.0%})")
+        for r in regressions:
+            print(f"  - {r['name']}: {_format_seconds(r['baseline']).strip()} → "
+                  f"{_format_seconds(r['current']).strip()} ({r['ratio']:.2f}x)")
+        return 1
+
+    print(f"\n[OK] 성능 회귀 없음 (허용 {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
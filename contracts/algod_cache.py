@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+algod 조회 캐시 (TTL + 요청 병합)
+PRD 8: 성능 및 제약사항 - 캠페인 시작 시 동일 자산·계정 반복 조회
+
+- 조회 종류별 TTL (자산 파라미터는 길게, 잔액은 짧게)
+- 같은 키를 동시에 조회하면 algod 호출은 한 번만 하고 결과를 공유
+- 항목 수 상한을 넘으면 가장 오래 쓰지 않은 항목부터 제거 (LRU)
+- 적중·미스·병합·제거 횟수 통계
+
+캐시하지 않는 메서드(트랜잭션 전송 등)는 원래 클라이언트로 그대로 위임한다.
+반환되는 dict는 호출자끼리 공유되므로 수정하지 않는다.
+
+비동기 클라이언트(contracts.async_algod)는 AsyncCachedAlgodClient로 감싸며,
+같은 TTLCache를 코루틴 단위 요청 병합(get_or_load_async)으로 사용한다.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+
+
+# 조회 종류별 기본 TTL (초)
+DEFAULT_TTLS = {
+    "asset_info": 300.0,          # 자산 파라미터 (거의 변하지 않음)
+    "account_info": 2.0,          # 계정 전체 정보 (잔액 포함)
+    "account_asset_info": 2.0,    # 계정의 단일 자산 보유량
+    "suggested_params": 2.0       # 트랜잭션 파라미터 (라운드마다 갱신)
+}
+
+
+class _Flight:
+    """진행 중인 조회 (같은 키의 동시 요청이 결과를 기다림)"""
+    __slots__ = ("done", "value", "error", "stale")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+        self.stale = False  # 조회 중 무효화됨 (결과를 캐시에 넣지 않음)
+
+
+class TTLCache:
+    """TTL·LRU 캐시 (요청 병합 포함)"""
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_entries: 최대 항목 수 (LRU 제거)
+            clock: 단조 시계 (테스트용)
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries는 1 이상이어야 합니다.")
+
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (value, expires_at)
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._tasks: Dict[Hashable, "asyncio.Future"] = {}   # 비동기 조회 진행 중
+        self._stale_tasks: Set["asyncio.Future"] = set()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+        self._errors = 0
+
+    def get_or_load(self, key: Hashable, ttl: float, loader: Callable[[], Any]) -> Any:
+        """
+        캐시 조회, 없거나 만료되면 loader 호출
+
+        같은 키의 loader가 실행 중이면 새로 호출하지 않고 그 결과를 기다린다.
+        loader 예외는 캐시하지 않고 기다리던 호출자 모두에게 전달한다.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._clock() < entry[1]:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry[0]
+                del self._entries[key]
+
+            flight = self._flights.get(key)
+            if flight is not None:
+                self._coalesced += 1
+                leader = False
+            else:
+                flight = self._flights[key] = _Flight()
+                self._misses += 1
+                leader = True
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = loader()
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                self._errors += 1
+                del self._flights[key]
+            flight.done.set()
+            raise
+
+        with self._lock:
+            if ttl > 0 and not flight.stale:
+                self._store(key, flight.value, ttl)
+            del self._flights[key]
+        flight.done.set()
+        return flight.value
+
+    async def get_or_load_async(
+        self,
+        key: Hashable,
+        ttl: float,
+        loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        get_or_load의 코루틴 버전 (이벤트 루프 안에서 사용)
+
+        loader 코루틴은 별도 태스크로 실행되므로, 기다리던 호출자 하나가
+        취소(시간 초과)되어도 같은 키를 기다리는 나머지 호출자에게는 영향이 없다.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._clock() < entry[1]:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry[0]
+                del self._entries[key]
+
+            task = self._tasks.get(key)
+            if task is not None:
+                self._coalesced += 1
+            else:
+                task = self._tasks[key] = asyncio.ensure_future(loader())
+                self._misses += 1
+                task.add_done_callback(lambda t: self._finish_task(key, ttl, t))
+
+        return await asyncio.shield(task)
+
+    def _finish_task(self, key: Hashable, ttl: float, task: "asyncio.Future"):
+        """비동기 조회 완료 처리 (성공 시에만 캐시)"""
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+            stale = task in self._stale_tasks
+            self._stale_tasks.discard(task)
+            if task.cancelled():
+                return
+            if task.exception() is not None:
+                self._errors += 1
+                return
+            if ttl > 0 and not stale:
+                self._store(key, task.result(), ttl)
+
+    def _store(self, key: Hashable, value: Any, ttl: float):
+        """항목 저장 및 LRU 제거 (_lock 보유 상태)"""
+        self._entries[key] = (value, self._clock() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None):
+        """항목 제거 (predicate=None이면 전체, 진행 중인 조회 결과도 캐시하지 않음)"""
+        with self._lock:
+            for key, flight in self._flights.items():
+                if predicate is None or predicate(key):
+                    flight.stale = True
+            for key, task in self._tasks.items():
+                if predicate is None or predicate(key):
+                    self._stale_tasks.add(task)
+            if predicate is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if predicate(k)]:
+                del self._entries[key]
+
+    def stats(self) -> Dict:
+        """캐시 통계"""
+        with self._lock:
+            lookups = self._hits + self._misses + self._coalesced
+            return {
+                "size": len(self._entries),
+                "capacity": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "coalesced": self._coalesced,
+                "evictions": self._evictions,
+                "errors": self._errors,
+                "hit_rate": (self._hits + self._coalesced) / lookups if lookups else 0.0
+            }
+
+
+class CachedAlgodClient:
+    """algod 클라이언트 캐시 프록시"""
+
+    def __init__(
+        self,
+        client,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            client: algod.AlgodClient (또는 같은 조회 메서드를 가진 객체)
+            ttls: 조회 종류별 TTL 덮어쓰기 (DEFAULT_TTLS 키, 0이면 캐시 안 함)
+            max_entries: 최대 캐시 항목 수
+            clock: 단조 시계 (테스트용)
+        """
+        unknown = set(ttls or ()) - set(DEFAULT_TTLS)
+        if unknown:
+            raise ValueError(f"알 수 없는 TTL 항목: {', '.join(sorted(unknown))}")
+
+        self.client = client
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.cache = TTLCache(max_entries=max_entries, clock=clock)
+
+    def asset_info(self, asset_id: int, **kwargs) -> Dict:
+        """자산 파라미터 (긴 TTL)"""
+        return self._cached(("asset_info", asset_id), self.client.asset_info, asset_id, **kwargs)
+
+    def account_info(self, address: str, **kwargs) -> Dict:
+        """계정 전체 정보 (짧은 TTL)"""
+        return self._cached(("account_info", address), self.client.account_info, address, **kwargs)
+
+    def account_asset_info(self, address: str, asset_id: int, **kwargs) -> Dict:
+        """계정의 단일 자산 보유량 (짧은 TTL)"""
+        return self._cached(
+            ("account_asset_info", address, asset_id),
+            self.client.account_asset_info, address, asset_id, **kwargs
+        )
+
+    def suggested_params(self, **kwargs):
+        """트랜잭션 파라미터 (짧은 TTL)"""
+        return self._cached(("suggested_params",), self.client.suggested_params, **kwargs)
+
+    def _cached(self, key: tuple, method: Callable, *args, **kwargs) -> Any:
+        if kwargs:
+            # 응답 형식 옵션 등은 키에 포함
+            key = key + tuple(sorted(kwargs.items()))
+        return self.cache.get_or_load(key, self.ttls[key[0]], lambda: method(*args, **kwargs))
+
+    def invalidate_account(self, address: str):
+        """계정 조회 결과 제거 (전송 후 잔액 갱신용)"""
+        self.cache.invalidate(
+            lambda key: key[0] in ("account_info", "account_asset_info") and key[1] == address
+        )
+
+    def invalidate_asset(self, asset_id: int):
+        """자산 파라미터 제거 (자산 설정 변경 후)"""
+        self.cache.invalidate(lambda key: key[0] == "asset_info" and key[1] == asset_id)
+
+    def cache_stats(self) -> Dict:
+        """캐시 통계 (TTL 설정 포함)"""
+        return {**self.cache.stats(), "ttls": dict(self.ttls)}
+
+    def __getattr__(self, name: str):
+        # 캐시하지 않는 메서드 (send_transaction, status 등)는 그대로 위임
+        return getattr(self.client, name)
+
+
+class AsyncCachedAlgodClient:
+    """비동기 algod 클라이언트 캐시 프록시 (CachedAlgodClient와 같은 키·TTL)"""
+
+    def __init__(
+        self,
+        client,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            client: contracts.async_algod.AsyncAlgodClient (또는 같은 코루틴 메서드를 가진 객체)
+            ttls: 조회 종류별 TTL 덮어쓰기 (DEFAULT_TTLS 키, 0이면 캐시 안 함)
+            max_entries: 최대 캐시 항목 수
+            clock: 단조 시계 (테스트용)
+        """
+        unknown = set(ttls or ()) - set(DEFAULT_TTLS)
+        if unknown:
+            raise ValueError(f"알 수 없는 TTL 항목: {', '.join(sorted(unknown))}")
+
+        self.client = client
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.cache = TTLCache(max_entries=max_entries, clock=clock)
+
+    async def asset_info(self, asset_id: int) -> Dict:
+        """자산 파라미터 (긴 TTL)"""
+        return await self._cached(("asset_info", asset_id), self.client.asset_info, asset_id)
+
+    async def account_info(self, address: str) -> Dict:
+        """계정 전체 정보 (짧은 TTL)"""
+        return await self._cached(("account_info", address), self.client.account_info, address)
+
+    async def account_asset_info(self, address: str, asset_id: int) -> Dict:
+        """계정의 단일 자산 보유량 (짧은 TTL)"""
+        return await self._cached(
+            ("account_asset_info", address, asset_id),
+            self.client.account_asset_info, address, asset_id
+        )
+
+    async def suggested_params(self):
+        """트랜잭션 파라미터 (짧은 TTL)"""
+        return await self._cached(("suggested_params",), self.client.suggested_params)
+
+    async def _cached(self, key: tuple, method: Callable, *args) -> Any:
+        return await self.cache.get_or_load_async(key, self.ttls[key[0]], lambda: method(*args))
+
+    def invalidate_account(self, address: str):
+        """계정 조회 결과 제거 (전송 후 잔액 갱신용)"""
+        self.cache.invalidate(
+            lambda key: key[0] in ("account_info", "account_asset_info") and key[1] == address
+        )
+
+    def invalidate_asset(self, asset_id: int):
+        """자산 파라미터 제거 (자산 설정 변경 후)"""
+        self.cache.invalidate(lambda key: key[0] == "asset_info" and key[1] == asset_id)
+
+    def cache_stats(self) -> Dict:
+        """캐시 통계 (TTL 설정 포함)"""
+        return {**self.cache.stats(), "ttls": dict(self.ttls)}
+
+    def __getattr__(self, name: str):
+        # 캐시하지 않는 코루틴 (send_transaction, wait_for_confirmation 등)은 그대로 위임
+        return getattr(self.client, name)
+
+
+def main():
+    """요청 병합 예시 (느린 가짜 algod에 동시 조회 100건)"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    class SlowAlgod:
+        calls = 0
+
+        def asset_info(self, asset_id):
+            SlowAlgod.calls += 1
+            time.sleep(0.2)
+            return {"index": asset_id, "params": {"total": 1_000_000, "decimals": 0}}
+
+    client = CachedAlgodClient(SlowAlgod())
+    with ThreadPoolExecutor(max_workers=100) as pool:
+        list(pool.map(lambda _: client.asset_info(1001), range(100)))
+    client.asset_info(1001)
+
+    print(f"algod 호출: {SlowAlgod.calls}회")
+    print(client.cache_stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기 algod 클라이언트 (HTTP keep-alive 연결 풀)
+PRD 8: 성능 및 제약사항 - 대량 잔액 조회·발급 확인
+
+algosdk의 AlgodClient는 요청마다 새 연결을 여는 동기 클라이언트라서
+조회 하나가 스레드 하나를 붙잡는다. 이 클라이언트는 httpx.AsyncClient의
+연결 풀을 공유하므로 한 프로세스에서 수천 건의 조회·확인 대기를
+코루틴으로 동시에 진행할 수 있다.
+
+- 연결 수 상한(max_connections)을 넘는 요청은 풀에서 순서대로 대기
+- 응답 형식·오류는 AlgodClient와 동일 (JSON dict, AlgodHTTPError)
+- 트랜잭션 서명·생성은 algosdk를 그대로 사용하고 전송·확인만 비동기로 수행
+
+사용 예:
+    async with AsyncAlgodClient("", "https://testnet-api.algonode.cloud") as client:
+        info = await client.account_asset_info(address, asset_id)
+"""
+
+import base64
+from typing import Dict, Iterable, Optional
+
+import httpx
+from algosdk import encoding, transaction
+from algosdk.error import AlgodHTTPError, ConfirmationTimeoutError, TransactionRejectedError
+
+
+# 연결 풀 기본값
+DEFAULT_MAX_CONNECTIONS = 100          # algod 노드당 동시 연결 상한
+DEFAULT_MAX_KEEPALIVE = 100            # 유휴 상태로 유지할 연결 수
+DEFAULT_KEEPALIVE_EXPIRY = 30.0        # 유휴 연결 유지 시간 (초)
+DEFAULT_TIMEOUT = 10.0                 # 요청당 연결·읽기 제한 (초)
+
+API_PREFIX = "/v2"
+
+
+class AsyncAlgodClient:
+    """algod REST API 비동기 클라이언트"""
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: Optional[Dict[str, str]] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+        timeout: float = DEFAULT_TIMEOUT,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Args:
+            algod_token: algod API 토큰
+            algod_address: algod 노드 주소
+            headers: 추가 요청 헤더
+            max_connections: 동시 연결 상한 (초과 요청은 풀에서 대기)
+            max_keepalive: 재사용을 위해 유지할 유휴 연결 수
+            timeout: 요청당 연결·읽기 제한 (초, 풀 대기 시간은 제한하지 않음)
+            transport: httpx 전송 계층 (테스트용)
+        """
+        request_headers = {"User-Agent": "py-algorand-sdk"}
+        if algod_token:
+            request_headers["X-Algo-API-Token"] = algod_token
+        request_headers.update(headers or {})
+
+        self.algod_address = algod_address.rstrip("/")
+        self._http = httpx.AsyncClient(
+            base_url=self.algod_address + API_PREFIX,
+            headers=request_headers,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+                keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY
+            ),
+            # 대량 조회 시 풀 대기는 호출자의 마감 시간으로 제한
+            timeout=httpx.Timeout(timeout, pool=None),
+            transport=transport
+        )
+
+    async def __aenter__(self) -> "AsyncAlgodClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """연결 풀 종료"""
+        await self._http.aclose()
+
+    async def _request(self, method: str, path: str, **kwargs) -> Dict:
+        """요청 실행 (4xx/5xx는 AlgodHTTPError, 메시지는 algod 응답의 message)"""
+        response = await self._http.request(method, path, **kwargs)
+        if response.status_code >= 400:
+            try:
+                message = response.json()["message"]
+            except (ValueError, KeyError, TypeError):
+                message = response.text
+            raise AlgodHTTPError(message, response.status_code)
+        if not response.content:
+            # 일부 algod 응답은 200과 함께 빈 본문을 반환
+            return {}
+        return response.json()
+
+    async def status(self) -> Dict:
+        """노드 상태 (last-round 등)"""
+        return await self._request("GET", "/status")
+
+    async def status_after_block(self, block_num: int) -> Dict:
+        """block_num 다음 라운드가 확정될 때까지 대기 후 노드 상태"""
+        return await self._request("GET", f"/status/wait-for-block-after/{block_num}")
+
+    async def asset_info(self, asset_id: int) -> Dict:
+        """자산 파라미터"""
+        return await self._request("GET", f"/assets/{asset_id}")
+
+    async def account_info(self, address: str) -> Dict:
+        """계정 전체 정보"""
+        return await self._request("GET", f"/accounts/{address}")
+
+    async def account_asset_info(self, address: str, asset_id: int) -> Dict:
+        """계정의 단일 자산 보유량 (opt-in 전이면 404)"""
+        return await self._request("GET", f"/accounts/{address}/assets/{asset_id}")
+
+    async def pending_transaction_info(self, txid: str) -> Dict:
+        """대기·확정 트랜잭션 정보"""
+        return await self._request("GET", f"/transactions/pending/{txid}")
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        """트랜잭션 파라미터 (AlgodClient.suggested_params와 동일 구성)"""
+        res = await self._request("GET", "/transactions/params")
+        return transaction.SuggestedParams(
+            res["fee"],
+            res["last-round"],
+            res["last-round"] + 1000,
+            res["genesis-hash"],
+            res["genesis-id"],
+            False,
+            res["consensus-version"],
+            res["min-fee"]
+        )
+
+    async def send_raw_transaction(self, txn: bytes) -> str:
+        """직렬화된(msgpack) 서명 트랜잭션 전송, 트랜잭션 ID 반환"""
+        res = await self._request(
+            "POST", "/transactions",
+            content=txn,
+            headers={"Content-Type": "application/x-binary"}
+        )
+        return res["txId"]
+
+    async def send_transaction(self, txn) -> str:
+        """서명된 트랜잭션 전송"""
+        return await self.send_transactions([txn])
+
+    async def send_transactions(self, txns: Iterable) -> str:
+        """서명된 트랜잭션 목록(원자적 그룹) 전송, 첫 트랜잭션 ID 반환"""
+        serialized = []
+        for txn in txns:
+            assert not isinstance(txn, transaction.Transaction), \
+                f"서명되지 않은 트랜잭션은 전송할 수 없습니다: {txn}"
+            serialized.append(base64.b64decode(encoding.msgpack_encode(txn)))
+        return await self.send_raw_transaction(b"".join(serialized))
+
+    async def wait_for_confirmation(self, txid: str, wait_rounds: int = 0) -> Dict:
+        """
+        트랜잭션 확정 대기 (algosdk.transaction.wait_for_confirmation의 비동기 버전)
+
+        대기 중에는 이벤트 루프를 점유하지 않으므로 많은 트랜잭션의 확정을
+        동시에 기다릴 수 있다.
+
+        Raises:
+            ConfirmationTimeoutError: wait_rounds 라운드 안에 확정되지 않음
+            TransactionRejectedError: 트랜잭션 풀에서 거부됨
+        """
+        last_round = (await self.status())["last-round"]
+        current_round = last_round + 1
+        wait_rounds = wait_rounds or 1000
+
+        while True:
+            if current_round > last_round + wait_rounds:
+                raise ConfirmationTimeoutError(f"Wait for transaction id {txid} timed out")
+
+            try:
+                tx_info = await self.pending_transaction_info(txid)
+                if tx_info.get("pool-error"):
+                    raise TransactionRejectedError("Transaction rejected: " + tx_info["pool-error"])
+                if tx_info.get("confirmed-round"):
+                    return tx_info
+            except AlgodHTTPError:
+                # 로드밸런서 뒤의 다른 노드로 요청이 가면 404일 수 있음 (무시)
+                pass
+
+            await self.status_after_block(current_round)
+            current_round += 1
+
+
+async def _demo():
+    """동시 조회 예시 (테스트넷 노드 상태 100회)"""
+    import asyncio
+    import time
+
+    async with AsyncAlgodClient("", "https://testnet-api.algonode.cloud", max_connections=10) as client:
+        start = time.perf_counter()
+        results = await asyncio.gather(*(client.status() for _ in range(100)), return_exceptions=True)
+        elapsed = time.perf_counter() - start
+
+    failed = sum(1 for r in results if isinstance(r, Exception))
+    print(f"100건 조회: {elapsed:.2f}초 (연결 10개 재사용, 실패 {failed}건)")
+
+
+def main():
+    import asyncio
+    asyncio.run(_demo())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+쿠폰 금액 단위 (고정소수점)
+PRD 3.1: ASA 파라미터 - decimals
+
+ASA 금액은 체인에서 항상 기본 단위 정수(1 / 10^decimals 쿠폰)로 다뤄진다.
+보상 계산·예산·API도 같은 기본 단위 정수를 쓰고, 사람이 읽는 쿠폰 단위
+("12.5")와의 변환은 입출력 경계에서 CouponUnits로만 수행한다.
+
+예 (decimals=6, 마이크로 쿠폰):
+    units.to_base("12.5")   → 12_500_000
+    units.format(12_500_000) → "12.500000"
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 미설치 시 목록 변환
+    np = None
+
+
+# ASA decimals 허용 범위 (Algorand 규격)
+MAX_DECIMALS = 19
+_INT64_MAX = 2 ** 63 - 1
+_AMOUNT_PATTERN = re.compile(r"([+-]?)(\d*)(?:\.(\d*))?")
+
+
+@dataclass(frozen=True)
+class CouponUnits:
+    """쿠폰 단위 ↔ 기본 단위 정수 변환 (ASA decimals)"""
+    decimals: int = 0
+
+    def __post_init__(self):
+        if (not isinstance(self.decimals, int) or isinstance(self.decimals, bool) or
+                not 0 <= self.decimals <= MAX_DECIMALS):
+            raise ValueError(f"decimals는 0~{MAX_DECIMALS} 정수여야 합니다: {self.decimals!r}")
+
+    @property
+    def scale(self) -> int:
+        """1쿠폰의 기본 단위 수"""
+        return 10 ** self.decimals
+
+    def to_base(self, amount) -> int:
+        """
+        쿠폰 단위 금액 → 기본 단위 정수 (정확 변환)
+
+        정수·10진 문자열("12.5")·float를 받는다. float는 가장 가까운
+        기본 단위 값으로 되돌아오는 경우만 허용한다 (0.1 → 100000).
+
+        Raises:
+            ValueError: 형식 오류 또는 decimals보다 정밀한 금액
+        """
+        if isinstance(amount, bool):
+            raise ValueError(f"금액 형식 오류: {amount!r}")
+        if isinstance(amount, int):
+            return amount * self.scale
+        if np is not None and isinstance(amount, np.integer):
+            return int(amount) * self.scale
+        if isinstance(amount, str):
+            return self._parse(amount)
+        if isinstance(amount, float) or (np is not None and isinstance(amount, np.floating)):
+            amount = float(amount)
+            if amount != amount or amount in (float("inf"), float("-inf")):
+                raise ValueError(f"금액 형식 오류: {amount!r}")
+            base = round(amount * self.scale)
+            if base / self.scale != amount:
+                raise ValueError(f"소수 {self.decimals}자리보다 정밀한 금액: {amount!r}")
+            return base
+        raise ValueError(f"금액 형식 오류: {amount!r}")
+
+    def _parse(self, text: str) -> int:
+        """10진 문자열 → 기본 단위 정수"""
+        match = _AMOUNT_PATTERN.fullmatch(text.strip())
+        if match is None or not (match.group(2) or match.group(3)):
+            raise ValueError(f"금액 형식 오류: {text!r}")
+        sign, whole, fraction = match.group(1), match.group(2), match.group(3) or ""
+
+        fraction = fraction.rstrip("0")
+        if len(fraction) > self.decimals:
+            raise ValueError(f"소수 {self.decimals}자리보다 정밀한 금액: {text!r}")
+        base = int(whole or "0") * self.scale + int(fraction.ljust(self.decimals, "0") or "0")
+        return -base if sign == "-" else base
+
+    def to_base_array(self, amounts: Sequence) -> Sequence[int]:
+        """
+        쿠폰 단위 금액 배열 → 기본 단위 정수 배열
+
+        NumPy 정수·실수 배열은 열 전체를 한 번에, 문자열 배열은 고유값만
+        변환한다. 결과는 NumPy 설치 시 int64 ndarray, 아니면 list.
+
+        Raises:
+            ValueError: 형식 오류, 정밀도 초과 또는 int64 범위 초과
+        """
+        if np is None:
+            return [self.to_base(amount) for amount in amounts]
+
+        values = np.asarray(amounts)
+        if values.dtype.kind in 'iu':
+            if values.size and max(-int(values.min()), int(values.max())) > _INT64_MAX // self.scale:
+                raise ValueError("기본 단위 금액이 int64 범위를 넘습니다.")
+            return values.astype(np.int64) * self.scale
+        if values.dtype.kind == 'f':
+            if values.size and not np.all(np.isfinite(values)):
+                raise ValueError("금액 형식 오류: 유한한 값이 아닙니다.")
+            if values.size and float(np.abs(values).max()) * self.scale >= 2 ** 63:
+                raise ValueError("기본 단위 금액이 int64 범위를 넘습니다.")
+            base = np.rint(values * self.scale)
+            mismatch = np.nonzero(base / self.scale != values)[0]
+            if len(mismatch):
+                raise ValueError(
+                    f"소수 {self.decimals}자리보다 정밀한 금액: {values[mismatch[0]]!r}"
+                )
+            return base.astype(np.int64)
+        if values.dtype.kind == 'U':
+            # 고유값만 변환 후 역인덱스로 펼침
+            uniques, inverse = np.unique(values, return_inverse=True)
+            mapped = np.array([self._parse(u) for u in uniques.tolist()], dtype=np.int64)
+            return mapped[inverse]
+        return np.array([self.to_base(amount) for amount in values.tolist()], dtype=np.int64)
+
+    def format(self, base_amount: int) -> str:
+        """기본 단위 정수 → 쿠폰 단위 문자열 (소수 decimals자리 고정)"""
+        base_amount = int(base_amount)
+        if self.decimals == 0:
+            return str(base_amount)
+        sign = "-" if base_amount < 0 else ""
+        whole, fraction = divmod(abs(base_amount), self.scale)
+        return f"{sign}{whole}.{fraction:0{self.decimals}d}"
+
+
+def main():
+    """단위 변환 예시"""
+    units = CouponUnits(decimals=6)
+    for amount in (12, "12.5", 0.1, "0.000001"):
+        base = units.to_base(amount)
+        print(f"{amount!r:>12} → {base:>12,} 기본 단위 → {units.format(base)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,12 +9,19 @@ PRD 3.1: ASA 파라미터 설계 구현
 - defaultFrozen=True (초기 동결)
 - metadataHash 포함
 - Clawback 지원
+
+금액 인자(total_supply, amount)와 조회 잔액은 모두 기본 단위 정수
+(1 / 10^decimals 쿠폰, contracts.coupon_units)
 """
 
 import json
 import hashlib
-from typing import Dict, Optional
-from algosdk import account
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from typing import Dict, List, Optional, Sequence, Tuple
+from algosdk import account, encoding
+from algosdk.error import AlgodHTTPError
 from algosdk.v2client import algod
 from algosdk.transaction import (
     AssetConfigTxn,
@@ -23,6 +30,18 @@ from algosdk.transaction import (
     wait_for_confirmation
 )
 
+from contracts.algod_cache import CachedAlgodClient
+from contracts.coupon_units import CouponUnits
+
+
+# 잔액 일괄 조회 동시 요청 수 (인스턴스 전체 공유)
+BALANCE_LOOKUP_WORKERS = 16
+
+# 잔액 일괄 조회 주소별 실패 사유 (동기·비동기 API 공통)
+INVALID_ADDRESS_ERROR = "잘못된 Algorand 주소"
+LOOKUP_TIMEOUT_ERROR = "조회 시간 초과"
+NOT_OPTED_IN_ERROR = "계정이 ASA를 opt-in하지 않았습니다."
+
 
 class ESGCouponASA:
     """ESG 디지털 쿠폰 ASA 관리"""
@@ -30,10 +49,27 @@ class ESGCouponASA:
     def __init__(
         self,
         algod_address: str = "https://testnet-api.algonode.cloud",
-        algod_token: str = ""
+        algod_token: str = "",
+        algod_client=None,
+        lookup_workers: int = BALANCE_LOOKUP_WORKERS
     ):
-        self.algod_client = algod.AlgodClient(algod_token, algod_address)
+        """
+        Args:
+            algod_address: algod 노드 주소
+            algod_token: algod API 토큰
+            algod_client: 공유할 algod 클라이언트 (None이면 조회 캐시를 씌워 생성)
+            lookup_workers: 잔액 일괄 조회·일괄 발급 시 algod 동시 요청 상한
+        """
+        self.algod_client = algod_client or CachedAlgodClient(
+            algod.AlgodClient(algod_token, algod_address)
+        )
         self.asset_id = None
+        # 잔액 일괄 조회·일괄 발급용 스레드 풀 (요청마다 만들지 않고 공유해 algod 부하 상한 유지)
+        self._lookup_pool = ThreadPoolExecutor(
+            max_workers=lookup_workers, thread_name_prefix="algod-lookup"
+        )
+        # 금액 단위 (create_coupon_asa·load_units에서 ASA decimals로 설정)
+        self.units = CouponUnits()
 
     def create_coupon_asa(
         self,
@@ -58,13 +94,17 @@ class ESGCouponASA:
             reserve_address: Reserve 주소 (단일)
             freeze_address: Freeze 주소 (2-of-3 multisig)
             clawback_address: Clawback 주소 (2-of-2 multisig)
-            total_supply: 총 발행량 (예: 연간 예산 / 단가)
+            total_supply: 총 발행량 (기본 단위, 예: units.to_base(연간 예산 / 단가))
             policy_document_hash: 정책 문서 SHA-256 해시
-            decimals: 소수점 자리 (0=정수, 2=0.01단위)
+            decimals: 소수점 자리 (0=정수, 2=0.01단위, 6=마이크로 쿠폰)
 
         Returns:
             Dict: 생성 결과
+
+        Raises:
+            ValueError: decimals 범위 오류 (0~19)
         """
+        units = CouponUnits(decimals)
         print("🪙 ESG 디지털 쿠폰 ASA 생성 중...")
 
         # 트랜잭션 파라미터
@@ -100,6 +140,7 @@ class ESGCouponASA:
 
             # Asset ID 추출
             self.asset_id = confirmed_txn["asset-index"]
+            self.units = units
 
             print(f"✅ ASA 생성 완료!")
             print(f"   Asset ID: {self.asset_id}")
@@ -116,7 +157,8 @@ class ESGCouponASA:
                 "manager": manager_address,
                 "reserve": reserve_address,
                 "freeze": freeze_address,
-                "clawback": clawback_address
+                "clawback": clawback_address,
+                "decimals": decimals
             }
 
         except Exception as e:
@@ -151,6 +193,7 @@ class ESGCouponASA:
         try:
             tx_id = self.algod_client.send_transaction(signed_txn)
             wait_for_confirmation(self.algod_client, tx_id, 4)
+            self._invalidate_accounts(user_address)
 
             print(f"✅ Opt-in 완료: {user_address[:10]}... → Asset {asset_id}")
 
@@ -193,6 +236,7 @@ class ESGCouponASA:
         try:
             tx_id = self.algod_client.send_transaction(signed_txn)
             wait_for_confirmation(self.algod_client, tx_id, 4)
+            self._invalidate_accounts(target_address)
 
             print(f"✅ 동결 해제: {target_address[:10]}... → Asset {asset_id}")
 
@@ -235,6 +279,7 @@ class ESGCouponASA:
         try:
             tx_id = self.algod_client.send_transaction(signed_txn)
             wait_for_confirmation(self.algod_client, tx_id, 4)
+            self._invalidate_accounts(target_address)
 
             print(f"⚠️  계정 동결: {target_address[:10]}... → Asset {asset_id}")
 
@@ -289,6 +334,7 @@ class ESGCouponASA:
         try:
             tx_id = self.algod_client.send_transaction(signed_txn)
             wait_for_confirmation(self.algod_client, tx_id, 4)
+            self._invalidate_accounts(target_address, recovery_address)
 
             print(f"⚠️  자산 회수 완료!")
             print(f"   대상: {target_address[:10]}...")
@@ -336,6 +382,7 @@ class ESGCouponASA:
         try:
             tx_id = self.algod_client.send_transaction(signed_txn)
             wait_for_confirmation(self.algod_client, tx_id, 4)
+            self._invalidate_accounts(reserve_address, recipient_address)
 
             print(f"✅ 쿠폰 발급: {amount} → {recipient_address[:10]}...")
 
@@ -352,6 +399,91 @@ class ESGCouponASA:
                 "error": str(e)
             }
 
+    def transfer_from_reserve_batch(
+        self,
+        reserve_address: str,
+        reserve_private_key: str,
+        transfers: List[Tuple[str, int]],
+        asset_id: int
+    ) -> List[Dict]:
+        """
+        Reserve에서 쿠폰 일괄 발급
+        PRD 2.1: S0→S1→S2 단계 (캠페인 대량 지급)
+
+        suggested_params는 한 번만 조회하고, 건별로 서명한 트랜잭션을 그룹으로
+        묶지 않고 공유 스레드 풀로 이어서 전송한 뒤(응답을 기다리지 않고 다음
+        전송), 확인은 전송이 끝난 뒤 한꺼번에 기다린다. 그룹이 아니므로 한
+        건의 실패(opt-in 전 주소 등)가 다른 수령자의 전송을 막지 않는다.
+
+        Args:
+            transfers: [(수령 주소, 수량), ...]
+
+        Returns:
+            List[Dict]: 전송 건별 결과 (transfers 순서)
+        """
+        params = self.algod_client.suggested_params()
+        # 같은 수령자·수량이 반복되어도 트랜잭션 ID가 겹치지 않도록 건별 메모
+        batch_id = uuid.uuid4().hex[:12]
+        results: List[Dict] = []
+        sends = {}
+
+        for index, (recipient, amount) in enumerate(transfers):
+            results.append({
+                "success": False,
+                "tx_id": None,
+                "recipient": recipient,
+                "amount": amount
+            })
+            try:
+                txn = AssetTransferTxn(
+                    sender=reserve_address,
+                    sp=params,
+                    receiver=recipient,
+                    amt=amount,
+                    index=asset_id,
+                    note=f"{batch_id}:{index}".encode()
+                )
+                signed_txn = txn.sign(reserve_private_key)
+            except Exception as e:
+                results[index]["error"] = str(e)
+                continue
+            sends[self._lookup_pool.submit(self.algod_client.send_transaction, signed_txn)] = index
+
+        confirms = {}
+        for future in as_completed(sends):
+            index = sends[future]
+            try:
+                results[index]["tx_id"] = future.result()
+            except Exception as e:
+                results[index]["error"] = str(e)
+                continue
+            confirms[self._lookup_pool.submit(
+                wait_for_confirmation, self.algod_client, results[index]["tx_id"], 4
+            )] = index
+
+        for future in as_completed(confirms):
+            index = confirms[future]
+            try:
+                future.result()
+                results[index]["success"] = True
+            except Exception as e:
+                results[index]["error"] = str(e)
+
+        self._invalidate_accounts(reserve_address, *(r["recipient"] for r in results))
+
+        confirmed = sum(1 for r in results if r["success"])
+        print(f"✅ 쿠폰 일괄 발급: {confirmed}/{len(transfers)}건")
+
+        return results
+
+    def _invalidate_accounts(self, *addresses: str):
+        """확정된 트랜잭션 관련 계정의 캐시된 잔액 제거"""
+        invalidate = getattr(self.algod_client, "invalidate_account", None)
+        if invalidate is None:
+            return
+        for address in set(addresses):
+            invalidate(address)
+
     def get_asset_info(self, asset_id: int) -> Dict:
         """ASA 정보 조회"""
         try:
@@ -360,26 +492,92 @@ class ESGCouponASA:
         except Exception as e:
             return {"error": str(e)}
 
+    def load_units(self, asset_id: int) -> CouponUnits:
+        """
+        기존 ASA의 금액 단위 로드 (asset params의 decimals)
+
+        Raises:
+            Exception: algod 조회 실패
+        """
+        asset_info = self.algod_client.asset_info(asset_id)
+        self.units = CouponUnits(asset_info["params"].get("decimals", 0))
+        return self.units
+
     def get_account_asset_balance(
         self,
         address: str,
         asset_id: int
     ) -> Optional[int]:
-        """계정의 ASA 잔액 조회"""
+        """계정의 ASA 잔액 조회 (opt-in 전이거나 조회 실패 시 None)"""
         try:
-            account_info = self.algod_client.account_info(address)
-            assets = account_info.get("assets", [])
-
-            for asset in assets:
-                if asset["asset-id"] == asset_id:
-                    return asset["amount"]
-
-            return None
+            return self._asset_holding(address, asset_id)
 
         except Exception as e:
             print(f"잔액 조회 실패: {e}")
             return None
 
+    def get_account_asset_balances(
+        self,
+        addresses: Sequence[str],
+        asset_id: int,
+        timeout: float = 5.0
+    ) -> List[Dict]:
+        """
+        여러 계정의 ASA 잔액 일괄 조회
+
+        중복 주소는 한 번만 조회하고, 공유 스레드 풀로 동시에 조회한다.
+        timeout(초) 안에 끝나지 않은 주소는 실패로 표시하고 나머지 결과를 반환한다.
+
+        Returns:
+            List[Dict]: 주소별 결과 (addresses 순서)
+                        {"address", "success", "balance"} 또는 {"address", "success", "error"}
+        """
+        deadline = time.monotonic() + timeout
+        outcomes: Dict[str, Dict] = {}
+        futures = {}
+        for address in dict.fromkeys(addresses):
+            if not encoding.is_valid_address(address):
+                outcomes[address] = {"success": False, "error": INVALID_ADDRESS_ERROR}
+            else:
+                futures[self._lookup_pool.submit(self._asset_holding, address, asset_id)] = address
+
+        done, pending = wait(futures, timeout=max(deadline - time.monotonic(), 0))
+        for future in pending:
+            future.cancel()
+            outcomes[futures[future]] = {"success": False, "error": LOOKUP_TIMEOUT_ERROR}
+        for future in done:
+            address = futures[future]
+            try:
+                balance = future.result()
+            except Exception as e:
+                outcomes[address] = {"success": False, "error": str(e)}
+                continue
+            outcomes[address] = balance_outcome(balance)
+
+        return [{"address": address, **outcomes[address]} for address in addresses]
+
+    def _asset_holding(self, address: str, asset_id: int) -> Optional[int]:
+        """
+        단일 자산 보유량 조회 (계정 전체 자산 목록을 받지 않음)
+
+        Returns:
+            int: 보유량 (기본 단위), opt-in 전이면 None
+        """
+        try:
+            info = self.algod_client.account_asset_info(address, asset_id)
+        except AlgodHTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+        return info["asset-holding"]["amount"]
+
+
+def balance_outcome(balance: Optional[int]) -> Dict:
+    """잔액 조회 결과 → 일괄 조회 주소별 결과 (None이면 opt-in 전)"""
+    if balance is None:
+        return {"success": False, "error": NOT_OPTED_IN_ERROR}
+    return {"success": True, "balance": balance}
+
 
 def generate_policy_hash(policy_document: str) -> str:
     """정책 문서 해시 생성 (SHA-256)"""
@@ -434,7 +632,8 @@ def main():
         config = {
             "asset_id": result["asset_id"],
             "created_at": result["confirmed_round"],
-            "policy_hash": policy_hash
+            "policy_hash": policy_hash,
+            "decimals": result["decimals"]
         }
 
         with open("../config/asa_config.json", "w") as f:
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+발급 이력 컬럼 저장소
+PRD 2.2: 배분 이력 추적 - 대용량 이력 메모리 최적화
+
+구조:
+- 반복되는 문자열(user_id, reason, period, region)은 정수 코드로 인터닝
+- tx_id는 기록마다 고유하므로 인터닝하지 않고 Algorand 트랜잭션 ID
+  (32바이트 해시의 base32)를 원래 32바이트로 보관
+- 금액·시각(epoch 마이크로초)은 typed array에 보관
+- IssuanceRecord는 조회 시점에만 생성 (lazy view)
+- 시각 정렬 인덱스 + 사용자별 보조 인덱스 (이진 탐색 범위 조회)
+"""
+
+import base64
+import binascii
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+
+
+# naive datetime 기준 epoch (timestamp 문자열과 동일하게 시간대 없음)
+_EPOCH = datetime(1970, 1, 1)
+_NONE_CODE = -1
+_TX_HASH_CODE = -2      # tx_codes 값: tx_id가 _tx_hashes에 해시로 보관됨
+_TX_HASH_SIZE = 32      # Algorand 트랜잭션 ID 해시 크기 (base32 52자)
+_EMPTY_TX_HASH = bytes(_TX_HASH_SIZE)
+
+
+class StringInterner:
+    """문자열 ↔ 정수 코드 변환표"""
+
+    def __init__(self):
+        self._codes: Dict[str, int] = {}
+        self._values: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def code(self, value: Optional[str]) -> int:
+        """문자열 코드 (없으면 새로 등록, None은 -1)"""
+        if value is None:
+            return _NONE_CODE
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._values)
+            self._values.append(value)
+        return code
+
+    def lookup(self, value: Optional[str]) -> Optional[int]:
+        """등록된 코드 조회 (미등록 시 None)"""
+        if value is None:
+            return _NONE_CODE
+        return self._codes.get(value)
+
+    def value(self, code: int) -> Optional[str]:
+        """코드 → 문자열"""
+        return None if code == _NONE_CODE else self._values[code]
+
+
+def tx_id_to_hash(tx_id: Optional[str]) -> Optional[bytes]:
+    """Algorand 트랜잭션 ID → 32바이트 해시 (형식이 다르면 None)"""
+    if tx_id is None or len(tx_id) != 52:
+        return None
+    try:
+        raw = base64.b32decode(tx_id + "====")
+    except (binascii.Error, ValueError):
+        return None
+    # 정규 표기(대문자, 남는 비트 0)만 해시로 보관해야 원래 문자열로 복원됨
+    if hash_to_tx_id(raw) != tx_id:
+        return None
+    return raw
+
+
+def hash_to_tx_id(raw: bytes) -> str:
+    """32바이트 해시 → Algorand 트랜잭션 ID"""
+    return base64.b32encode(raw).decode("ascii").rstrip("=")
+
+
+def timestamp_to_micros(timestamp: str) -> int:
+    """ISO timestamp → epoch 마이크로초"""
+    delta = datetime.fromisoformat(timestamp).replace(tzinfo=None) - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def micros_to_timestamp(micros: int) -> str:
+    """epoch 마이크로초 → ISO timestamp"""
+    return (_EPOCH + timedelta(microseconds=micros)).isoformat()
+
+
+class IssuanceColumns(Sequence):
+    """
+    컬럼형 발급 이력
+
+    기록 1건당 정수 7개와 트랜잭션 해시 32바이트(약 70바이트)만 사용하며,
+    원래 문자열과 정확히 복원되지 않는 값(record_id 형식, 시간대 포함
+    timestamp)만 예외 dict에 따로 보관한다. Algorand 형식이 아닌 tx_id
+    (TX_SIMULATED 등 반복 값)는 다른 문자열처럼 인터닝한다.
+    """
+
+    def __init__(self, record_factory):
+        """
+        Args:
+            record_factory: 행 → 기록 객체 생성자 (IssuanceRecord)
+        """
+        self._record_factory = record_factory
+        self.users = StringInterner()
+        self.reasons = StringInterner()
+        self.tx_ids = StringInterner()
+        self.periods = StringInterner()
+        self.regions = StringInterner()
+
+        self.user_codes = array('i')
+        self.amounts = array('q')
+        self.timestamps = array('q')
+        self.reason_codes = array('i')
+        self.tx_codes = array('i')
+        self._tx_hashes = bytearray()
+        self.period_codes = array('i')
+        self.region_codes = array('i')
+
+        self._record_id_overrides: Dict[int, str] = {}
+        self._timestamp_overrides: Dict[int, str] = {}
+
+        # 사용자 코드 → 행 번호 (보조 인덱스)
+        self._user_rows: Dict[int, array] = {}
+        # 추가 순서가 시각 순서와 같으면 행 번호 자체가 시각 인덱스.
+        # 역순 기록이 들어오면 그때부터 정렬된 (시각, 행) 배열을 별도 유지
+        self._time_sorted = True
+        self._order_times: Optional[array] = None
+        self._order_rows: Optional[array] = None
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def append(self, record):
+        """기록 추가 (컬럼 분해)"""
+        row = len(self.amounts)
+
+        user_code = self.users.code(record.user_id)
+        self.user_codes.append(user_code)
+        self.amounts.append(record.amount)
+        self.reason_codes.append(self.reasons.code(record.reason))
+        tx_hash = tx_id_to_hash(record.tx_id)
+        if tx_hash is None:
+            self.tx_codes.append(self.tx_ids.code(record.tx_id))
+            self._tx_hashes += _EMPTY_TX_HASH
+        else:
+            self.tx_codes.append(_TX_HASH_CODE)
+            self._tx_hashes += tx_hash
+        self.period_codes.append(self.periods.code(record.period))
+        self.region_codes.append(self.regions.code(record.region))
+
+        micros = timestamp_to_micros(record.timestamp)
+        self._index_time(row, micros)
+        self.timestamps.append(micros)
+        if micros_to_timestamp(micros) != record.timestamp:
+            self._timestamp_overrides[row] = record.timestamp
+
+        user_rows = self._user_rows.get(user_code)
+        if user_rows is None:
+            user_rows = self._user_rows[user_code] = array('q')
+        user_rows.append(row)
+
+        if record.record_id != self._default_record_id(row):
+            self._record_id_overrides[row] = record.record_id
+
+    def _index_time(self, row: int, micros: int):
+        """시각 인덱스 갱신 (timestamps에 추가하기 전에 호출)"""
+        if self._time_sorted:
+            if not self.timestamps or self.timestamps[-1] <= micros:
+                return
+            # 첫 역순 기록: 현재까지의 행으로 정렬 인덱스 생성
+            self._time_sorted = False
+            self._order_times = array('q', self.timestamps)
+            self._order_rows = array('q', range(row))
+
+        position = bisect_right(self._order_times, micros)
+        self._order_times.insert(position, micros)
+        self._order_rows.insert(position, row)
+
+    @staticmethod
+    def _default_record_id(row: int) -> str:
+        """행 번호 기반 기본 record_id"""
+        return f"ISS-{row + 1:06d}"
+
+    def _field_values(self, row: int) -> Dict:
+        """행 → 필드 dict"""
+        return {
+            "record_id": self._record_id_overrides.get(row) or self._default_record_id(row),
+            "user_id": self.users.value(self.user_codes[row]),
+            "amount": self.amounts[row],
+            "reason": self.reasons.value(self.reason_codes[row]),
+            "tx_id": self._tx_id(row),
+            "timestamp": (
+                self._timestamp_overrides.get(row) or
+                micros_to_timestamp(self.timestamps[row])
+            ),
+            "period": self.periods.value(self.period_codes[row]),
+            "region": self.regions.value(self.region_codes[row])
+        }
+
+    def _tx_id(self, row: int) -> Optional[str]:
+        """행의 tx_id (해시 보관 행은 base32로 복원)"""
+        code = self.tx_codes[row]
+        if code == _TX_HASH_CODE:
+            offset = row * _TX_HASH_SIZE
+            return hash_to_tx_id(bytes(self._tx_hashes[offset:offset + _TX_HASH_SIZE]))
+        return self.tx_ids.value(code)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("issuance record index out of range")
+        return self._record_factory(**self._field_values(index))
+
+    def __iter__(self) -> Iterator:
+        for row in range(len(self)):
+            yield self[row]
+
+    def iter_dicts(self) -> Iterator[Dict]:
+        """기록 dict 순회 (직렬화용, 기록 객체 생성 생략)"""
+        for row in range(len(self)):
+            yield self._field_values(row)
+
+    def rows_for_user(self, user_id: str) -> Sequence:
+        """사용자 기록 행 번호 (보조 인덱스, 추가 순서)"""
+        code = self.users.lookup(user_id)
+        if code is None:
+            return ()
+        return self._user_rows.get(code, ())
+
+    def rows_in_range(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        user_id: Optional[str] = None,
+        period: Optional[str] = None
+    ) -> Iterator[int]:
+        """
+        시각 범위 [start, end) 의 행 번호를 시각 순서로 생성
+
+        Args:
+            start, end: epoch 마이크로초 (None=무제한)
+            user_id: 사용자 필터 (보조 인덱스 사용)
+            period: 기간 필터
+        """
+        period_code = None
+        if period is not None:
+            period_code = self.periods.lookup(period)
+            if period_code is None:
+                return
+
+        if user_id is not None:
+            rows = self.rows_for_user(user_id)
+            if not self._time_sorted:
+                rows = sorted(rows, key=self.timestamps.__getitem__)
+            candidates = self._slice_by_time(rows, start, end)
+        elif self._time_sorted:
+            lo = 0 if start is None else bisect_left(self.timestamps, start)
+            hi = len(self) if end is None else bisect_left(self.timestamps, end)
+            candidates = range(lo, hi)
+        else:
+            lo = 0 if start is None else bisect_left(self._order_times, start)
+            hi = len(self._order_rows) if end is None else bisect_left(self._order_times, end)
+            candidates = (self._order_rows[i] for i in range(lo, hi))
+
+        for row in candidates:
+            if period_code is None or self.period_codes[row] == period_code:
+                yield row
+
+    def _slice_by_time(
+        self,
+        rows: Sequence,
+        start: Optional[int],
+        end: Optional[int]
+    ) -> Iterator[int]:
+        """시각 순 행 목록에서 [start, end) 구간 (이진 탐색)"""
+        timestamps = self.timestamps
+
+        def lower_bound(target: int) -> int:
+            lo, hi = 0, len(rows)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if timestamps[rows[mid]] < target:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            return lo
+
+        lo = 0 if start is None else lower_bound(start)
+        hi = len(rows) if end is None else lower_bound(end)
+        return (rows[i] for i in range(lo, hi))
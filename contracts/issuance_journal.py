@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+발급 저널 (Append-only Journal)
+PRD 2.2: 배분 이력 추적
+
+주요 기능:
+- 발급·배분 변경을 한 줄씩 추가 기록 (O(1) 쓰기)
+- fsync 묶음 처리 (group commit): 기록은 자기 항목을 포함한 fsync가 끝난
+  뒤 반환하고, fsync가 진행되는 동안 들어온 기록은 다음 fsync 한 번으로 확정
+- 스냅샷 이후 저널 재생 (startup recovery)
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Iterator, List
+
+
+class IssuanceJournal:
+    """Append-only 발급 저널 (JSON Lines)"""
+
+    def __init__(self, journal_file: str):
+        """
+        Args:
+            journal_file: 저널 파일 경로
+        """
+        self.journal_file = journal_file
+        self._file = None
+        self._lock = threading.RLock()
+        self._synced_cond = threading.Condition(self._lock)
+        self._written = 0       # 기록한 항목 수 (항목 순번)
+        self._synced = 0        # fsync로 확정된 마지막 항목 순번
+        self._syncing = False   # fsync 진행 중 (잠금 밖에서 수행)
+
+    def _open(self):
+        """저널 파일 열기 (append 모드)"""
+        if self._file is None:
+            directory = os.path.dirname(self.journal_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            needs_newline = False
+            if os.path.exists(self.journal_file) and os.path.getsize(self.journal_file) > 0:
+                with open(self.journal_file, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    needs_newline = f.read(1) != b'\n'
+
+            self._file = open(self.journal_file, 'a', encoding='utf-8')
+
+            # 잘린 마지막 줄 뒤에 이어 쓰지 않도록 줄바꿈 보정
+            if needs_newline:
+                self._file.write('\n')
+        return self._file
+
+    def append(self, entry: Dict):
+        """
+        저널 항목 추가
+
+        한 줄을 OS 버퍼까지 기록한 뒤 그 항목을 포함한 fsync가 끝날 때까지
+        대기한다. 다른 스레드의 fsync가 진행 중이면 그 fsync가 끝난 뒤
+        그동안 쌓인 항목을 한 번에 확정한다.
+        """
+        line = json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n'
+        self._wait_synced(self._write(line, 1))
+
+    def append_many(self, entries: List[Dict]):
+        """여러 항목을 한 번에 기록하고 확정 (대량 발급용)"""
+        data = ''.join(
+            json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n'
+            for entry in entries
+        )
+        self._wait_synced(self._write(data, len(entries)))
+
+    def _write(self, data: str, count: int) -> int:
+        """OS 버퍼까지 기록 후 마지막 항목 순번 반환"""
+        with self._lock:
+            f = self._open()
+            f.write(data)
+            f.flush()
+            self._written += count
+            return self._written
+
+    def sync(self):
+        """기록한 항목을 모두 디스크에 확정 (fsync)"""
+        with self._lock:
+            target = self._written
+        self._wait_synced(target)
+
+    def _wait_synced(self, seq: int):
+        """seq 항목까지 fsync될 때까지 대기 (진행 중인 fsync가 없으면 직접 수행)"""
+        while True:
+            with self._lock:
+                while self._syncing and self._synced < seq:
+                    self._synced_cond.wait()
+                if self._synced >= seq or self._file is None:
+                    return
+
+                self._syncing = True
+                target = self._written
+                self._file.flush()
+                fd = self._file.fileno()
+
+            synced = False
+            try:
+                os.fsync(fd)
+                synced = True
+            finally:
+                with self._lock:
+                    self._syncing = False
+                    if synced:
+                        self._synced = max(self._synced, target)
+                    self._synced_cond.notify_all()
+
+    def replay(self) -> Iterator[Dict]:
+        """
+        저널 재생
+
+        마지막 줄이 기록 도중 잘린 경우(충돌 복구)는 건너뛴다.
+        """
+        try:
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        print(f"[WARN] Skipping torn journal entry: {line[:40]}")
+        except FileNotFoundError:
+            return
+
+    def truncate(self):
+        """저널 비우기 (스냅샷 저장 후 호출)"""
+        with self._lock:
+            self.close()
+            with open(self.journal_file, 'w', encoding='utf-8') as f:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def close(self):
+        """저널 닫기 (진행 중인 fsync가 끝난 뒤)"""
+        with self._lock:
+            while self._syncing:
+                self._synced_cond.wait()
+            if self._file is not None:
+                self.sync()
+                self._file.close()
+                self._file = None
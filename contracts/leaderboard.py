@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+수혜자 순위표 (Leaderboard)
+PRD 2.2: 배분 이력 추적 - 상위 수혜자 조회
+
+구조:
+- 사용자별 누적 합계 dict
+- (-합계, user_id) 인덱스 힙 (사용자당 항목 1개, 위치 dict로 제자리 갱신)
+- 상위 K 조회는 힙을 변경하지 않고 최선 우선 탐색 → O(K log K)
+  (무효 항목이 없으므로 특정 사용자의 잦은 갱신이 조회 비용을 늘리지 않음)
+"""
+
+import heapq
+from typing import Dict, List, Tuple
+
+
+class Leaderboard:
+    """증분 갱신 순위표"""
+
+    def __init__(self):
+        self._totals: Dict[str, int] = {}
+        self._positions: Dict[str, int] = {}
+        self._heap: List[Tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+    def total(self, user_id: str) -> int:
+        """사용자 누적 합계"""
+        return self._totals.get(user_id, 0)
+
+    def add(self, user_id: str, amount: int):
+        """
+        사용자 합계 증감 (발급: 양수, 회수: 음수)
+        O(log N)
+        """
+        total = self._totals.get(user_id, 0) + amount
+        self._totals[user_id] = total
+
+        index = self._positions.get(user_id)
+        if index is None:
+            index = len(self._heap)
+            self._heap.append((-total, user_id))
+            self._positions[user_id] = index
+        else:
+            self._heap[index] = (-total, user_id)
+
+        # 증가하면 위로, 감소하면 아래로 이동
+        if amount >= 0:
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+
+    def _swap(self, i: int, j: int):
+        """두 항목 교환 (위치 dict 갱신)"""
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._positions[heap[i][1]] = i
+        self._positions[heap[j][1]] = j
+
+    def _sift_up(self, index: int):
+        heap = self._heap
+        while index > 0:
+            parent = (index - 1) // 2
+            if heap[index] >= heap[parent]:
+                break
+            self._swap(index, parent)
+            index = parent
+
+    def _sift_down(self, index: int):
+        heap = self._heap
+        size = len(heap)
+        while True:
+            best = index
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < size and heap[child] < heap[best]:
+                    best = child
+            if best == index:
+                break
+            self._swap(index, best)
+            index = best
+
+    def top(self, limit: int) -> List[Tuple[str, int]]:
+        """
+        상위 K 사용자 (합계 내림차순, 동점 시 user_id 오름차순)
+
+        힙 배열을 트리로 보고 루트부터 최선 우선 탐색하므로
+        힙 자체는 변경하지 않는다.
+        """
+        result = []
+        if limit <= 0 or not self._heap:
+            return result
+
+        heap = self._heap
+        frontier = [(heap[0], 0)]
+        while frontier and len(result) < limit:
+            (neg_total, user_id), index = heapq.heappop(frontier)
+            result.append((user_id, -neg_total))
+
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+
+        return result
@@ -8,72 +8,132 @@ PRD 3.2: Reserve 권한 - 미발행량 보유·배분
 - 예산 관리 (연/월/분기)
 - 1인당 한도 설정
 - 배분 이력 추적
+- 저널 모드 (발급당 O(1) 추가 기록)
+- 저장소 엔진 선택 (JSON / SQLite)
+- 발급 예약(hold) → 확정/취소 (동시 발급 시 초과 지급 방지)
+- 대량 발급 시 예산 초과분 비율·상한 조정
+
+금액(예산·한도·발급량)은 모두 기본 단위 정수 (contracts.coupon_units)
 """
 
 import json
-from typing import Dict, List, Optional
+import heapq
+import threading
+import time
+import uuid
+from collections.abc import Sequence
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 from dataclasses import dataclass, asdict
 
+from contracts.coupon_units import CouponUnits
+from contracts.reserve_storage import (
+    BudgetAllocation,
+    IssuanceRecord,
+    ReserveStorage,
+    JsonReserveStorage
+)
+from policies.budget_solver import fit_to_budget
 
-@dataclass
-class BudgetAllocation:
-    """예산 배분 정보"""
-    allocation_id: str
-    period: str  # "2025-Q1", "2025-01"
-    total_budget: int
-    allocated: int
-    remaining: int
-    per_person_limit: int
-    created_at: str
+
+class IssuanceHoldError(Exception):
+    """발급 예약 오류 (만료·미존재)"""
+    pass
 
 
 @dataclass
-class IssuanceRecord:
-    """발급 기록"""
-    record_id: str
+class IssuanceHold:
+    """발급 예약 (예산·1인 한도 선점)"""
+    hold_id: str
     user_id: str
+    period: str
     amount: int
-    reason: str  # "carbon_reduction", "local_food_purchase"
-    tx_id: str
-    timestamp: str
+    expires_at: float  # time.monotonic() 기준
+    region: Optional[str] = None
+    committing: bool = False  # 확정(저장) 중에는 만료·취소 제외
 
 
 class ReserveManager:
     """Reserve 계정 관리자"""
 
-    def __init__(self, config_file: str = "./config/budget_config.json"):
-        self.config_file = config_file
-        self.budget_allocations: Dict[str, BudgetAllocation] = {}
-        self.issuance_records: List[IssuanceRecord] = []
-        self._load_config()
+    # 사용자별 잠금 스트라이프 수
+    USER_LOCK_STRIPES = 64
 
-    def _load_config(self):
-        """설정 로드"""
-        try:
-            with open(self.config_file, 'r') as f:
-                data = json.load(f)
-                self.budget_allocations = {
-                    k: BudgetAllocation(**v)
-                    for k, v in data.get("allocations", {}).items()
-                }
-                self.issuance_records = [
-                    IssuanceRecord(**r)
-                    for r in data.get("issuance_records", [])
-                ]
-        except FileNotFoundError:
+    def __init__(
+        self,
+        config_file: str = "./config/budget_config.json",
+        journal_file: Optional[str] = None,
+        checkpoint_interval: Optional[int] = None,
+        storage: Optional[ReserveStorage] = None,
+        lazy_history: bool = False,
+        units: Optional[CouponUnits] = None
+    ):
+        """
+        Args:
+            config_file: 설정(스냅샷) 파일 경로
+            journal_file: 저널 파일 경로 (지정 시 저널 모드)
+            checkpoint_interval: 자동 스냅샷 주기 (저널 항목 수, None=수동)
+            storage: 저장소 엔진 (미지정 시 JSON 파일 저장소)
+            lazy_history: 시작 시 예산·집계값만 로드 (이력은 조회 시 적재)
+            units: 금액 단위 (ASA decimals, 기본 0 = 정수 쿠폰)
+
+        Raises:
+            ValueError: 저장된 예산의 금액 단위가 units와 다름
+        """
+        self.config_file = config_file
+        self.units = units or CouponUnits()
+        self.storage = storage or JsonReserveStorage(
+            config_file=config_file,
+            journal_file=journal_file,
+            checkpoint_interval=checkpoint_interval,
+            lazy_history=lazy_history
+        )
+        self.budget_allocations: Dict[str, BudgetAllocation] = (
+            self.storage.load_allocations()
+        )
+        if not self.budget_allocations:
             self._initialize_default_config()
-
-    def _save_config(self):
-        """설정 저장"""
-        data = {
-            "allocations": {
-                k: asdict(v) for k, v in self.budget_allocations.items()
-            },
-            "issuance_records": [asdict(r) for r in self.issuance_records]
+        for allocation in self.budget_allocations.values():
+            # 단위가 다른 금액이 섞이면 한도·잔액 비교가 무의미해짐
+            if allocation.decimals != self.units.decimals:
+                raise ValueError(
+                    f"예산 {allocation.period}의 금액 단위(decimals={allocation.decimals})가 "
+                    f"설정 단위(decimals={self.units.decimals})와 다릅니다."
+                )
+
+        # 동시성 제어: 사용자별 잠금(스트라이프) + 짧은 예산 카운터 잠금
+        self._user_locks = [
+            threading.Lock() for _ in range(self.USER_LOCK_STRIPES)
+        ]
+        self._budget_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+        # 미확정 예약
+        self._holds: Dict[str, IssuanceHold] = {}
+        self._hold_expiry: List[Tuple[float, str]] = []
+        self._held_by_user: Dict[Tuple[str, str], int] = {}
+        self._held_by_period: Dict[str, int] = {}
+
+        # 기간별 확정 발급량 (_budget_lock 안에서만 갱신, 예산 확인 기준)
+        # 저장소 잔액은 저장 중 먼저 차감되므로 예약과 이중 계산될 수 있음
+        self._recorded_by_period: Dict[str, int] = {
+            period: allocation.allocated
+            for period, allocation in self.budget_allocations.items()
         }
-        with open(self.config_file, 'w') as f:
-            json.dump(data, f, indent=2)
+
+    @property
+    def issuance_records(self) -> Sequence[IssuanceRecord]:
+        """전체 발급 기록 (감사·호환용, 저장소에 따라 전체 이력을 읽음)"""
+        records = self.storage.iter_issuances()
+        return records if isinstance(records, Sequence) else list(records)
+
+    def checkpoint(self):
+        """저장소 체크포인트 (JSON: 스냅샷 저장 후 저널 비우기)"""
+        self.storage.checkpoint()
+
+    def close(self):
+        """저장소 닫기"""
+        self.storage.close()
 
     def _initialize_default_config(self):
         """기본 설정 초기화"""
@@ -81,14 +141,14 @@ class ReserveManager:
         allocation = BudgetAllocation(
             allocation_id="2025-Q1",
             period="2025-Q1",
-            total_budget=1000000,  # 100만개
+            total_budget=self.units.to_base(1000000),  # 100만개
             allocated=0,
-            remaining=1000000,
-            per_person_limit=5000,  # 1인당 5,000개
-            created_at=datetime.now().isoformat()
+            remaining=self.units.to_base(1000000),
+            per_person_limit=self.units.to_base(5000),  # 1인당 5,000개
+            created_at=datetime.now().isoformat(),
+            decimals=self.units.decimals
         )
-        self.budget_allocations["2025-Q1"] = allocation
-        self._save_config()
+        self.storage.save_allocation(allocation)
 
     def set_budget(
         self,
@@ -102,8 +162,8 @@ class ReserveManager:
 
         Args:
             period: 기간 (예: "2025-Q1", "2025-01")
-            total_budget: 총 예산
-            per_person_limit: 1인당 한도
+            total_budget: 총 예산 (기본 단위)
+            per_person_limit: 1인당 한도 (기본 단위)
         """
         allocation = BudgetAllocation(
             allocation_id=period,
@@ -112,11 +172,13 @@ class ReserveManager:
             allocated=0,
             remaining=total_budget,
             per_person_limit=per_person_limit,
-            created_at=datetime.now().isoformat()
+            created_at=datetime.now().isoformat(),
+            decimals=self.units.decimals
         )
 
-        self.budget_allocations[period] = allocation
-        self._save_config()
+        self.storage.save_allocation(allocation)
+        with self._budget_lock:
+            self._recorded_by_period[period] = 0
 
         print(f"[OK] Budget set: {period}")
         print(f"     Total budget: {total_budget:,}")
@@ -134,9 +196,24 @@ class ReserveManager:
         발급 가능 여부 확인
         PRD 2.2: 1인당 한도 설정
 
+        미확정 예약(hold) 금액도 사용 중인 것으로 계산한다.
+
         Returns:
             Dict: {"allowed": bool, "reason": str}
         """
+        with self._budget_lock:
+            self._expire_holds_locked()
+        return self._check_limits(user_id, amount, period)
+
+    def _check_limits(self, user_id: str, amount: int, period: str) -> Dict:
+        """예산 잔액·1인 한도 확인 (예약 금액 포함)"""
+        check = self._check_budget(amount, period)
+        if not check["allowed"]:
+            return check
+        return self._check_user_limit(user_id, amount, period)
+
+    def _check_budget(self, amount: int, period: str) -> Dict:
+        """기간 예산 잔액 확인 (예약 금액 포함)"""
         # 예산 확인
         if period not in self.budget_allocations:
             return {
@@ -144,17 +221,41 @@ class ReserveManager:
                 "reason": f"예산 기간 {period} 없음"
             }
 
+        # 예산 잔액 확인
+        available = self._available_budget(period)
+        if available < amount:
+            return {
+                "allowed": False,
+                "reason": f"예산 부족 (잔액: {available})"
+            }
+
+        return {
+            "allowed": True,
+            "reason": "발급 가능"
+        }
+
+    def _available_budget(self, period: str) -> int:
+        """기간 예산 잔액 (확정 발급량·예약 금액 차감)"""
         allocation = self.budget_allocations[period]
+        return (
+            allocation.total_budget -
+            self._recorded_by_period.get(period, 0) -
+            self._held_by_period.get(period, 0)
+        )
 
-        # 예산 잔액 확인
-        if allocation.remaining < amount:
+    def _check_user_limit(self, user_id: str, amount: int, period: str) -> Dict:
+        """1인 한도 확인 (예약 금액 포함)"""
+        allocation = self.budget_allocations.get(period)
+        if allocation is None:
             return {
                 "allowed": False,
-                "reason": f"예산 부족 (잔액: {allocation.remaining})"
+                "reason": f"예산 기간 {period} 없음"
             }
 
-        # 1인 한도 확인
-        user_total = self._get_user_total_issuance(user_id, period)
+        user_total = (
+            self._get_user_total_issuance(user_id, period) +
+            self._held_by_user.get((user_id, period), 0)
+        )
         if user_total + amount > allocation.per_person_limit:
             return {
                 "allowed": False,
@@ -166,15 +267,165 @@ class ReserveManager:
             "reason": "발급 가능"
         }
 
+    def _user_lock(self, user_id: str) -> threading.Lock:
+        """사용자 잠금 (서로 다른 사용자는 대부분 다른 잠금 사용)"""
+        return self._user_locks[hash(user_id) % self.USER_LOCK_STRIPES]
+
+    def reserve_issuance(
+        self,
+        user_id: str,
+        amount: int,
+        period: str,
+        ttl: float = 30.0,
+        region: Optional[str] = None
+    ) -> Dict:
+        """
+        발급 예약 (한도 확인 + 선점을 원자적으로 수행)
+
+        1인 한도(저장소 조회 포함)는 사용자 잠금 안에서 확인하므로 서로 다른
+        사용자의 요청은 병렬로 진행된다. 사용자의 예약 금액은 같은 사용자
+        잠금 안에서만 늘어나므로 확인 후 선점 전까지 한도가 유지된다.
+        기간 예산만 짧은 카운터 잠금 안에서 확인·차감한다.
+
+        Args:
+            user_id: 사용자 ID
+            amount: 발급 예정량
+            period: 예산 기간
+            ttl: 예약 유지 시간 (초), 만료 시 자동 해제
+            region: 지역 유형 (확정 시 기록에 저장)
+
+        Returns:
+            Dict: {"allowed": bool, "reason": str, "hold_id": str | None}
+        """
+        with self._user_lock(user_id):
+            user_check = self._check_user_limit(user_id, amount, period)
+
+            with self._budget_lock:
+                self._expire_holds_locked()
+
+                check = self._check_budget(amount, period)
+                if check["allowed"]:
+                    check = user_check
+                if not check["allowed"]:
+                    check["hold_id"] = None
+                    return check
+
+                hold = IssuanceHold(
+                    hold_id=f"HOLD-{uuid.uuid4().hex[:12]}",
+                    user_id=user_id,
+                    period=period,
+                    amount=amount,
+                    expires_at=time.monotonic() + ttl,
+                    region=region
+                )
+                self._add_hold_locked(hold)
+
+        return {
+            "allowed": True,
+            "reason": "발급 예약",
+            "hold_id": hold.hold_id
+        }
+
+    def commit_hold(
+        self,
+        hold_id: str,
+        reason: str,
+        tx_id: str
+    ) -> IssuanceRecord:
+        """
+        예약 확정 → 발급 기록 저장
+
+        예산 잠금 안에서 예약을 확정 중으로 고정(만료·취소 제외)한 뒤 저장은
+        잠금 밖에서 수행하고, 저장이 끝나면 다시 잠금을 잡아 예약 금액을
+        확정 발급량으로 옮긴다. 저장에 실패하면 고정을 풀어 예약은 만료 또는
+        취소로 해제된다.
+
+        Raises:
+            IssuanceHoldError: 예약이 없거나 만료된 경우
+        """
+        hold = self._holds.get(hold_id)
+        if hold is None:
+            raise IssuanceHoldError(f"예약 없음 또는 만료: {hold_id}")
+
+        with self._user_lock(hold.user_id):
+            with self._budget_lock:
+                self._expire_holds_locked()
+                if self._holds.get(hold_id) is not hold or hold.committing:
+                    raise IssuanceHoldError(f"예약 없음 또는 만료: {hold_id}")
+                hold.committing = True
+
+            try:
+                record = self._append_record(
+                    user_id=hold.user_id,
+                    amount=hold.amount,
+                    reason=reason,
+                    tx_id=tx_id,
+                    period=hold.period,
+                    region=hold.region
+                )
+            except BaseException:
+                with self._budget_lock:
+                    hold.committing = False
+                    heapq.heappush(self._hold_expiry, (hold.expires_at, hold_id))
+                raise
+
+            with self._budget_lock:
+                self._remove_hold_locked(hold_id)
+                self._add_recorded_locked(hold.period, hold.amount)
+
+        return record
+
+    def release_hold(self, hold_id: str) -> bool:
+        """예약 취소 (온체인 전송 실패 등, 확정 중인 예약은 취소 불가)"""
+        with self._budget_lock:
+            hold = self._holds.get(hold_id)
+            if hold is None or hold.committing:
+                return False
+            self._remove_hold_locked(hold_id)
+            return True
+
+    def _add_hold_locked(self, hold: IssuanceHold):
+        """예약 추가 (_budget_lock 보유 상태)"""
+        key = (hold.user_id, hold.period)
+        self._holds[hold.hold_id] = hold
+        heapq.heappush(self._hold_expiry, (hold.expires_at, hold.hold_id))
+        self._held_by_user[key] = self._held_by_user.get(key, 0) + hold.amount
+        self._held_by_period[hold.period] = (
+            self._held_by_period.get(hold.period, 0) + hold.amount
+        )
+
+    def _remove_hold_locked(self, hold_id: str) -> Optional[IssuanceHold]:
+        """예약 제거 (_budget_lock 보유 상태)"""
+        hold = self._holds.pop(hold_id, None)
+        if hold is None:
+            return None
+
+        key = (hold.user_id, hold.period)
+        self._held_by_user[key] -= hold.amount
+        if not self._held_by_user[key]:
+            del self._held_by_user[key]
+        self._held_by_period[hold.period] -= hold.amount
+        return hold
+
+    def _add_recorded_locked(self, period: str, amount: int):
+        """확정 발급량 반영 (_budget_lock 보유 상태)"""
+        self._recorded_by_period[period] = (
+            self._recorded_by_period.get(period, 0) + amount
+        )
+
+    def _expire_holds_locked(self):
+        """만료된 예약 해제 (_budget_lock 보유 상태, 만료 힙 기준)"""
+        now = time.monotonic()
+        while self._hold_expiry and self._hold_expiry[0][0] <= now:
+            _, hold_id = heapq.heappop(self._hold_expiry)
+            hold = self._holds.get(hold_id)
+            # 확정 중인 예약은 건너뜀 (저장 실패 시 만료 힙에 다시 추가)
+            if hold is not None and not hold.committing:
+                self._remove_hold_locked(hold_id)
+
     def _get_user_total_issuance(self, user_id: str, period: str) -> int:
         """사용자의 기간별 누적 발급량 조회"""
-        total = 0
-        for record in self.issuance_records:
-            # 기간 매칭 (간단히 timestamp로 비교)
-            if record.user_id == user_id:
-                # TODO: 실제로는 timestamp를 파싱하여 period와 비교
-                total += record.amount
-        return total
+        return self.storage.user_period_total(user_id, period)
 
     def record_issuance(
         self,
@@ -182,80 +433,395 @@ class ReserveManager:
         amount: int,
         reason: str,
         tx_id: str,
-        period: str
+        period: str,
+        region: Optional[str] = None
     ) -> IssuanceRecord:
         """
         발급 기록 저장
         PRD 2.2: 배분 이력 추적
+
+        저장하는 동안 금액을 예약으로 선점하고 저장 후 확정 발급량으로 옮긴다
+        (저장은 예산 잠금 밖에서 수행).
+
+        Args:
+            region: 지역 유형 (지역별 순위표용, 선택)
         """
-        record = IssuanceRecord(
-            record_id=f"ISS-{len(self.issuance_records)+1:06d}",
-            user_id=user_id,
-            amount=amount,
-            reason=reason,
-            tx_id=tx_id,
-            timestamp=datetime.now().isoformat()
-        )
+        # 회수(음수)는 저장이 끝난 뒤에만 잔액에 반영
+        reserved = max(amount, 0)
+        with self._budget_lock:
+            self._held_by_period[period] = (
+                self._held_by_period.get(period, 0) + reserved
+            )
 
-        self.issuance_records.append(record)
+        try:
+            record = self._append_record(
+                user_id=user_id,
+                amount=amount,
+                reason=reason,
+                tx_id=tx_id,
+                period=period,
+                region=region
+            )
+        except BaseException:
+            with self._budget_lock:
+                self._held_by_period[period] -= reserved
+            raise
+
+        with self._budget_lock:
+            self._held_by_period[period] -= reserved
+            self._add_recorded_locked(period, amount)
 
-        # 예산 차감
-        if period in self.budget_allocations:
-            allocation = self.budget_allocations[period]
-            allocation.allocated += amount
-            allocation.remaining -= amount
+        return record
 
-        self._save_config()
+    def _append_record(
+        self,
+        user_id: str,
+        amount: int,
+        reason: str,
+        tx_id: str,
+        period: str,
+        region: Optional[str] = None
+    ) -> IssuanceRecord:
+        """발급 기록 채번·저장 (예산 잠금 없이 호출)"""
+        # record_id 채번과 저장을 한 번에 수행 (동시 요청 시 ID 충돌 방지)
+        with self._write_lock:
+            record = IssuanceRecord(
+                record_id=f"ISS-{self.storage.issuance_count()+1:06d}",
+                user_id=user_id,
+                amount=amount,
+                reason=reason,
+                tx_id=tx_id,
+                timestamp=datetime.now().isoformat(),
+                period=period,
+                region=region
+            )
+
+            # 기록 저장 및 예산 차감
+            self.storage.append_issuance(record)
 
         print(f"[OK] Issuance recorded: {user_id} -> {amount}")
 
         return record
 
+    def record_issuances_bulk(
+        self,
+        issuances: List[Dict],
+        period: str,
+        scaling: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        대량 발급 (캠페인 일괄 지급)
+
+        모든 행을 한 번에 예산·1인 한도와 대조하고(행 순서대로 누적 반영),
+        통과한 행만 한 번의 쓰기로 저장한다.
+
+        scaling을 지정하면 거절 대신 총액이 예산 잔액과 1인 한도 잔여분에
+        맞도록 행별 금액을 먼저 조정한다 (policies.budget_solver).
+
+        Args:
+            issuances: [{"user_id", "amount", "reason", "tx_id", "region"(선택)}, ...]
+            period: 예산 기간
+            scaling: None(조정 없음), "uniform"(비율) 또는 "water_fill"(상한)
+
+        Returns:
+            List[Dict]: 행별 결과 {"index", "user_id", "success", "amount",
+                        "record_id" 또는 "error"} (조정 시 "requested_amount" 포함)
+        """
+        stripes = sorted({
+            hash(row["user_id"]) % self.USER_LOCK_STRIPES for row in issuances
+        })
+        for stripe in stripes:
+            self._user_locks[stripe].acquire()
+
+        try:
+            with self._budget_lock:
+                self._expire_holds_locked()
+                requested = issuances
+                if scaling is not None:
+                    issuances = self._scale_bulk_locked(issuances, period, scaling)
+                results, accepted = self._validate_bulk_locked(issuances, period)
+                if scaling is not None:
+                    for result, row in zip(results, requested):
+                        result["requested_amount"] = row["amount"]
+
+                # 저장이 끝날 때까지 통과한 금액을 선점
+                reserved = sum(row["amount"] for _, row in accepted)
+                self._held_by_period[period] = (
+                    self._held_by_period.get(period, 0) + reserved
+                )
+
+            try:
+                records = self._persist_bulk(accepted, period)
+            except BaseException:
+                with self._budget_lock:
+                    self._held_by_period[period] -= reserved
+                raise
+
+            with self._budget_lock:
+                self._held_by_period[period] -= reserved
+                self._add_recorded_locked(period, reserved)
+        finally:
+            for stripe in reversed(stripes):
+                self._user_locks[stripe].release()
+
+        for (index, _), record in zip(accepted, records):
+            results[index]["record_id"] = record.record_id
+
+        print(f"[OK] Bulk issuance recorded: {len(records)}/{len(issuances)} rows")
+
+        return results
+
+    def _scale_bulk_locked(
+        self,
+        issuances: List[Dict],
+        period: str,
+        method: str
+    ) -> List[Dict]:
+        """
+        대량 발급 금액 조정 (_budget_lock 보유 상태)
+
+        사용자별로 행 금액을 합산해 사용자 단위로 조정하므로(상한 = 1인 한도
+        잔여분) 행 수가 많은 사용자가 더 많이 배분받지 않는다. 사용자 배분액은
+        그 사용자의 행들에 요청 금액 비율로 다시 나눈다. 동점 배분은 user_id
+        순서로 결정한다.
+        """
+        allocation = self.budget_allocations.get(period)
+        if allocation is None:
+            return issuances
+
+        available = max(self._available_budget(period), 0)
+        demands = [max(row["amount"], 0) for row in issuances]
+        user_rows: Dict[str, List[int]] = {}
+        for index, row in enumerate(issuances):
+            user_rows.setdefault(row["user_id"], []).append(index)
+
+        user_ids = list(user_rows)
+        user_demands, caps = [], []
+        for user_id in user_ids:
+            headroom = allocation.per_person_limit - (
+                self._get_user_total_issuance(user_id, period) +
+                self._held_by_user.get((user_id, period), 0)
+            )
+            user_demand = sum(demands[i] for i in user_rows[user_id])
+            user_demands.append(user_demand)
+            caps.append(max(min(user_demand, headroom), 0))
+
+        solution = fit_to_budget(
+            user_demands,
+            available,
+            caps=caps,
+            method=method,
+            tie_keys=user_ids
+        )
+
+        amounts = list(demands)
+        for user_id, user_amount in zip(user_ids, solution.amounts):
+            rows = user_rows[user_id]
+            if len(rows) == 1:
+                amounts[rows[0]] = user_amount
+                continue
+            split = fit_to_budget([demands[i] for i in rows], user_amount, method="uniform")
+            for i, amount in zip(rows, split.amounts):
+                amounts[i] = amount
+
+        return [
+            {**row, "amount": amount}
+            for row, amount in zip(issuances, amounts)
+        ]
+
+    def _validate_bulk_locked(
+        self,
+        issuances: List[Dict],
+        period: str
+    ) -> Tuple[List[Dict], List[Tuple[int, Dict]]]:
+        """대량 발급 행 검증 (_budget_lock 보유 상태, 단일 패스)"""
+        allocation = self.budget_allocations.get(period)
+        available = self._available_budget(period) if allocation else 0
+        batch_totals: Dict[str, int] = {}
+
+        results, accepted = [], []
+        for index, row in enumerate(issuances):
+            user_id = row["user_id"]
+            amount = row["amount"]
+            result = {
+                "index": index,
+                "user_id": user_id,
+                "success": False,
+                "amount": amount
+            }
+            results.append(result)
+
+            if allocation is None:
+                result["error"] = f"예산 기간 {period} 없음"
+                continue
+
+            if amount <= 0:
+                result["error"] = f"발급량 오류 ({amount})"
+                continue
+
+            if available < amount:
+                result["error"] = f"예산 부족 (잔액: {available})"
+                continue
+
+            if user_id not in batch_totals:
+                batch_totals[user_id] = (
+                    self._get_user_total_issuance(user_id, period) +
+                    self._held_by_user.get((user_id, period), 0)
+                )
+            user_total = batch_totals[user_id]
+            if user_total + amount > allocation.per_person_limit:
+                result["error"] = (
+                    f"1인 한도 초과 (현재: {user_total}, "
+                    f"한도: {allocation.per_person_limit})"
+                )
+                continue
+
+            available -= amount
+            batch_totals[user_id] = user_total + amount
+            result["success"] = True
+            accepted.append((index, row))
+
+        return results, accepted
+
+    def _persist_bulk(
+        self,
+        accepted: List[Tuple[int, Dict]],
+        period: str
+    ) -> List[IssuanceRecord]:
+        """통과한 행을 한 번에 저장"""
+        if not accepted:
+            return []
+
+        with self._write_lock:
+            next_id = self.storage.issuance_count() + 1
+            timestamp = datetime.now().isoformat()
+            records = [
+                IssuanceRecord(
+                    record_id=f"ISS-{next_id + offset:06d}",
+                    user_id=row["user_id"],
+                    amount=row["amount"],
+                    reason=row.get("reason", "보상 지급"),
+                    tx_id=row.get("tx_id", "TX_SIMULATED"),
+                    timestamp=timestamp,
+                    period=period,
+                    region=row.get("region")
+                )
+                for offset, (_, row) in enumerate(accepted)
+            ]
+            self.storage.append_issuances(records)
+
+        return records
+
+    def record_clawback(
+        self,
+        user_id: str,
+        amount: int,
+        tx_id: str,
+        period: str,
+        region: Optional[str] = None
+    ) -> IssuanceRecord:
+        """
+        회수 기록 저장
+        PRD 2.1: S4→S6 단계 (부정수급 회수)
+
+        음수 발급 기록으로 저장하므로 사용자 누적량, 순위표,
+        기간 예산이 모두 회수량만큼 줄어든다.
+        """
+        return self.record_issuance(
+            user_id=user_id,
+            amount=-amount,
+            reason="clawback",
+            tx_id=tx_id,
+            period=period,
+            region=region
+        )
+
     def get_budget_status(self, period: str) -> Optional[Dict]:
         """예산 현황 조회"""
         if period not in self.budget_allocations:
             return None
 
         allocation = self.budget_allocations[period]
+        allocated = self.storage.period_allocated(period)
 
         return {
             "period": allocation.period,
             "total_budget": allocation.total_budget,
-            "allocated": allocation.allocated,
-            "remaining": allocation.remaining,
-            "utilization_rate": (allocation.allocated / allocation.total_budget) * 100,
-            "per_person_limit": allocation.per_person_limit
+            "allocated": allocated,
+            "remaining": allocation.total_budget - allocated,
+            "reserved": self._held_by_period.get(period, 0),
+            "utilization_rate": (allocated / allocation.total_budget) * 100,
+            "per_person_limit": allocation.per_person_limit,
+            "decimals": allocation.decimals
         }
 
     def get_user_issuance_summary(self, user_id: str) -> Dict:
         """사용자 발급 내역 요약"""
-        user_records = [
-            r for r in self.issuance_records if r.user_id == user_id
-        ]
-
-        total_amount = sum(r.amount for r in user_records)
+        total_amount, count, recent_records = self.storage.user_summary(
+            user_id, recent=10  # 최근 10건
+        )
 
         return {
             "user_id": user_id,
             "total_issued": total_amount,
-            "issuance_count": len(user_records),
-            "records": [asdict(r) for r in user_records[-10:]]  # 최근 10건
+            "issuance_count": count,
+            "records": [asdict(r) for r in recent_records]
         }
 
-    def get_top_recipients(self, limit: int = 10) -> List[Dict]:
-        """상위 수혜자 조회"""
-        user_totals = {}
+    def query_issuances(
+        self,
+        start: Optional[Union[str, datetime]] = None,
+        end: Optional[Union[str, datetime]] = None,
+        user_id: Optional[str] = None,
+        period: Optional[str] = None
+    ) -> Iterator[IssuanceRecord]:
+        """
+        기간별 발급 내역 조회 (감사용)
+        PRD 2.2: 배분 이력 추적
+
+        시각 인덱스로 범위를 찾고 기록을 하나씩 생성하므로
+        큰 구간도 전체 목록을 메모리에 만들지 않는다.
+
+        Args:
+            start: 시작 시각 (포함, None=처음부터)
+            end: 종료 시각 (미포함, None=끝까지)
+            user_id: 사용자 필터
+            period: 예산 기간 필터
+
+        Raises:
+            ValueError: 시각 형식 오류
+        """
+        return self.storage.query_issuances(
+            start=self._normalize_timestamp(start),
+            end=self._normalize_timestamp(end),
+            user_id=user_id,
+            period=period
+        )
 
-        for record in self.issuance_records:
-            if record.user_id not in user_totals:
-                user_totals[record.user_id] = 0
-            user_totals[record.user_id] += record.amount
+    @staticmethod
+    def _normalize_timestamp(value: Optional[Union[str, datetime]]) -> Optional[str]:
+        """시각 인자 → 기록과 같은 ISO 형식 문자열"""
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        return value.isoformat()
 
-        sorted_users = sorted(
-            user_totals.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:limit]
+    def get_top_recipients(
+        self,
+        limit: int = 10,
+        period: Optional[str] = None,
+        region: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        상위 수혜자 조회
+
+        Args:
+            limit: 조회 인원
+            period: 기간 필터 (None=전체)
+            region: 지역 필터 (None=전체)
+        """
+        sorted_users = self.storage.top_recipients(limit, period=period, region=region)
 
         return [
             {"user_id": user_id, "total_issued": amount}
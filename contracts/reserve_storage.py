@@ -0,0 +1,806 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Reserve 저장소 엔진
+PRD 2.2: 예산 관리 · 배분 이력 추적
+
+저장소:
+- JsonReserveStorage: JSON 파일 (데모용, 선택적 저널 모드)
+- SQLiteReserveStorage: SQLite (운영용, WAL 모드 + 인덱스 집계)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from datetime import datetime
+from dataclasses import dataclass, asdict
+
+from contracts.issuance_journal import IssuanceJournal
+from contracts.leaderboard import Leaderboard
+from contracts.issuance_columns import IssuanceColumns, timestamp_to_micros
+
+
+@dataclass
+class BudgetAllocation:
+    """예산 배분 정보"""
+    allocation_id: str
+    period: str  # "2025-Q1", "2025-01"
+    total_budget: int
+    allocated: int
+    remaining: int
+    per_person_limit: int
+    created_at: str
+    decimals: int = 0  # 금액 단위 (ASA decimals, 기본 단위 = 1 / 10^decimals 쿠폰)
+
+
+@dataclass
+class IssuanceRecord:
+    """발급 기록"""
+    record_id: str
+    user_id: str
+    amount: int
+    reason: str  # "carbon_reduction", "local_food_purchase"
+    tx_id: str
+    timestamp: str
+    period: Optional[str] = None  # "2025-Q1" (기존 기록은 timestamp로 추정)
+    region: Optional[str] = None  # "urban", "suburban", "rural"
+
+
+class ReserveStorage:
+    """
+    Reserve 저장소 인터페이스
+
+    예산 배분(allocations)은 항상 메모리에 유지하고,
+    발급 이력의 보관·집계 방식은 저장소마다 다르다.
+    """
+
+    def load_allocations(self) -> Dict[str, BudgetAllocation]:
+        """예산 배분 로드 (반환된 dict는 저장소와 공유)"""
+        raise NotImplementedError
+
+    def save_allocation(self, allocation: BudgetAllocation):
+        """예산 배분 저장"""
+        raise NotImplementedError
+
+    def append_issuance(self, record: IssuanceRecord):
+        """발급 기록 저장 및 기간 예산 차감"""
+        raise NotImplementedError
+
+    def append_issuances(self, records: List[IssuanceRecord]):
+        """발급 기록 일괄 저장 (저장소별로 한 번의 쓰기로 처리)"""
+        for record in records:
+            self.append_issuance(record)
+
+    def issuance_count(self) -> int:
+        """누적 발급 건수"""
+        raise NotImplementedError
+
+    def iter_issuances(self) -> Iterable[IssuanceRecord]:
+        """전체 발급 기록 순회"""
+        raise NotImplementedError
+
+    def user_period_total(self, user_id: str, period: str) -> int:
+        """사용자의 기간별 누적 발급량"""
+        raise NotImplementedError
+
+    def query_issuances(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        user_id: Optional[str] = None,
+        period: Optional[str] = None
+    ) -> Iterator[IssuanceRecord]:
+        """시각 범위 [start, end) 발급 기록을 시각 순서로 생성"""
+        raise NotImplementedError
+
+    def user_summary(self, user_id: str, recent: int = 10) -> Tuple[int, int, List[IssuanceRecord]]:
+        """사용자 누적 발급량, 발급 건수, 최근 기록"""
+        raise NotImplementedError
+
+    def top_recipients(
+        self,
+        limit: int,
+        period: Optional[str] = None,
+        region: Optional[str] = None
+    ) -> List[Tuple[str, int]]:
+        """누적 발급량 상위 사용자 (기간·지역 필터 선택)"""
+        raise NotImplementedError
+
+    def period_allocated(self, period: str) -> int:
+        """기간별 누적 발급량"""
+        raise NotImplementedError
+
+    def checkpoint(self):
+        """저장소 정리 (스냅샷/WAL 체크포인트)"""
+        pass
+
+    def close(self):
+        """저장소 닫기"""
+        pass
+
+
+class UserIssuanceHistory:
+    """사용자별 누적 합계·건수 + 최근 기록 링 버퍼 (행 번호)"""
+
+    __slots__ = ("total", "count", "recent")
+
+    def __init__(self, ring_size: int):
+        self.total = 0
+        self.count = 0
+        self.recent = deque(maxlen=ring_size)
+
+
+def _apply_budget_deduction(
+    allocations: Dict[str, BudgetAllocation],
+    period: Optional[str],
+    amount: int
+) -> Optional[BudgetAllocation]:
+    """기간 예산에서 발급량 차감"""
+    allocation = allocations.get(period)
+    if allocation:
+        allocation.allocated += amount
+        allocation.remaining -= amount
+    return allocation
+
+
+class JsonReserveStorage(ReserveStorage):
+    """
+    JSON 파일 저장소 (데모용)
+
+    journal_file 미지정 시 매 변경마다 전체 파일을 다시 쓰고,
+    지정 시 변경을 저널에 한 줄씩 추가한다 (스냅샷 + 저널 재생).
+
+    스냅샷 첫 줄에는 예산 배분과 집계값(사용자·기간별 누적량, 발급 건수)을,
+    이후 줄에는 발급 기록을 한 줄씩 기록한다 (파일 전체는 유효한 JSON).
+    lazy_history=True 이면 시작 시 첫 줄만 읽고, 발급 이력은 이력 조회가
+    처음 필요할 때 줄 단위로 스트리밍하여 적재한다.
+    """
+
+    SNAPSHOT_FORMAT = 2
+
+    def __init__(
+        self,
+        config_file: str = "./config/budget_config.json",
+        journal_file: Optional[str] = None,
+        checkpoint_interval: Optional[int] = None,
+        recent_ring_size: int = 10,
+        lazy_history: bool = False
+    ):
+        """
+        Args:
+            config_file: 설정(스냅샷) 파일 경로
+            journal_file: 저널 파일 경로 (지정 시 저널 모드)
+            checkpoint_interval: 자동 스냅샷 주기 (저널 항목 수, None=수동)
+            recent_ring_size: 사용자별 최근 기록 보관 건수
+            lazy_history: 시작 시 집계값만 로드하고 이력은 필요할 때 적재
+        """
+        self.config_file = config_file
+        self.allocations: Dict[str, BudgetAllocation] = {}
+        # 발급 이력 (컬럼형, IssuanceRecord는 조회 시 생성)
+        self.records = IssuanceColumns(IssuanceRecord)
+        # (user_id, period) -> 누적 발급량
+        self._user_period_totals: Dict[Tuple[str, str], int] = {}
+        self._issuance_count = 0
+        # (period, region) -> 순위표 (None = 전체)
+        self._leaderboards: Dict[Tuple[Optional[str], Optional[str]], Leaderboard] = {}
+        # user_id -> 누적 합계·건수·최근 기록
+        self.recent_ring_size = recent_ring_size
+        self._user_history: Dict[str, UserIssuanceHistory] = {}
+        self.journal = IssuanceJournal(journal_file) if journal_file else None
+        self.checkpoint_interval = checkpoint_interval
+        self._journal_seq = 0
+        self._entries_since_checkpoint = 0
+
+        # 지연 적재 상태: 스냅샷 이력 미적재 시 이후 기록은 대기열에 보관
+        self.lazy_history = lazy_history
+        self._history_loaded = True
+        self._pending_records: List[IssuanceRecord] = []
+        self._history_lock = threading.Lock()
+
+    def load_allocations(self) -> Dict[str, BudgetAllocation]:
+        """설정 로드 (저널 모드에서는 스냅샷 위에 저널 재생)"""
+        try:
+            self._load_snapshot()
+        except FileNotFoundError:
+            self._save_config()
+
+        if self.journal:
+            self._replay_journal()
+
+        return self.allocations
+
+    def _load_snapshot(self):
+        """스냅샷 로드 (첫 줄 헤더 + 기록 스트리밍)"""
+        with open(self.config_file, 'r') as f:
+            first_line = f.readline()
+            if not first_line.rstrip().endswith('"issuance_records": ['):
+                # 이전 형식 (들여쓰기 JSON 전체 로드)
+                f.seek(0)
+                self._load_legacy_snapshot(json.load(f))
+                return
+
+            header = json.loads(first_line.rstrip() + ']}')
+            self.allocations.update({
+                k: BudgetAllocation(**v)
+                for k, v in header["allocations"].items()
+            })
+            self._journal_seq = header.get("journal_seq", 0)
+            aggregates = header["aggregates"]
+
+            if self.lazy_history:
+                self._issuance_count = aggregates["issuance_count"]
+                self._user_period_totals = {
+                    (user_id, period): total
+                    for user_id, period, total in aggregates["user_period_totals"]
+                }
+                self._history_loaded = False
+                return
+
+            for record in self._stream_snapshot_records(f):
+                self._count_record(record)
+                self._index_record(record)
+
+    def _load_legacy_snapshot(self, data: Dict):
+        """이전 형식 스냅샷 로드"""
+        self.allocations.update({
+            k: BudgetAllocation(**v)
+            for k, v in data.get("allocations", {}).items()
+        })
+        for r in data.get("issuance_records", []):
+            record = IssuanceRecord(**r)
+            self._count_record(record)
+            self._index_record(record)
+        self._journal_seq = data.get("journal_seq", 0)
+
+    @staticmethod
+    def _stream_snapshot_records(f) -> Iterator[IssuanceRecord]:
+        """스냅샷 기록 줄 단위 스트리밍 (헤더 다음 줄부터)"""
+        for line in f:
+            line = line.strip()
+            if line == ']}':
+                break
+            if not line:
+                continue
+            yield IssuanceRecord(**json.loads(line.rstrip(',')))
+
+    def _ensure_history(self):
+        """지연 적재 모드에서 스냅샷 이력을 적재 (최초 1회)"""
+        if self._history_loaded:
+            return
+
+        with self._history_lock:
+            if self._history_loaded:
+                return
+
+            with open(self.config_file, 'r') as f:
+                f.readline()
+                for record in self._stream_snapshot_records(f):
+                    if record.period is None:
+                        record.period = self._infer_period(record.timestamp)
+                    self._index_record(record)
+
+            # 스냅샷 이후 기록 (집계값에는 이미 반영됨)
+            for record in self._pending_records:
+                self._index_record(record)
+            self._pending_records = []
+            self._history_loaded = True
+
+    def _replay_journal(self):
+        """스냅샷 이후 저널 항목 재생"""
+        replayed = 0
+        for entry in self.journal.replay():
+            if entry["seq"] <= self._journal_seq:
+                continue
+
+            if entry["op"] == "allocation":
+                allocation = BudgetAllocation(**entry["allocation"])
+                self.allocations[allocation.period] = allocation
+            elif entry["op"] == "issuance":
+                record = IssuanceRecord(**entry["record"])
+                self._add_record(record)
+                _apply_budget_deduction(self.allocations, record.period, record.amount)
+
+            self._journal_seq = entry["seq"]
+            replayed += 1
+
+        self._entries_since_checkpoint = replayed
+
+    def _add_record(self, record: IssuanceRecord):
+        """발급 기록 추가 (집계값 갱신 + 이력 인덱스 또는 대기열)"""
+        self._count_record(record)
+        if not self._history_loaded:
+            # 이력 적재 중이면 대기열을 비우고 적재 완료를 표시할 때까지 대기
+            with self._history_lock:
+                if not self._history_loaded:
+                    self._pending_records.append(record)
+                    return
+        self._index_record(record)
+
+    def _count_record(self, record: IssuanceRecord):
+        """집계값 갱신: 발급 건수, (user_id, period) 누적 인덱스"""
+        if record.period is None:
+            record.period = self._infer_period(record.timestamp)
+
+        self._issuance_count += 1
+
+        key = (record.user_id, record.period)
+        self._user_period_totals[key] = (
+            self._user_period_totals.get(key, 0) + record.amount
+        )
+
+    def _index_record(self, record: IssuanceRecord):
+        """이력 인덱스 갱신: 컬럼 저장소, 사용자 링 버퍼, 순위표"""
+        row = len(self.records)
+        self.records.append(record)
+
+        history = self._user_history.get(record.user_id)
+        if history is None:
+            history = self._user_history[record.user_id] = (
+                UserIssuanceHistory(self.recent_ring_size)
+            )
+        history.total += record.amount
+        history.count += 1
+        history.recent.append(row)
+
+        board_keys = {(None, None), (record.period, None)}
+        if record.region is not None:
+            board_keys.update({(None, record.region), (record.period, record.region)})
+        for board_key in board_keys:
+            board = self._leaderboards.get(board_key)
+            if board is None:
+                board = self._leaderboards[board_key] = Leaderboard()
+            board.add(record.user_id, record.amount)
+
+    def _infer_period(self, timestamp: str) -> Optional[str]:
+        """기간 정보가 없는 기존 기록의 기간 추정 (분기 또는 월 단위 예산)"""
+        issued_at = datetime.fromisoformat(timestamp)
+        quarter = f"{issued_at.year}-Q{(issued_at.month - 1) // 3 + 1}"
+        month = f"{issued_at.year}-{issued_at.month:02d}"
+
+        for candidate in (quarter, month):
+            if candidate in self.allocations:
+                return candidate
+        return quarter
+
+    def _save_config(self):
+        """설정 저장 (임시 파일 fsync 후 교체, 기록은 한 줄에 하나씩)"""
+        self._ensure_history()
+
+        header = {
+            "format": self.SNAPSHOT_FORMAT,
+            "allocations": {
+                k: asdict(v) for k, v in self.allocations.items()
+            },
+            "journal_seq": self._journal_seq,
+            "aggregates": {
+                "issuance_count": self._issuance_count,
+                "user_period_totals": [
+                    [user_id, period, total]
+                    for (user_id, period), total in self._user_period_totals.items()
+                ]
+            }
+        }
+        tmp_file = f"{self.config_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            f.write(json.dumps(header, ensure_ascii=False)[:-1])
+            f.write(', "issuance_records": [\n')
+            separator = ''
+            for record in self.records.iter_dicts():
+                f.write(separator + json.dumps(record, ensure_ascii=False))
+                separator = ',\n'
+            f.write('\n]}\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.config_file)
+        # 교체(이름 변경)까지 확정해야 checkpoint가 저널을 비워도 안전
+        _fsync_directory(self.config_file)
+
+    def _append_journal(self, entry: Dict):
+        """저널 항목 기록 (저널 모드 전용)"""
+        self._journal_seq += 1
+        entry["seq"] = self._journal_seq
+        self.journal.append(entry)
+
+        self._entries_since_checkpoint += 1
+        if (self.checkpoint_interval and
+                self._entries_since_checkpoint >= self.checkpoint_interval):
+            self.checkpoint()
+
+    def save_allocation(self, allocation: BudgetAllocation):
+        """예산 배분 저장"""
+        self.allocations[allocation.period] = allocation
+        if self.journal:
+            self._append_journal({
+                "op": "allocation",
+                "allocation": asdict(allocation)
+            })
+        else:
+            self._save_config()
+
+    def append_issuance(self, record: IssuanceRecord):
+        """발급 기록 저장 및 기간 예산 차감"""
+        self._add_record(record)
+        _apply_budget_deduction(self.allocations, record.period, record.amount)
+
+        if self.journal:
+            self._append_journal({
+                "op": "issuance",
+                "record": asdict(record)
+            })
+        else:
+            self._save_config()
+
+    def append_issuances(self, records: List[IssuanceRecord]):
+        """발급 기록 일괄 저장 (파일 쓰기 또는 저널 fsync 1회)"""
+        for record in records:
+            self._add_record(record)
+            _apply_budget_deduction(self.allocations, record.period, record.amount)
+
+        if self.journal:
+            entries = []
+            for record in records:
+                self._journal_seq += 1
+                entries.append({
+                    "op": "issuance",
+                    "record": asdict(record),
+                    "seq": self._journal_seq
+                })
+            self.journal.append_many(entries)
+
+            self._entries_since_checkpoint += len(entries)
+            if (self.checkpoint_interval and
+                    self._entries_since_checkpoint >= self.checkpoint_interval):
+                self.checkpoint()
+        else:
+            self._save_config()
+
+    def issuance_count(self) -> int:
+        """누적 발급 건수 (집계값)"""
+        return self._issuance_count
+
+    def iter_issuances(self) -> Iterable[IssuanceRecord]:
+        """전체 발급 기록 (컬럼형 시퀀스, 기록은 접근 시 생성)"""
+        self._ensure_history()
+        return self.records
+
+    def user_period_total(self, user_id: str, period: str) -> int:
+        """사용자의 기간별 누적 발급량 (O(1) 인덱스)"""
+        return self._user_period_totals.get((user_id, period), 0)
+
+    def query_issuances(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        user_id: Optional[str] = None,
+        period: Optional[str] = None
+    ) -> Iterator[IssuanceRecord]:
+        """시각 범위 조회 (시각 인덱스 이진 탐색, 기록은 하나씩 생성)"""
+        self._ensure_history()
+        rows = self.records.rows_in_range(
+            start=timestamp_to_micros(start) if start else None,
+            end=timestamp_to_micros(end) if end else None,
+            user_id=user_id,
+            period=period
+        )
+        for row in rows:
+            yield self.records[row]
+
+    def user_summary(self, user_id: str, recent: int = 10) -> Tuple[int, int, List[IssuanceRecord]]:
+        """사용자 누적 발급량, 발급 건수, 최근 기록 (링 버퍼, O(recent))"""
+        self._ensure_history()
+        history = self._user_history.get(user_id)
+        if history is None:
+            return 0, 0, []
+
+        if recent <= self.recent_ring_size:
+            rows = list(history.recent)[-recent:] if recent > 0 else []
+        else:
+            rows = self.records.rows_for_user(user_id)[-recent:]
+        return history.total, history.count, [self.records[row] for row in rows]
+
+    def top_recipients(
+        self,
+        limit: int,
+        period: Optional[str] = None,
+        region: Optional[str] = None
+    ) -> List[Tuple[str, int]]:
+        """누적 발급량 상위 사용자 (증분 순위표, O(K log K))"""
+        self._ensure_history()
+        board = self._leaderboards.get((period, region))
+        return board.top(limit) if board else []
+
+    def period_allocated(self, period: str) -> int:
+        """기간별 누적 발급량"""
+        allocation = self.allocations.get(period)
+        return allocation.allocated if allocation else 0
+
+    def checkpoint(self):
+        """
+        스냅샷 저장 후 저널 비우기
+
+        스냅샷에 journal_seq를 함께 기록하므로, 저널을 비우기 전에
+        중단되더라도 재시작 시 이미 반영된 항목은 다시 적용되지 않는다.
+        저널은 스냅샷 파일과 디렉토리 항목이 디스크에 확정된 뒤에만 비운다.
+        """
+        if self.journal:
+            self.journal.sync()
+        self._save_config()
+        if self.journal:
+            self.journal.truncate()
+        self._entries_since_checkpoint = 0
+
+    def close(self):
+        """대기 중인 저널 항목 확정"""
+        if self.journal:
+            self.journal.close()
+
+
+def _fsync_directory(path: str):
+    """파일이 속한 디렉토리 fsync (이름 변경 확정, 지원하지 않는 플랫폼은 생략)"""
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class SQLiteReserveStorage(ReserveStorage):
+    """
+    SQLite 저장소 (운영용)
+
+    발급 이력은 메모리에 올리지 않고, user_id·period·timestamp
+    인덱스를 이용한 SQL 집계로 조회한다.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS budget_allocations (
+            period TEXT PRIMARY KEY,
+            allocation_id TEXT NOT NULL,
+            total_budget INTEGER NOT NULL,
+            allocated INTEGER NOT NULL,
+            remaining INTEGER NOT NULL,
+            per_person_limit INTEGER NOT NULL,
+            created_at TEXT NOT NULL,
+            decimals INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS issuance_records (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            record_id TEXT NOT NULL UNIQUE,
+            user_id TEXT NOT NULL,
+            amount INTEGER NOT NULL,
+            reason TEXT NOT NULL,
+            tx_id TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            period TEXT,
+            region TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_issuance_user_period
+            ON issuance_records(user_id, period);
+        CREATE INDEX IF NOT EXISTS idx_issuance_period
+            ON issuance_records(period);
+        CREATE INDEX IF NOT EXISTS idx_issuance_timestamp
+            ON issuance_records(timestamp);
+    """
+
+    INDEXES_AFTER_MIGRATION = """
+        CREATE INDEX IF NOT EXISTS idx_issuance_region
+            ON issuance_records(region);
+        CREATE INDEX IF NOT EXISTS idx_issuance_user_timestamp
+            ON issuance_records(user_id, timestamp);
+    """
+
+    RECORD_COLUMNS = "record_id, user_id, amount, reason, tx_id, timestamp, period, region"
+
+    def __init__(self, db_file: str = "./config/reserve.db"):
+        """
+        Args:
+            db_file: SQLite 데이터베이스 파일 경로
+        """
+        self.db_file = db_file
+        self.allocations: Dict[str, BudgetAllocation] = {}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_file, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """이전 스키마에 없는 컬럼 추가"""
+        columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(issuance_records)")
+        }
+        if "region" not in columns:
+            self._conn.execute("ALTER TABLE issuance_records ADD COLUMN region TEXT")
+        allocation_columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(budget_allocations)")
+        }
+        if "decimals" not in allocation_columns:
+            self._conn.execute(
+                "ALTER TABLE budget_allocations ADD COLUMN decimals INTEGER NOT NULL DEFAULT 0"
+            )
+        self._conn.executescript(self.INDEXES_AFTER_MIGRATION)
+
+    def load_allocations(self) -> Dict[str, BudgetAllocation]:
+        """예산 배분 로드"""
+        rows = self._conn.execute(
+            "SELECT allocation_id, period, total_budget, allocated, remaining, "
+            "per_person_limit, created_at, decimals FROM budget_allocations"
+        ).fetchall()
+        self.allocations.update({
+            row[1]: BudgetAllocation(*row) for row in rows
+        })
+        return self.allocations
+
+    def _upsert_allocation(self, allocation: BudgetAllocation):
+        """예산 배분 행 저장 (트랜잭션 내부에서 호출)"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO budget_allocations "
+            "(period, allocation_id, total_budget, allocated, remaining, "
+            "per_person_limit, created_at, decimals) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (allocation.period, allocation.allocation_id, allocation.total_budget,
+             allocation.allocated, allocation.remaining,
+             allocation.per_person_limit, allocation.created_at, allocation.decimals)
+        )
+
+    def save_allocation(self, allocation: BudgetAllocation):
+        """예산 배분 저장"""
+        with self._lock, self._conn:
+            self._upsert_allocation(allocation)
+        self.allocations[allocation.period] = allocation
+
+    def append_issuance(self, record: IssuanceRecord):
+        """발급 기록 저장 및 기간 예산 차감 (단일 트랜잭션)"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT INTO issuance_records ({self.RECORD_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (record.record_id, record.user_id, record.amount, record.reason,
+                 record.tx_id, record.timestamp, record.period, record.region)
+            )
+            allocation = _apply_budget_deduction(
+                self.allocations, record.period, record.amount
+            )
+            if allocation:
+                self._upsert_allocation(allocation)
+
+    def append_issuances(self, records: List[IssuanceRecord]):
+        """발급 기록 일괄 저장 (단일 트랜잭션, executemany)"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT INTO issuance_records ({self.RECORD_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(r.record_id, r.user_id, r.amount, r.reason,
+                  r.tx_id, r.timestamp, r.period, r.region) for r in records]
+            )
+            touched = {}
+            for record in records:
+                allocation = _apply_budget_deduction(
+                    self.allocations, record.period, record.amount
+                )
+                if allocation:
+                    touched[allocation.period] = allocation
+            for allocation in touched.values():
+                self._upsert_allocation(allocation)
+
+    def _query(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        """조회 쿼리 실행"""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def issuance_count(self) -> int:
+        """누적 발급 건수 (AUTOINCREMENT 시퀀스)"""
+        return self._query("SELECT COALESCE(MAX(seq), 0) FROM issuance_records")[0][0]
+
+    def iter_issuances(self) -> Iterator[IssuanceRecord]:
+        """전체 발급 기록 순회 (커서 단위 스트리밍)"""
+        conn = sqlite3.connect(self.db_file)
+        try:
+            cursor = conn.execute(
+                f"SELECT {self.RECORD_COLUMNS} FROM issuance_records ORDER BY seq"
+            )
+            for row in cursor:
+                yield IssuanceRecord(*row)
+        finally:
+            conn.close()
+
+    def user_period_total(self, user_id: str, period: str) -> int:
+        """사용자의 기간별 누적 발급량 (idx_issuance_user_period)"""
+        return self._query(
+            "SELECT COALESCE(SUM(amount), 0) FROM issuance_records "
+            "WHERE user_id = ? AND period = ?",
+            (user_id, period)
+        )[0][0]
+
+    def query_issuances(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        user_id: Optional[str] = None,
+        period: Optional[str] = None
+    ) -> Iterator[IssuanceRecord]:
+        """시각 범위 조회 (idx_issuance_timestamp, 커서 단위 스트리밍)"""
+        conditions, params = [], []
+        for column, op, value in (
+            ("timestamp", ">=", start),
+            ("timestamp", "<", end),
+            ("user_id", "=", user_id),
+            ("period", "=", period)
+        ):
+            if value is not None:
+                conditions.append(f"{column} {op} ?")
+                params.append(value)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+
+        conn = sqlite3.connect(self.db_file)
+        try:
+            cursor = conn.execute(
+                f"SELECT {self.RECORD_COLUMNS} FROM issuance_records {where}"
+                "ORDER BY timestamp, seq",
+                params
+            )
+            for row in cursor:
+                yield IssuanceRecord(*row)
+        finally:
+            conn.close()
+
+    def user_summary(self, user_id: str, recent: int = 10) -> Tuple[int, int, List[IssuanceRecord]]:
+        """사용자 누적 발급량, 발급 건수, 최근 기록"""
+        total_amount, count = self._query(
+            "SELECT COALESCE(SUM(amount), 0), COUNT(*) FROM issuance_records "
+            "WHERE user_id = ?",
+            (user_id,)
+        )[0]
+        rows = self._query(
+            f"SELECT {self.RECORD_COLUMNS} FROM issuance_records "
+            "WHERE user_id = ? ORDER BY seq DESC LIMIT ?",
+            (user_id, recent)
+        )
+        return total_amount, count, [IssuanceRecord(*row) for row in reversed(rows)]
+
+    def top_recipients(
+        self,
+        limit: int,
+        period: Optional[str] = None,
+        region: Optional[str] = None
+    ) -> List[Tuple[str, int]]:
+        """누적 발급량 상위 사용자 (기간·지역 필터 선택)"""
+        conditions, params = [], []
+        if period is not None:
+            conditions.append("period = ?")
+            params.append(period)
+        if region is not None:
+            conditions.append("region = ?")
+            params.append(region)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+
+        return self._query(
+            f"SELECT user_id, SUM(amount) AS total FROM issuance_records {where}"
+            "GROUP BY user_id ORDER BY total DESC, user_id LIMIT ?",
+            (*params, limit)
+        )
+
+    def period_allocated(self, period: str) -> int:
+        """기간별 누적 발급량 (idx_issuance_period)"""
+        return self._query(
+            "SELECT COALESCE(SUM(amount), 0) FROM issuance_records WHERE period = ?",
+            (period,)
+        )[0][0]
+
+    def checkpoint(self):
+        """WAL 체크포인트"""
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self):
+        """데이터베이스 연결 닫기"""
+        with self._lock:
+            self._conn.close()
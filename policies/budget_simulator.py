@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+예산 소진 시뮬레이터 (Monte Carlo)
+PRD 2.2: 예산 관리 - 용량 계획
+
+모델:
+- 시민별 소득 분위(1~10분위 → get_income_level), 지역, 행동 횟수(포아송)를 표본 추출
+- 행동 1회 보상은 RewardCalculator의 (소득, 지역, 행동) 조회표로 계산
+- 시민별 발급액 = min(기간 수요, 1인 한도)
+- 소진 시점: 각 시민의 수요가 기간에 걸쳐 균등하게 발생한다고 보고
+  일자별 누적 발급액이 남은 예산에 도달하는 날
+"""
+
+import json
+import random
+from bisect import bisect_right
+from itertools import accumulate
+from math import exp
+from typing import Dict, List, Optional, Sequence
+from dataclasses import dataclass, field
+
+from contracts.reserve_storage import BudgetAllocation
+from policies.reward_calculator import (
+    RewardCalculator,
+    RegionType,
+    ActivityType
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 미설치 시 순수 Python 시뮬레이션
+    np = None
+
+
+@dataclass
+class PopulationDistribution:
+    """합성 인구 분포"""
+    # 소득 1~10분위 비중
+    income_decile_weights: Sequence[float] = (1.0,) * 10
+    # 지역 구성비
+    region_mix: Dict[RegionType, float] = field(default_factory=lambda: {
+        RegionType.URBAN: 0.6,
+        RegionType.SUBURBAN: 0.25,
+        RegionType.RURAL: 0.15
+    })
+    # 기간 중 1인당 평균 행동 횟수
+    activity_frequencies: Dict[ActivityType, float] = field(default_factory=lambda: {
+        ActivityType.BASIC: 2.0,
+        ActivityType.LOCAL_FOOD: 1.0,
+        ActivityType.PUBLIC_TRANSPORT: 1.5,
+        ActivityType.ENERGY_SAVING: 0.5,
+        ActivityType.RECYCLING: 1.0,
+        ActivityType.CARBON_NEUTRAL: 0.2
+    })
+    # 행동 1회 기본 보상
+    base_amount: int = 100
+
+
+class BudgetSimulator:
+    """예산 소진 Monte Carlo 시뮬레이터"""
+
+    DEFAULT_PERCENTILES = (10, 50, 90, 99)
+
+    def __init__(
+        self,
+        calculator: RewardCalculator,
+        allocation: BudgetAllocation,
+        population: Optional[PopulationDistribution] = None,
+        period_days: int = 90
+    ):
+        """
+        Args:
+            calculator: 보상 계산기 (생성 시점의 정책 스냅샷 사용)
+            allocation: 시뮬레이션 대상 예산 배분
+            population: 인구 분포 (None이면 기본 분포)
+            period_days: 기간 일수 (분기 = 90)
+        """
+        self.calculator = calculator
+        self.allocation = allocation
+        self.population = population or PopulationDistribution()
+        self.period_days = period_days
+
+        if len(self.population.income_decile_weights) != 10:
+            raise ValueError("income_decile_weights는 10개여야 합니다.")
+        if period_days <= 0:
+            raise ValueError("period_days는 1 이상이어야 합니다.")
+
+        income_order = RewardCalculator.INCOME_ORDER
+        region_order = RewardCalculator.REGION_ORDER
+        activity_order = RewardCalculator.ACTIVITY_ORDER
+
+        # 분위 → 소득 코드
+        self._decile_codes = [
+            income_order.index(calculator.get_income_level(decile))
+            for decile in range(1, 11)
+        ]
+        self._decile_weights = list(self.population.income_decile_weights)
+        self._region_weights = [
+            self.population.region_mix.get(region, 0.0) for region in region_order
+        ]
+        # (행동 코드, 평균 횟수) - 빈도 0인 행동은 제외
+        self._activity_rates = []
+        for code, activity in enumerate(activity_order):
+            rate = self.population.activity_frequencies.get(activity, 0.0)
+            if rate > 0:
+                self._activity_rates.append((code, rate))
+
+        # (소득, 지역) 조합별 행동 1회 보상표
+        combos = [
+            (income, region, activity)
+            for income in range(len(income_order))
+            for region in range(len(region_order))
+            for activity in range(len(activity_order))
+        ]
+        rewards = calculator.calculate_rewards_batch(
+            [self.population.base_amount] * len(combos),
+            [c[0] for c in combos],
+            [c[1] for c in combos],
+            [c[2] for c in combos]
+        )
+        self.policy_version = rewards["policy_version"]
+        n_activities = len(activity_order)
+        final_amounts = [int(amount) for amount in rewards["final_amounts"]]
+        self._unit_rewards = [
+            final_amounts[i:i + n_activities]
+            for i in range(0, len(final_amounts), n_activities)
+        ]
+        self._n_regions = len(region_order)
+
+    def run(
+        self,
+        n_citizens: int,
+        n_trials: int = 100,
+        seed: Optional[int] = None,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> Dict:
+        """
+        시뮬레이션 실행
+
+        Args:
+            n_citizens: 시민 수
+            n_trials: 시행 횟수
+            seed: 난수 시드 (재현용)
+            percentiles: 보고할 백분위
+
+        Returns:
+            Dict: 소진 확률·소진일, 한도 도달 인원, 발급액 백분위
+        """
+        if n_citizens <= 0 or n_trials <= 0:
+            raise ValueError("n_citizens와 n_trials는 1 이상이어야 합니다.")
+
+        if np is not None:
+            rng = np.random.default_rng(seed)
+            sample = lambda: self._sample_demands_numpy(rng, n_citizens)
+        else:
+            rng = random.Random(seed)
+            sample = lambda: self._sample_demands_python(rng, n_citizens)
+
+        exhaustion_days = []
+        limit_hits = []
+        total_demands = []
+        total_issued = []
+        citizen_percentiles = []
+
+        for _ in range(n_trials):
+            trial = self._evaluate_trial(sample(), percentiles)
+            if trial["exhaustion_day"] is not None:
+                exhaustion_days.append(trial["exhaustion_day"])
+            limit_hits.append(trial["limit_hits"])
+            total_demands.append(trial["total_demand"])
+            total_issued.append(trial["total_issued"])
+            citizen_percentiles.append(trial["citizen_percentiles"])
+
+        return {
+            "period": self.allocation.period,
+            "policy_version": self.policy_version,
+            "n_citizens": n_citizens,
+            "n_trials": n_trials,
+            "period_days": self.period_days,
+            "budget_remaining": self.allocation.remaining,
+            "per_person_limit": self.allocation.per_person_limit,
+            "exhaustion_probability": len(exhaustion_days) / n_trials,
+            "exhaustion_day": (
+                _summarize(exhaustion_days, percentiles) if exhaustion_days else None
+            ),
+            "limit_hit_users": _summarize(limit_hits, percentiles),
+            "total_demand": _summarize(total_demands, percentiles),
+            "total_issued": _summarize(total_issued, percentiles),
+            # 시민별 발급액 백분위 (시행 평균)
+            "per_citizen_issued": {
+                f"p{p:g}": sum(trial[i] for trial in citizen_percentiles) / n_trials
+                for i, p in enumerate(percentiles)
+            }
+        }
+
+    def _sample_demands_numpy(self, rng, n: int):
+        """시민별 기간 수요 표본 (NumPy)"""
+        deciles = rng.choice(10, size=n, p=_normalize(self._decile_weights))
+        income_codes = np.asarray(self._decile_codes, dtype=np.int64)[deciles]
+        region_codes = rng.choice(self._n_regions, size=n, p=_normalize(self._region_weights))
+        combo = income_codes * self._n_regions + region_codes
+
+        unit_rewards = np.asarray(self._unit_rewards, dtype=np.int64)
+        demands = np.zeros(n, dtype=np.int64)
+        for activity_code, rate in self._activity_rates:
+            counts = rng.poisson(rate, size=n)
+            demands += counts * unit_rewards[combo, activity_code]
+        return demands
+
+    def _sample_demands_python(self, rng: random.Random, n: int) -> List[int]:
+        """시민별 기간 수요 표본 (순수 Python)"""
+        deciles = rng.choices(range(10), weights=self._decile_weights, k=n)
+        regions = rng.choices(range(self._n_regions), weights=self._region_weights, k=n)
+
+        demands = []
+        for decile, region in zip(deciles, regions):
+            rewards = self._unit_rewards[self._decile_codes[decile] * self._n_regions + region]
+            demands.append(sum(
+                _poisson(rng, rate) * rewards[activity_code]
+                for activity_code, rate in self._activity_rates
+            ))
+        return demands
+
+    def _evaluate_trial(self, demands, percentiles: Sequence[float]) -> Dict:
+        """
+        시행 1회 집계
+
+        수요를 정렬해 누적합을 만들어 두면, d일차까지의 누적 발급액은
+        demand × d ≤ limit × D 인 시민(이진 탐색 경계 k)의 수요 비례분과
+        나머지 시민의 한도 합으로 O(log n)에 계산된다.
+        """
+        limit = self.allocation.per_person_limit
+        remaining = self.allocation.remaining
+        days = self.period_days
+        n = len(demands)
+
+        if np is not None and isinstance(demands, np.ndarray):
+            ordered = np.sort(demands)
+            prefix = np.concatenate(([0], np.cumsum(ordered)))
+            day_numbers = np.arange(1, days + 1)
+            k = np.searchsorted(ordered, (limit * days) // day_numbers, side='right')
+            cumulative = prefix[k] * day_numbers / days + limit * (n - k)
+            reached = np.nonzero(cumulative >= remaining)[0] if remaining > 0 else [0]
+            exhaustion_day = int(reached[0]) + 1 if len(reached) else None
+            issued = np.minimum(ordered, limit)
+            citizen_percentiles = np.percentile(issued, percentiles).tolist()
+            limit_hits = int(n - np.searchsorted(ordered, limit, side='left'))
+            total_demand = int(prefix[-1])
+            total_capped = int(issued.sum())
+        else:
+            ordered = sorted(demands)
+            prefix = [0] + list(accumulate(ordered))
+            exhaustion_day = None
+            for day in range(1, days + 1):
+                k = bisect_right(ordered, (limit * days) // day)
+                if prefix[k] * day / days + limit * (n - k) >= remaining:
+                    exhaustion_day = day
+                    break
+            issued = [min(demand, limit) for demand in ordered]
+            citizen_percentiles = [_percentile(issued, p) for p in percentiles]
+            limit_hits = n - bisect_right(ordered, limit - 1)
+            total_demand = prefix[-1]
+            total_capped = sum(issued)
+
+        return {
+            "exhaustion_day": exhaustion_day,
+            "limit_hits": limit_hits,
+            "total_demand": total_demand,
+            "total_issued": min(total_capped, remaining),
+            "citizen_percentiles": citizen_percentiles
+        }
+
+
+def _normalize(weights: Sequence[float]) -> List[float]:
+    """비중 → 확률"""
+    total = sum(weights)
+    if total <= 0:
+        raise ValueError("분포 비중의 합이 0입니다.")
+    return [w / total for w in weights]
+
+
+def _poisson(rng: random.Random, rate: float) -> int:
+    """포아송 표본 (Knuth, 낮은 빈도용)"""
+    threshold = exp(-rate)
+    count = 0
+    product = rng.random()
+    while product > threshold:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+def _percentile(ordered: Sequence[float], p: float) -> float:
+    """정렬된 값의 백분위 (선형 보간, NumPy 기본 방식과 동일)"""
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * p / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _summarize(values: Sequence[float], percentiles: Sequence[float]) -> Dict:
+    """평균 + 백분위 요약"""
+    ordered = sorted(values)
+    summary = {"mean": sum(ordered) / len(ordered)}
+    for p in percentiles:
+        summary[f"p{p:g}"] = _percentile(ordered, p)
+    return summary
+
+
+def main():
+    """예산 소진 시뮬레이션 예시 (시민 100만 명, 분기)"""
+    allocation = BudgetAllocation(
+        allocation_id="SIM-2025-Q1",
+        period="2025-Q1",
+        total_budget=500_000_000,
+        allocated=0,
+        remaining=500_000_000,
+        per_person_limit=1_000,
+        created_at="2025-01-01T00:00:00"
+    )
+    simulator = BudgetSimulator(RewardCalculator(), allocation)
+    report = simulator.run(n_citizens=1_000_000, n_trials=10, seed=42)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
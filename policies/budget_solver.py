@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+예산 제약 보상 조정 (Budget-constrained Scaling)
+PRD 2.2: 예산 관리 - 예산 초과 캠페인의 공정 배분
+
+방식:
+- uniform: 모든 보상에 같은 비율(예산 / 총 수요)을 곱함
+- water_fill: 1인 지급 상한(cap)을 두고 상한 이하 보상은 그대로 지급
+
+두 방식 모두 정수 내림 후 남는 단위를 결정적 순서로 1씩 배분하므로
+예산을 정확히 소진하며, 정렬 1회로 O(n log n)에 끝난다.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+
+SCALING_METHODS = ("uniform", "water_fill")
+
+
+@dataclass
+class ScalingResult:
+    """보상 조정 결과"""
+    method: str
+    amounts: List[int]        # 행별 조정 후 금액
+    total: int                # 조정 후 합계
+    demand: int               # 조정 전 합계 (1인 상한 적용 후)
+    factor: float             # 조정 비율 (total / demand)
+    cap: Optional[int] = None  # water_fill 1인 지급 상한 (+1 배분 전)
+
+
+def fit_to_budget(
+    demands: Sequence[int],
+    budget: int,
+    caps: Optional[Sequence[int]] = None,
+    method: str = "water_fill",
+    tie_keys: Optional[Sequence] = None
+) -> ScalingResult:
+    """
+    보상 목록을 예산에 맞게 조정
+
+    Args:
+        demands: 행별 계산 보상 (calculate_reward의 final_amount)
+        budget: 사용 가능한 예산
+        caps: 행별 상한 (1인 한도 잔여분, None이면 무제한)
+        method: "uniform" 또는 "water_fill"
+        tie_keys: 남는 단위 배분 시 동점 정렬 키 (기본: 행 순서)
+
+    Returns:
+        ScalingResult
+
+    Raises:
+        ValueError: 알 수 없는 방식 또는 음수 입력
+    """
+    if method not in SCALING_METHODS:
+        raise ValueError(f"알 수 없는 조정 방식: {method}")
+    if budget < 0:
+        raise ValueError(f"예산 오류 ({budget})")
+
+    if caps is None:
+        wanted = [int(d) for d in demands]
+    else:
+        wanted = [min(int(d), max(int(c), 0)) for d, c in zip(demands, caps)]
+    if any(d < 0 for d in wanted):
+        raise ValueError("보상 금액은 음수일 수 없습니다.")
+
+    demand = sum(wanted)
+    if demand <= budget:
+        return ScalingResult(method, wanted, demand, demand, 1.0)
+
+    keys = list(tie_keys) if tie_keys is not None else list(range(len(wanted)))
+    if method == "uniform":
+        amounts, cap = _uniform(wanted, budget, demand, keys), None
+    else:
+        amounts, cap = _water_fill(wanted, budget, keys)
+
+    return ScalingResult(method, amounts, budget, demand, budget / demand, cap)
+
+
+def _uniform(wanted: List[int], budget: int, demand: int, keys: List) -> List[int]:
+    """
+    비율 조정: floor(d × budget / demand) 후 나머지가 큰 순서로 +1
+
+    나머지가 0보다 큰 행만 +1을 받으므로 조정 금액이
+    원래 보상을 넘지 않는다.
+    """
+    amounts = []
+    remainders = []
+    for d in wanted:
+        quotient, remainder = divmod(d * budget, demand)
+        amounts.append(quotient)
+        remainders.append(remainder)
+
+    leftover = budget - sum(amounts)
+    order = sorted(
+        (i for i in range(len(wanted)) if remainders[i]),
+        key=lambda i: (-remainders[i], keys[i], i)
+    )
+    for i in order[:leftover]:
+        amounts[i] += 1
+    return amounts
+
+
+def _water_fill(wanted: List[int], budget: int, keys: List):
+    """
+    상한 조정: sum(min(d, cap)) ≤ budget 인 최대 정수 cap
+
+    오름차순으로 훑으면서 k번째 이후 행이 모두 cap을 받는다고 보고
+    cap = (budget - 앞선 합) // 남은 행 수 를 구한다. 남는 단위는
+    cap을 넘는 보상을 가진 행에 정렬 키 순서로 1씩 배분한다.
+    """
+    order = sorted(range(len(wanted)), key=lambda i: wanted[i])
+    n = len(order)
+
+    filled = 0
+    cap = 0
+    for position, i in enumerate(order):
+        candidate = (budget - filled) // (n - position)
+        if wanted[i] > candidate:
+            cap = candidate
+            break
+        filled += wanted[i]
+
+    amounts = [min(d, cap) for d in wanted]
+    leftover = budget - sum(amounts)
+    above = sorted((i for i in range(n) if wanted[i] > cap), key=lambda i: (keys[i], i))
+    for i in above[:leftover]:
+        amounts[i] += 1
+    return amounts, cap
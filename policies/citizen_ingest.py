@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시민 속성 수집 (Eligibility Feed Ingestion)
+PRD 2.2: 차등 보상 - 대량 입력 처리
+
+입력 파일 (CSV, 헤더 필수):
+    user_id,income_decile,region_code,activity_code[,base_amount]
+    user001,2,rural,carbon_neutral,1000
+
+처리:
+- chunk_size 행씩 읽어 처리 (파일 전체를 메모리에 올리지 않음)
+- 열 단위 분류: 고유값만 조회표로 변환 후 전체 열에 펼침
+- 잘못된 행은 파일 줄 번호와 사유를 남기고 제외
+- 정상 행은 RewardCalculator.calculate_rewards_batch로 전달
+"""
+
+import csv
+import sys
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from policies.reward_calculator import (
+    RewardCalculator,
+    RegionType,
+    ActivityType
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 미설치 시 순수 Python 분류
+    np = None
+
+
+REQUIRED_COLUMNS = ("user_id", "income_decile", "region_code", "activity_code")
+_INVALID = -1
+_MAX_AMOUNT = 2 ** 63 - 1  # int64 상한 (보상 일괄 계산 배열 범위)
+
+
+@dataclass
+class IngestChunk:
+    """분류된 입력 묶음"""
+    line_numbers: List[int]          # 정상 행의 파일 줄 번호
+    user_ids: List[str]
+    base_amounts: Sequence[int]
+    income_codes: Sequence[int]      # INCOME_ORDER 순서 인덱스
+    region_codes: Sequence[int]      # REGION_ORDER 순서 인덱스
+    activity_codes: Sequence[int]    # ACTIVITY_ORDER 순서 인덱스
+    rejected: List[Dict] = field(default_factory=list)  # {"line", "user_id", "error"}
+
+    def __len__(self) -> int:
+        return len(self.user_ids)
+
+
+class CitizenIngestor:
+    """시민 속성 파일 스트리밍 수집기"""
+
+    def __init__(
+        self,
+        calculator: RewardCalculator,
+        chunk_size: int = 50_000,
+        default_base_amount: int = 1000,
+        region_codes: Optional[Mapping[str, RegionType]] = None,
+        activity_codes: Optional[Mapping[str, ActivityType]] = None
+    ):
+        """
+        Args:
+            calculator: 보상 계산기
+            chunk_size: 한 번에 처리할 행 수
+            default_base_amount: base_amount 열이 없거나 비었을 때의 기본 보상
+            region_codes: 원천 지역 코드 → RegionType (기본: enum 값)
+            activity_codes: 원천 행동 코드 → ActivityType (기본: enum 값)
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size는 1 이상이어야 합니다.")
+
+        self.calculator = calculator
+        self.chunk_size = chunk_size
+        self.default_base_amount = default_base_amount
+
+        self._decile_lookup = {str(decile): decile for decile in range(1, 11)}
+        self._region_lookup = self._code_lookup(
+            region_codes, RegionType, RewardCalculator.REGION_ORDER
+        )
+        self._activity_lookup = self._code_lookup(
+            activity_codes, ActivityType, RewardCalculator.ACTIVITY_ORDER
+        )
+
+    @staticmethod
+    def _code_lookup(mapping: Optional[Mapping], enum_cls, order: List) -> Dict[str, int]:
+        """원천 코드 → 순서 인덱스 (대소문자 무시)"""
+        if mapping is None:
+            mapping = {member.value: member for member in enum_cls}
+        return {str(raw).strip().lower(): order.index(member) for raw, member in mapping.items()}
+
+    def iter_chunks(self, path: str) -> Iterator[IngestChunk]:
+        """
+        파일을 chunk_size 행씩 분류
+
+        Raises:
+            ValueError: 필수 열 누락
+        """
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = [name.strip() for name in next(reader, [])]
+            missing = [name for name in REQUIRED_COLUMNS if name not in header]
+            if missing:
+                raise ValueError(f"필수 열 누락: {', '.join(missing)}")
+
+            positions = {name: header.index(name) for name in header}
+            while True:
+                rows = []
+                line_numbers = []
+                exhausted = True
+                for row in islice(reader, self.chunk_size):
+                    exhausted = False
+                    if not row:
+                        continue  # 빈 줄
+                    rows.append(row)
+                    line_numbers.append(reader.line_num)
+                if rows:
+                    yield self._classify(rows, line_numbers, positions, len(header))
+                if exhausted:
+                    return
+
+    def iter_rewards(self, path: str) -> Iterator[Tuple[IngestChunk, Dict]]:
+        """파일 묶음별 보상 일괄 계산 결과"""
+        for chunk in self.iter_chunks(path):
+            rewards = self.calculator.calculate_rewards_batch(
+                chunk.base_amounts,
+                chunk.income_codes,
+                chunk.region_codes,
+                chunk.activity_codes
+            )
+            yield chunk, rewards
+
+    def _classify(
+        self,
+        rows: List[List[str]],
+        line_numbers: List[int],
+        positions: Dict[str, int],
+        width: int
+    ) -> IngestChunk:
+        """묶음 분류 (열 단위 변환 → 유효성 마스크 → 정상 행 추출)"""
+        rejected = []
+
+        # 열 개수가 다른 행은 먼저 제외
+        shaped = [i for i, row in enumerate(rows) if len(row) == width]
+        if len(shaped) != len(rows):
+            kept = set(shaped)
+            for i, row in enumerate(rows):
+                if i not in kept:
+                    rejected.append(self._rejection(
+                        line_numbers[i], row, positions,
+                        f"열 개수 오류 ({len(row)}/{width})"
+                    ))
+            rows = [rows[i] for i in shaped]
+            line_numbers = [line_numbers[i] for i in shaped]
+
+        def column(name: str) -> List[str]:
+            index = positions[name]
+            return [row[index] for row in rows]
+
+        deciles = _map_column(column("income_decile"), self._decile_lookup, default=0)
+        income_codes = self.calculator.classify_income_deciles(deciles)
+        region_codes = _map_column(column("region_code"), self._region_lookup, lower=True)
+        activity_codes = _map_column(column("activity_code"), self._activity_lookup, lower=True)
+        if "base_amount" in positions:
+            base_amounts = _parse_amounts(column("base_amount"), self.default_base_amount)
+        else:
+            base_amounts = [self.default_base_amount] * len(rows)
+
+        if np is not None:
+            income_codes = np.asarray(income_codes, dtype=np.int64)
+            region_codes = np.asarray(region_codes, dtype=np.int64)
+            activity_codes = np.asarray(activity_codes, dtype=np.int64)
+            base_array = np.asarray(base_amounts, dtype=np.int64)
+            valid = (
+                (income_codes >= 0) & (region_codes >= 0) &
+                (activity_codes >= 0) & (base_array >= 0)
+            )
+            invalid_rows = np.nonzero(~valid)[0].tolist()
+        else:
+            invalid_rows = [
+                i for i in range(len(rows))
+                if min(income_codes[i], region_codes[i], activity_codes[i], base_amounts[i]) < 0
+            ]
+
+        # 잘못된 행 사유 (드문 경우만 행 단위 확인)
+        for i in invalid_rows:
+            if income_codes[i] < 0:
+                error = f"소득 분위 오류: {rows[i][positions['income_decile']]!r}"
+            elif region_codes[i] < 0:
+                error = f"지역 코드 오류: {rows[i][positions['region_code']]!r}"
+            elif activity_codes[i] < 0:
+                error = f"행동 코드 오류: {rows[i][positions['activity_code']]!r}"
+            else:
+                error = f"기본 보상 오류: {rows[i][positions['base_amount']]!r}"
+            rejected.append(self._rejection(line_numbers[i], rows[i], positions, error))
+        rejected.sort(key=lambda r: r["line"])
+
+        if invalid_rows:
+            bad = set(invalid_rows)
+            keep = [i for i in range(len(rows)) if i not in bad]
+        else:
+            keep = None
+
+        def select(values):
+            if keep is None:
+                return values
+            if np is not None and isinstance(values, np.ndarray):
+                return values[np.asarray(keep, dtype=np.int64)]
+            return [values[i] for i in keep]
+
+        user_index = positions["user_id"]
+        return IngestChunk(
+            line_numbers=select(line_numbers),
+            user_ids=select([row[user_index].strip() for row in rows]),
+            base_amounts=select(base_array if np is not None else base_amounts),
+            income_codes=select(income_codes),
+            region_codes=select(region_codes),
+            activity_codes=select(activity_codes),
+            rejected=rejected
+        )
+
+    @staticmethod
+    def _rejection(line: int, row: List[str], positions: Dict[str, int], error: str) -> Dict:
+        """제외 행 정보"""
+        index = positions["user_id"]
+        return {
+            "line": line,
+            "user_id": row[index].strip() if index < len(row) else None,
+            "error": error
+        }
+
+
+def _map_column(
+    values: List[str],
+    lookup: Dict[str, int],
+    default: int = _INVALID,
+    lower: bool = False
+) -> Sequence[int]:
+    """
+    열 전체 변환 (고유값만 조회 후 역인덱스로 펼침)
+
+    조회표에 없는 값은 default로 표시한다.
+    """
+    if np is not None and values:
+        uniques, inverse = np.unique(np.asarray(values, dtype=str), return_inverse=True)
+        mapped = np.array([
+            lookup.get(u.strip().lower() if lower else u.strip(), default)
+            for u in uniques.tolist()
+        ], dtype=np.int64)
+        return mapped[inverse]
+
+    cache: Dict[str, int] = {}
+    result = []
+    for value in values:
+        code = cache.get(value)
+        if code is None:
+            code = cache[value] = lookup.get(
+                value.strip().lower() if lower else value.strip(), default
+            )
+        result.append(code)
+    return result
+
+
+def _parse_amounts(values: List[str], default: int) -> Sequence[int]:
+    """기본 보상 열 변환 (정상 열은 한 번에, 오류가 있으면 값 단위로)"""
+    if np is not None and values:
+        try:
+            amounts = np.asarray(values).astype(np.int64)
+        except (ValueError, OverflowError):
+            pass
+        else:
+            return np.where(amounts >= 0, amounts, _INVALID)
+    return [_parse_amount(value, default) for value in values]
+
+
+def _parse_amount(value: str, default: int) -> int:
+    """기본 보상 값 (빈 값은 기본값, 오류·int64 범위 밖은 -1)"""
+    value = value.strip()
+    if not value:
+        return default
+    try:
+        amount = int(value)
+    except ValueError:
+        return _INVALID
+    return amount if 0 <= amount <= _MAX_AMOUNT else _INVALID
+
+
+def main():
+    """파일 수집 요약 (python -m policies.citizen_ingest <file.csv>)"""
+    if len(sys.argv) < 2:
+        print("사용법: python -m policies.citizen_ingest <file.csv>")
+        return
+
+    ingestor = CitizenIngestor(RewardCalculator())
+    accepted = rejected = total_reward = 0
+    for chunk, rewards in ingestor.iter_rewards(sys.argv[1]):
+        accepted += len(chunk)
+        rejected += len(chunk.rejected)
+        total_reward += int(sum(rewards["final_amounts"]))
+        for row in chunk.rejected[:10]:
+            print(f"[WARN] line {row['line']}: {row['error']}")
+
+    print(f"정상 {accepted:,}행 / 제외 {rejected:,}행 / 총 보상 {total_reward:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,29 @@ PRD 2.2: 차등 보상 - 소득·지역·행동유형별 지급 강도 조정
 
 보상 공식:
 최종 보상 = 기본 보상 × 소득 가중치 × 지역 가중치 × 행동 가중치
+
+금액은 기본 단위 정수 (contracts.coupon_units, decimals > 0이면 소수 쿠폰)
 """
 
-from typing import Dict
+import hashlib
+import json
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from math import gcd
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from policies.reward_rules import CompiledRulePlan, compile_rules
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 미설치 시 순수 Python 배치 계산
+    np = None
+
 
 class IncomeLevel(Enum):
     """소득 분위"""
@@ -49,10 +66,164 @@ class RewardMultipliers:
         return self.income_multiplier * self.region_multiplier * self.activity_multiplier
 
 
+def _truncating_div(numerator: int, denominator: int) -> int:
+    """0 방향 정수 나눗셈 (int() 절사와 동일)"""
+    if numerator >= 0:
+        return numerator // denominator
+    return -(-numerator // denominator)
+
+
+# 가중치 정수 단위 (basis point, 1.0 = 10000)
+BASIS_POINTS = 10000
+_INT64_MAX = 2 ** 63 - 1
+
+# 배치 계산용 enum 순서 (코드 = 순서 인덱스)
+INCOME_ORDER = list(IncomeLevel)
+REGION_ORDER = list(RegionType)
+ACTIVITY_ORDER = list(ActivityType)
+
+
+@dataclass(frozen=True)
+class CompiledRewardPolicy:
+    """
+    컴파일된 가중치 정책 (불변 스냅샷)
+
+    세 가중치를 basis point로 바꿔 곱한 값을 (소득, 지역, 행동)
+    순서 인덱스의 평탄 배열에 저장한다. 분모는 모든 항목의
+    최대공약수로 약분해 두므로 보상 계산은 정수 곱셈 1회와
+    나눗셈 1회로 끝난다.
+    """
+    version: str
+    content_hash: Optional[str]
+    income_bp: Tuple[int, ...]
+    region_bp: Tuple[int, ...]
+    activity_bp: Tuple[int, ...]
+    numerators: Tuple[int, ...]
+    denominator: int
+    income_ordinals: Mapping[IncomeLevel, int]
+    region_ordinals: Mapping[RegionType, int]
+    activity_ordinals: Mapping[ActivityType, int]
+    rules: Optional[CompiledRulePlan] = None  # 추가 보상 규칙 (policies.reward_rules)
+
+    @classmethod
+    def compile(
+        cls,
+        version: str,
+        income_multipliers: Mapping[IncomeLevel, float],
+        region_multipliers: Mapping[RegionType, float],
+        activity_multipliers: Mapping[ActivityType, float],
+        content_hash: Optional[str] = None,
+        rules: Sequence[Dict] = ()
+    ) -> "CompiledRewardPolicy":
+        """
+        가중치 표 → 정수 조회표 컴파일
+
+        Raises:
+            ValueError: 누락되었거나 0 이하인 가중치, 잘못된 규칙
+        """
+        income_bp = cls._to_basis_points(income_multipliers, INCOME_ORDER)
+        region_bp = cls._to_basis_points(region_multipliers, REGION_ORDER)
+        activity_bp = cls._to_basis_points(activity_multipliers, ACTIVITY_ORDER)
+
+        numerators = [i * r * a for i in income_bp for r in region_bp for a in activity_bp]
+        denominator = BASIS_POINTS ** 3
+        divisor = gcd(denominator, *numerators)
+
+        return cls(
+            version=version,
+            content_hash=content_hash,
+            income_bp=income_bp,
+            region_bp=region_bp,
+            activity_bp=activity_bp,
+            numerators=tuple(n // divisor for n in numerators),
+            denominator=denominator // divisor,
+            income_ordinals=MappingProxyType({m: i for i, m in enumerate(INCOME_ORDER)}),
+            region_ordinals=MappingProxyType({m: i for i, m in enumerate(REGION_ORDER)}),
+            activity_ordinals=MappingProxyType({m: i for i, m in enumerate(ACTIVITY_ORDER)}),
+            rules=compile_rules(rules, [m.value for m in ACTIVITY_ORDER])
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict, content_hash: Optional[str] = None) -> "CompiledRewardPolicy":
+        """
+        정책 파일 내용 → 컴파일된 정책
+
+        파일 형식:
+        {
+            "version": "2025-Q1-v1",
+            "income_multipliers": {"low": 1.5, "middle": 1.2, "high": 1.0},
+            "region_multipliers": {"urban": 1.0, "suburban": 1.15, "rural": 1.3},
+            "activity_multipliers": {"basic": 1.0, ..., "carbon_neutral": 2.0},
+            "rules": [{"type": "streak", "min_days": 7, "multiplier": 1.1}, ...]
+        }
+
+        Raises:
+            ValueError: 형식 오류, 버전 누락, 알 수 없는 유형 또는 잘못된 가중치
+        """
+        if not isinstance(data, dict):
+            raise ValueError("정책 파일은 JSON 객체여야 합니다.")
+
+        version = data.get("version")
+        if not version:
+            raise ValueError("정책 파일에 version이 없습니다.")
+
+        def parse(key: str, enum_cls) -> Dict:
+            table = data.get(key)
+            if not isinstance(table, dict):
+                raise ValueError(f"정책 파일에 {key}가 없습니다.")
+            return {enum_cls(name): value for name, value in table.items()}
+
+        rules = data.get("rules") or []
+        if not isinstance(rules, list) or not all(isinstance(rule, dict) for rule in rules):
+            raise ValueError("정책 파일의 rules는 규칙 객체 목록이어야 합니다.")
+
+        return cls.compile(
+            version=str(version),
+            income_multipliers=parse("income_multipliers", IncomeLevel),
+            region_multipliers=parse("region_multipliers", RegionType),
+            activity_multipliers=parse("activity_multipliers", ActivityType),
+            content_hash=content_hash,
+            rules=rules
+        )
+
+    @staticmethod
+    def _to_basis_points(multipliers: Mapping, order: List[Enum]) -> Tuple[int, ...]:
+        """가중치 → basis point (순서 인덱스 순)"""
+        points = []
+        for member in order:
+            if member not in multipliers:
+                raise ValueError(f"가중치 누락: {member.value}")
+            value = multipliers[member]
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+                raise ValueError(f"잘못된 가중치: {member.value}={value!r}")
+            points.append(round(value * BASIS_POINTS))
+        return tuple(points)
+
+
+def _is_hashable_key(value, lookup: Dict) -> bool:
+    """조회표에 있는 값인지 확인 (해시 불가 값은 False)"""
+    try:
+        return value in lookup
+    except TypeError:
+        return False
+
+
+@dataclass(frozen=True)
+class RewardQuote:
+    """
+    캐시된 보상 견적
+
+    result는 여러 요청이 공유하므로 읽기 전용으로 다룬다.
+    """
+    result: Dict
+    body: bytes  # {"success": true, "data": result} 직렬화 JSON
+    policy_version: str
+
+
 class RewardCalculator:
     """차등 보상 계산기"""
 
-    # PRD 기반 가중치 설정
+    # PRD 기반 가중치 설정 (정책 파일이 없을 때의 기본값)
     INCOME_MULTIPLIERS = {
         IncomeLevel.LOW: 1.5,      # 150%
         IncomeLevel.MIDDLE: 1.2,   # 120%
@@ -74,15 +245,129 @@ class RewardCalculator:
         ActivityType.CARBON_NEUTRAL: 2.0      # 200%
     }
 
-    def __init__(self):
-        pass
+    INCOME_ORDER = INCOME_ORDER
+    REGION_ORDER = REGION_ORDER
+    ACTIVITY_ORDER = ACTIVITY_ORDER
+    BASIS_POINTS = BASIS_POINTS
+
+    # 기본 가중치 정책 버전
+    BUILTIN_POLICY_VERSION = "builtin"
+
+    def __init__(
+        self,
+        policy_file: Optional[str] = None,
+        reload_interval: float = 5.0,
+        quote_cache_size: int = 4096
+    ):
+        """
+        Args:
+            policy_file: 가중치 정책 파일 경로 (None이면 기본 가중치)
+            reload_interval: 정책 파일 변경 감시 주기 (초)
+            quote_cache_size: 보상 견적 캐시 최대 항목 수 (0이면 사용 안 함)
+        """
+        self.policy_file = policy_file
+        self.reload_interval = reload_interval
+        self.quote_cache_size = quote_cache_size
+
+        # 견적 캐시: (기본 보상, 소득, 지역, 행동, 정책 버전) → RewardQuote (LRU)
+        self._quote_cache: "OrderedDict[Tuple, RewardQuote]" = OrderedDict()
+        self._quote_policy: Optional[CompiledRewardPolicy] = None
+        self._quote_lock = threading.Lock()
+        self._quote_hits = 0
+        self._quote_misses = 0
+
+        self._policy = CompiledRewardPolicy.compile(
+            version=self.BUILTIN_POLICY_VERSION,
+            income_multipliers=self.INCOME_MULTIPLIERS,
+            region_multipliers=self.REGION_MULTIPLIERS,
+            activity_multipliers=self.ACTIVITY_MULTIPLIERS
+        )
+        self._policy_stat: Optional[Tuple[int, int]] = None
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._watcher_stop = threading.Event()
+
+        if policy_file:
+            self.reload_policy()
+
+    @property
+    def policy(self) -> CompiledRewardPolicy:
+        """현재 적용 중인 가중치 정책"""
+        return self._policy
+
+    def reload_policy(self, force: bool = False) -> bool:
+        """
+        정책 파일 재로드
+
+        mtime·크기가 바뀌었을 때만 파일을 읽고, 내용 해시까지 같으면
+        스냅샷을 유지한다. 새 스냅샷은 참조 교체 한 번으로 적용되므로
+        계산 중인 요청은 시작 시점의 버전을 끝까지 사용한다.
+        파일 오류 시 기존 정책을 유지한다.
+
+        Returns:
+            bool: 새 정책 적용 여부
+        """
+        if not self.policy_file:
+            return False
+
+        with self._reload_lock:
+            try:
+                stat = os.stat(self.policy_file)
+                file_stat = (stat.st_mtime_ns, stat.st_size)
+                if not force and file_stat == self._policy_stat:
+                    return False
+
+                with open(self.policy_file, 'rb') as f:
+                    content = f.read()
+                self._policy_stat = file_stat
+
+                content_hash = hashlib.sha256(content).hexdigest()
+                if content_hash == self._policy.content_hash:
+                    return False
+
+                policy = CompiledRewardPolicy.from_dict(
+                    json.loads(content.decode('utf-8')),
+                    content_hash=content_hash
+                )
+            except (OSError, ValueError) as e:
+                print(f"[WARN] Reward policy not loaded ({self.policy_file}): {e}")
+                return False
+
+            self._policy = policy
+            print(f"[INFO] Reward policy {policy.version} loaded ({content_hash[:12]})")
+            return True
+
+    def start_policy_watcher(self):
+        """정책 파일 변경 감시 시작 (백그라운드 스레드)"""
+        if self._watcher is not None or not self.policy_file:
+            return
+
+        def watch():
+            while not self._watcher_stop.wait(self.reload_interval):
+                try:
+                    self.reload_policy()
+                except Exception as e:
+                    # 예상하지 못한 오류에도 감시를 계속하고 기존 정책 유지
+                    print(f"[WARN] Reward policy watcher error ({self.policy_file}): {e!r}")
+
+        self._watcher_stop.clear()
+        self._watcher = threading.Thread(target=watch, name="reward-policy-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_policy_watcher(self):
+        """정책 파일 변경 감시 중지"""
+        if self._watcher is not None:
+            self._watcher_stop.set()
+            self._watcher.join()
+            self._watcher = None
 
     def calculate_reward(
         self,
         base_amount: int,
         income_level: IncomeLevel,
         region_type: RegionType,
-        activity_type: ActivityType
+        activity_type: ActivityType,
+        context: Optional[Dict] = None
     ) -> Dict:
         """
         차등 보상 계산
@@ -93,40 +378,309 @@ class RewardCalculator:
             income_level: 소득 분위
             region_type: 지역 유형
             activity_type: 행동 유형
+            context: 규칙 평가 정보 {"hour", "merchant_category", "streak_days"} (선택)
 
         Returns:
             Dict: 계산 결과
         """
-        # 가중치 조회
-        income_mult = self.INCOME_MULTIPLIERS[income_level]
-        region_mult = self.REGION_MULTIPLIERS[region_type]
-        activity_mult = self.ACTIVITY_MULTIPLIERS[activity_type]
-
-        multipliers = RewardMultipliers(
-            income_multiplier=income_mult,
-            region_multiplier=region_mult,
-            activity_multiplier=activity_mult
+        # 요청 단위로 정책 스냅샷 고정
+        return self._calculate(
+            self._policy, base_amount, income_level, region_type, activity_type, context
         )
 
-        # 최종 보상 계산
-        total_mult = multipliers.total_multiplier()
-        final_amount = int(base_amount * total_mult)
+    @staticmethod
+    def _calculate(
+        policy: CompiledRewardPolicy,
+        base_amount: int,
+        income_level: IncomeLevel,
+        region_type: RegionType,
+        activity_type: ActivityType,
+        context: Optional[Dict] = None
+    ) -> Dict:
+        """지정한 정책 스냅샷으로 보상 계산"""
+        # 순서 인덱스 조회
+        i = policy.income_ordinals[income_level]
+        r = policy.region_ordinals[region_type]
+        a = policy.activity_ordinals[activity_type]
+
+        # 최종 보상 계산 (정수 연산, 소수점 이하 절사)
+        index = (i * len(policy.region_bp) + r) * len(policy.activity_bp) + a
+        final_amount = _truncating_div(base_amount * policy.numerators[index], policy.denominator)
+
+        # 추가 보상 규칙 (컴파일된 표 조회)
+        rule_multiplier = 1.0
+        rules = policy.rules
+        if rules is not None:
+            context = context or {}
+            rule_numerator = rules.multiplier(
+                a,
+                context.get("hour"),
+                context.get("merchant_category"),
+                context.get("streak_days")
+            )
+            final_amount = rules.apply(final_amount, a, rule_numerator)
+            rule_multiplier = rule_numerator / rules.denominator
 
         result = {
             "base_amount": base_amount,
             "income_level": income_level.value,
-            "income_multiplier": income_mult,
+            "income_multiplier": policy.income_bp[i] / BASIS_POINTS,
             "region_type": region_type.value,
-            "region_multiplier": region_mult,
+            "region_multiplier": policy.region_bp[r] / BASIS_POINTS,
             "activity_type": activity_type.value,
-            "activity_multiplier": activity_mult,
-            "total_multiplier": total_mult,
+            "activity_multiplier": policy.activity_bp[a] / BASIS_POINTS,
+            "total_multiplier": policy.numerators[index] / policy.denominator,
+            "rule_multiplier": rule_multiplier,
             "final_amount": final_amount,
-            "bonus_amount": final_amount - base_amount
+            "bonus_amount": final_amount - base_amount,
+            "policy_version": policy.version
         }
 
         return result
 
+    def quote(
+        self,
+        base_amount: int,
+        income_level: str,
+        region_type: str,
+        activity_type: str
+    ) -> RewardQuote:
+        """
+        보상 견적 (캐시 사용)
+
+        요청 문자열을 그대로 키로 쓰므로 캐시 적중 시 enum 변환,
+        결과 dict 생성, JSON 직렬화를 모두 건너뛴다. 정책 스냅샷이
+        바뀌면 캐시를 비운다. 규칙 평가 정보(context)가 있는 요청은
+        calculate_reward를 직접 사용한다.
+
+        Raises:
+            ValueError: 알 수 없는 유형 또는 잘못된 기본 보상
+        """
+        if isinstance(base_amount, bool) or not isinstance(base_amount, int):
+            raise ValueError(f"base_amount must be an integer: {base_amount!r}")
+
+        policy = self._policy
+        key = (base_amount, income_level, region_type, activity_type, policy.version)
+
+        with self._quote_lock:
+            if self._quote_policy is not policy:
+                self._quote_cache.clear()
+                self._quote_policy = policy
+            cached = self._quote_cache.get(key)
+            if cached is not None:
+                self._quote_cache.move_to_end(key)
+                self._quote_hits += 1
+                return cached
+            self._quote_misses += 1
+
+        result = self._calculate(
+            policy,
+            base_amount,
+            IncomeLevel(income_level),
+            RegionType(region_type),
+            ActivityType(activity_type)
+        )
+        quote = RewardQuote(
+            result=result,
+            body=json.dumps(
+                {"success": True, "data": result},
+                ensure_ascii=False, separators=(',', ':')
+            ).encode('utf-8'),
+            policy_version=policy.version
+        )
+
+        if self.quote_cache_size > 0:
+            with self._quote_lock:
+                if self._quote_policy is policy:
+                    self._quote_cache[key] = quote
+                    if len(self._quote_cache) > self.quote_cache_size:
+                        self._quote_cache.popitem(last=False)
+
+        return quote
+
+    def quote_cache_stats(self) -> Dict:
+        """견적 캐시 통계"""
+        with self._quote_lock:
+            lookups = self._quote_hits + self._quote_misses
+            return {
+                "size": len(self._quote_cache),
+                "capacity": self.quote_cache_size,
+                "hits": self._quote_hits,
+                "misses": self._quote_misses,
+                "hit_rate": self._quote_hits / lookups if lookups else 0.0,
+                "policy_version": self._policy.version
+            }
+
+    def calculate_rewards_batch(
+        self,
+        base_amounts: Sequence[int],
+        income_levels: Sequence,
+        region_types: Sequence,
+        activity_types: Sequence,
+        contexts: Optional[Dict[str, Sequence]] = None
+    ) -> Dict[str, Sequence[int]]:
+        """
+        차등 보상 일괄 계산
+        PRD 2.2
+
+        calculate_reward와 같은 정수 조회표와 절사를 적용하므로
+        행별 결과가 단건 계산과 정확히 일치한다. 유형을 정수 코드 ndarray로
+        넘기면 변환 비용이 없어 가장 빠르다 (문자열·enum 입력은 encode 참조).
+
+        Args:
+            base_amounts: 기본 보상 금액 배열
+            income_levels: 소득 분위 (enum, 문자열 값 또는 코드)
+            region_types: 지역 유형 (enum, 문자열 값 또는 코드)
+            activity_types: 행동 유형 (enum, 문자열 값 또는 코드)
+            contexts: 규칙 평가 열 {"hour", "merchant_category", "streak_days"} (선택)
+
+        Returns:
+            Dict: {"final_amounts": 배열, "bonus_amounts": 배열, "policy_version": 버전}
+                  (NumPy 설치 시 int64 ndarray, 아니면 array('q'))
+
+        Raises:
+            ValueError: 알 수 없는 유형 또는 배열 길이 불일치
+        """
+        n = len(base_amounts)
+        if not (len(income_levels) == len(region_types) == len(activity_types) == n):
+            raise ValueError("배열 길이가 일치하지 않습니다.")
+
+        income_codes = self.encode(income_levels, self.INCOME_ORDER)
+        region_codes = self.encode(region_types, self.REGION_ORDER)
+        activity_codes = self.encode(activity_types, self.ACTIVITY_ORDER)
+
+        n_regions = len(self.REGION_ORDER)
+        n_activities = len(self.ACTIVITY_ORDER)
+        # 배치 전체에 같은 정책 스냅샷 적용
+        policy = self._policy
+        denominator = policy.denominator
+
+        if np is not None:
+            bases = np.asarray(base_amounts, dtype=np.int64)
+            # 기본 단위가 커서(decimals) int64 곱이 넘칠 수 있으면 정수 경로로 계산
+            if bases.size and (
+                max(-int(bases.min()), int(bases.max())) >
+                _INT64_MAX // max(max(policy.numerators), 1)
+            ):
+                return self._calculate_batch_exact(
+                    bases.tolist(), income_codes, region_codes, activity_codes,
+                    contexts, policy
+                )
+            table = np.asarray(policy.numerators, dtype=np.int64)
+            combo = (income_codes * n_regions + region_codes) * n_activities + activity_codes
+            scaled = bases * table[combo]
+            # 0 방향 절사 (int()와 동일)
+            final_amounts = np.where(
+                scaled >= 0, scaled // denominator, -(-scaled // denominator)
+            )
+            if policy.rules is not None:
+                final_amounts, _ = policy.rules.apply_batch(
+                    final_amounts, activity_codes, contexts or {}
+                )
+                final_amounts = np.asarray(final_amounts, dtype=np.int64)
+            return {
+                "final_amounts": final_amounts,
+                "bonus_amounts": final_amounts - bases,
+                "policy_version": policy.version
+            }
+
+        return self._calculate_batch_exact(
+            base_amounts, income_codes, region_codes, activity_codes, contexts, policy
+        )
+
+    def _calculate_batch_exact(
+        self,
+        base_amounts: Sequence[int],
+        income_codes: Sequence[int],
+        region_codes: Sequence[int],
+        activity_codes: Sequence[int],
+        contexts: Optional[Dict[str, Sequence]],
+        policy: CompiledRewardPolicy
+    ) -> Dict[str, Sequence[int]]:
+        """일괄 계산 (Python 정수 경로, 결과 배열 형식은 calculate_rewards_batch와 동일)"""
+        n_regions = len(self.REGION_ORDER)
+        n_activities = len(self.ACTIVITY_ORDER)
+        table = policy.numerators
+        denominator = policy.denominator
+        if np is not None:
+            income_codes = np.asarray(income_codes).tolist()
+            region_codes = np.asarray(region_codes).tolist()
+            activity_codes = np.asarray(activity_codes).tolist()
+
+        final_amounts = [
+            _truncating_div(base * table[(i * n_regions + r) * n_activities + a], denominator)
+            for base, i, r, a in zip(base_amounts, income_codes, region_codes, activity_codes)
+        ]
+        if policy.rules is not None:
+            final_amounts, _ = policy.rules.apply_batch(
+                final_amounts, activity_codes, contexts or {}
+            )
+        bonus_amounts = [final - base for final, base in zip(final_amounts, base_amounts)]
+        if np is not None:
+            return {
+                "final_amounts": np.asarray(final_amounts, dtype=np.int64),
+                "bonus_amounts": np.asarray(bonus_amounts, dtype=np.int64),
+                "policy_version": policy.version
+            }
+        return {
+            "final_amounts": array('q', final_amounts),
+            "bonus_amounts": array('q', bonus_amounts),
+            "policy_version": policy.version
+        }
+
+    @staticmethod
+    def encode(values: Sequence, order: List[Enum]) -> Sequence[int]:
+        """
+        enum 멤버·문자열 값·정수 코드 배열 → 정수 코드 배열
+
+        정수 코드 ndarray는 범위 확인만 하므로 가장 빠르다 (대량 배치 권장).
+        문자열 ndarray는 유형 값마다 한 번씩 비교하고(정렬 없음), 목록은
+        행마다 dict 조회가 필요하다.
+
+        Raises:
+            ValueError: 알 수 없는 값 또는 범위를 벗어난 코드
+        """
+        # enum 멤버·문자열 값은 한 번의 dict 조회로 변환
+        # (정수 코드는 조회표에 넣지 않음: True·1.0이 코드 1과 같은 키로 조회됨)
+        lookup = {}
+        for code, member in enumerate(order):
+            lookup[member] = code
+            lookup[member.value] = code
+        enum_name = type(order[0]).__name__
+
+        if np is not None and isinstance(values, np.ndarray):
+            if values.dtype.kind in 'iu':
+                if values.size and (values.min() < 0 or values.max() >= len(order)):
+                    raise ValueError(f"{enum_name} 코드 범위 오류")
+                return values.astype(np.int64)
+            if values.dtype.kind == 'U':
+                # 유형 수(최대 6)만큼 벡터 비교, 어느 값과도 같지 않으면 -1
+                codes = np.full(values.shape, -1, dtype=np.int64)
+                for code, member in enumerate(order):
+                    codes[values == member.value] = code
+                unknown = np.flatnonzero(codes < 0)
+                if unknown.size:
+                    raise ValueError(f"{str(values[unknown[0]])!r} is not a valid {enum_name}")
+                return codes
+            values = values.tolist()
+
+        try:
+            codes = [lookup[value] for value in values]
+        except (KeyError, TypeError):
+            # 정수 코드가 섞인 경우 값 단위로 변환 (bool·float 등은 거부)
+            codes = []
+            for value in values:
+                if type(value) is int:
+                    if not 0 <= value < len(order):
+                        raise ValueError(f"{enum_name} 코드 범위 오류")
+                    codes.append(value)
+                elif _is_hashable_key(value, lookup):
+                    codes.append(lookup[value])
+                else:
+                    raise ValueError(f"{value!r} is not a valid {enum_name}")
+
+        return np.asarray(codes, dtype=np.int64) if np is not None else codes
+
     def explain_calculation(self, result: Dict) -> str:
         """계산 과정 설명"""
         explanation = f"""
@@ -163,6 +717,25 @@ class RewardCalculator:
         else:
             return IncomeLevel.HIGH
 
+    def classify_income_deciles(self, income_deciles: Sequence[int]) -> Sequence[int]:
+        """
+        소득 10분위 배열 → 소득 코드 배열 (INCOME_ORDER 순서 인덱스)
+
+        get_income_level로 1~10분위 조회표를 만든 뒤 배열 전체를 한 번에
+        조회한다. 범위를 벗어난 분위는 -1로 표시한다.
+        """
+        table = [-1] + [
+            self.INCOME_ORDER.index(self.get_income_level(decile))
+            for decile in range(1, 11)
+        ]
+
+        if np is not None:
+            deciles = np.asarray(income_deciles, dtype=np.int64)
+            valid = (deciles >= 1) & (deciles <= 10)
+            return np.asarray(table, dtype=np.int64)[np.where(valid, deciles, 0)]
+
+        return [table[d] if 1 <= d <= 10 else -1 for d in income_deciles]
+
     def simulate_rewards(self) -> None:
         """다양한 시나리오 시뮬레이션"""
         print("=" * 80)
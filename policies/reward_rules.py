@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+보상 규칙 엔진
+PRD 2.2: 차등 보상 - 추가 보상 요인
+
+규칙 (정책 파일 "rules" 항목):
+- streak: 연속 참여 일수가 min_days 이상이면 가중치 적용
+- time_of_day: start_hour ≤ 시각 < end_hour 이면 가중치 적용 (자정 넘김 가능)
+- merchant_category: 가맹점 업종이 categories에 포함되면 가중치 적용
+- activity_cap: 행동별 1회 보상 상한
+
+가중치 규칙은 activities 목록으로 대상 행동을 제한할 수 있으며,
+조건이 맞는 규칙의 가중치는 모두 곱한다.
+
+컴파일:
+규칙 목록은 한 번만 해석해 (행동 × 시각), (행동 × 업종), (행동 × 연속 구간)
+정수 가중치 표와 행동별 상한 배열로 펼친다. 평가 시에는 표 조회 3회,
+정수 곱셈·나눗셈 1회, 상한 비교 1회만 수행한다.
+"""
+
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from math import gcd
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 미설치 시 순수 Python 배치 평가
+    np = None
+
+
+BASIS_POINTS = 10000
+HOURS_PER_DAY = 24
+RULE_TYPES = ("streak", "time_of_day", "merchant_category", "activity_cap")
+
+# 규칙 표의 "값 없음" 위치 (시각 미지정 = 24번 칸, 업종 미지정·미등록 = 0번 칸)
+_NO_HOUR = HOURS_PER_DAY
+_NO_MERCHANT = 0
+_NO_CAP = -1
+
+
+@dataclass(frozen=True)
+class CompiledRulePlan:
+    """컴파일된 규칙 평가 계획 (불변)"""
+    hour_factors: Tuple[Tuple[int, ...], ...]      # [행동][시각 0~23, 미지정]
+    merchant_codes: Mapping[str, int]              # 업종 → 열 번호 (1부터)
+    merchant_factors: Tuple[Tuple[int, ...], ...]  # [행동][업종 열]
+    streak_thresholds: Tuple[int, ...]             # 연속 일수 구간 경계 (오름차순)
+    streak_factors: Tuple[Tuple[int, ...], ...]    # [행동][구간]
+    denominator: int
+    caps: Tuple[int, ...]                          # [행동] 1회 상한 (-1 = 없음)
+    max_numerator: int                             # int64 배치 연산 범위 확인용
+
+    def multiplier(
+        self,
+        activity: int,
+        hour: Optional[int] = None,
+        merchant_category: Optional[str] = None,
+        streak_days: Optional[int] = None
+    ) -> int:
+        """규칙 가중치 분자 (분모: denominator)"""
+        return (
+            self.hour_factors[activity][_NO_HOUR if hour is None else hour] *
+            self.merchant_factors[activity][self.merchant_codes.get(merchant_category, _NO_MERCHANT)] *
+            self.streak_factors[activity][
+                0 if streak_days is None else bisect_right(self.streak_thresholds, streak_days)
+            ]
+        )
+
+    def apply(self, amount: int, activity: int, numerator: int) -> int:
+        """가중치 적용 (0 방향 절사) 후 행동별 상한 적용"""
+        scaled = amount * numerator
+        if scaled >= 0:
+            result = scaled // self.denominator
+        else:
+            result = -(-scaled // self.denominator)
+        cap = self.caps[activity]
+        if cap != _NO_CAP and result > cap:
+            return cap
+        return result
+
+    def apply_batch(self, amounts, activity_codes, contexts: Mapping[str, Sequence]):
+        """
+        규칙 일괄 적용
+
+        Args:
+            amounts: 기본 보상 배열
+            activity_codes: 행동 코드 배열
+            contexts: {"hour", "merchant_category", "streak_days"} 열 (없는 열은 미지정)
+
+        Returns:
+            (최종 보상 배열, 가중치 분자 배열)
+        """
+        n = len(amounts)
+        hours = contexts.get("hour")
+        merchants = contexts.get("merchant_category")
+        streaks = contexts.get("streak_days")
+
+        # int64 곱셈이 넘칠 수 있는 금액이면 Python 정수로 계산
+        if np is not None and n and int(max(amounts)) * self.max_numerator < 2 ** 63:
+            activity_codes = np.asarray(activity_codes, dtype=np.int64)
+            hour_index = (
+                np.full(n, _NO_HOUR, dtype=np.int64) if hours is None
+                else self._hour_index_array(hours)
+            )
+            merchant_index = (
+                np.zeros(n, dtype=np.int64) if merchants is None
+                else np.fromiter(
+                    (self.merchant_codes.get(m, _NO_MERCHANT) for m in merchants),
+                    dtype=np.int64, count=n
+                )
+            )
+            streak_index = (
+                np.zeros(n, dtype=np.int64) if streaks is None
+                else np.searchsorted(
+                    np.asarray(self.streak_thresholds, dtype=np.int64),
+                    np.asarray([0 if s is None else s for s in streaks], dtype=np.int64),
+                    side='right'
+                )
+            )
+            numerators = (
+                np.asarray(self.hour_factors, dtype=np.int64)[activity_codes, hour_index] *
+                np.asarray(self.merchant_factors, dtype=np.int64)[activity_codes, merchant_index] *
+                np.asarray(self.streak_factors, dtype=np.int64)[activity_codes, streak_index]
+            )
+            scaled = np.asarray(amounts, dtype=np.int64) * numerators
+            finals = np.where(
+                scaled >= 0, scaled // self.denominator, -(-scaled // self.denominator)
+            )
+            caps = np.asarray(self.caps, dtype=np.int64)[activity_codes]
+            finals = np.where((caps != _NO_CAP) & (finals > caps), caps, finals)
+            return finals, numerators
+
+        numerators = [
+            self.multiplier(
+                activity,
+                None if hours is None else hours[i],
+                None if merchants is None else merchants[i],
+                None if streaks is None else streaks[i]
+            )
+            for i, activity in enumerate(activity_codes)
+        ]
+        finals = [
+            self.apply(amount, activity, numerator)
+            for amount, activity, numerator in zip(amounts, activity_codes, numerators)
+        ]
+        return finals, numerators
+
+    @staticmethod
+    def _hour_index_array(hours: Sequence):
+        """시각 열 → 표 인덱스 (None = 미지정 칸)"""
+        if isinstance(hours, np.ndarray) and hours.dtype.kind in 'iu':
+            return hours.astype(np.int64)
+        return np.asarray([_NO_HOUR if h is None else h for h in hours], dtype=np.int64)
+
+
+def parse_context(context: Optional[Dict]) -> Dict:
+    """
+    요청의 규칙 평가 정보 검증
+
+    Raises:
+        ValueError: 잘못된 시각·연속 일수·업종 값
+    """
+    if not context:
+        return {}
+
+    hour = context.get("hour")
+    if hour is not None and (
+        isinstance(hour, bool) or not isinstance(hour, int) or not 0 <= hour < HOURS_PER_DAY
+    ):
+        raise ValueError(f"잘못된 시각: {hour!r}")
+
+    streak_days = context.get("streak_days")
+    if streak_days is not None and (
+        isinstance(streak_days, bool) or not isinstance(streak_days, int) or streak_days < 0
+    ):
+        raise ValueError(f"잘못된 연속 일수: {streak_days!r}")
+
+    merchant_category = context.get("merchant_category")
+    if merchant_category is not None and not isinstance(merchant_category, str):
+        raise ValueError(f"잘못된 업종: {merchant_category!r}")
+
+    return {
+        "hour": hour,
+        "merchant_category": merchant_category,
+        "streak_days": streak_days
+    }
+
+
+def compile_rules(rules: Sequence[Dict], activity_names: List[str]) -> Optional[CompiledRulePlan]:
+    """
+    규칙 목록 → 평가 계획 컴파일
+
+    Args:
+        rules: 규칙 dict 목록 (정책 파일 "rules")
+        activity_names: 행동 이름 (행동 코드 순서)
+
+    Returns:
+        CompiledRulePlan (규칙이 없으면 None)
+
+    Raises:
+        ValueError: 알 수 없는 규칙 유형·행동 또는 잘못된 값
+    """
+    if not rules:
+        return None
+
+    n_activities = len(activity_names)
+    activity_codes = {name: code for code, name in enumerate(activity_names)}
+
+    time_rules, merchant_rules, streak_rules = [], [], []
+    caps = [_NO_CAP] * n_activities
+    categories: Dict[str, int] = {}
+
+    for rule in rules:
+        if not isinstance(rule, dict):
+            raise ValueError(f"규칙은 객체여야 합니다: {rule!r}")
+        rule_type = rule.get("type")
+        if rule_type not in RULE_TYPES:
+            raise ValueError(f"알 수 없는 규칙 유형: {rule_type}")
+
+        if rule_type == "activity_cap":
+            code = _activity_code(rule.get("activity"), activity_codes)
+            max_amount = rule.get("max_amount")
+            if not isinstance(max_amount, int) or max_amount < 0:
+                raise ValueError(f"잘못된 상한: {max_amount!r}")
+            caps[code] = max_amount if caps[code] == _NO_CAP else min(caps[code], max_amount)
+            continue
+
+        factor = _basis_points(rule.get("multiplier"))
+        targets = rule.get("activities")
+        applies = (
+            [True] * n_activities if targets is None
+            else [False] * n_activities
+        )
+        for name in targets or ():
+            applies[_activity_code(name, activity_codes)] = True
+
+        if rule_type == "time_of_day":
+            start, end = rule.get("start_hour"), rule.get("end_hour")
+            if not all(isinstance(h, int) and 0 <= h <= HOURS_PER_DAY for h in (start, end)):
+                raise ValueError(f"잘못된 시간대: {start}~{end}")
+            if start <= end:
+                hours = set(range(start, end))
+            else:
+                hours = set(range(start, HOURS_PER_DAY)) | set(range(0, end))
+            time_rules.append((applies, factor, hours))
+        elif rule_type == "merchant_category":
+            names = rule.get("categories")
+            if not names:
+                raise ValueError("merchant_category 규칙에 categories가 없습니다.")
+            for name in names:
+                categories.setdefault(name, len(categories) + 1)
+            merchant_rules.append((applies, factor, set(names)))
+        else:
+            min_days = rule.get("min_days")
+            if not isinstance(min_days, int) or min_days < 1:
+                raise ValueError(f"잘못된 연속 일수: {min_days!r}")
+            streak_rules.append((applies, factor, min_days))
+
+    # 행동 × 시각 (마지막 칸: 시각 미지정)
+    hour_table = [
+        [
+            _product(factor if applies[a] and h in hours else BASIS_POINTS
+                     for applies, factor, hours in time_rules)
+            for h in range(HOURS_PER_DAY + 1)
+        ]
+        for a in range(n_activities)
+    ]
+
+    # 행동 × 업종 (0번 칸: 업종 미지정·미등록)
+    merchant_columns = [None] + sorted(categories, key=categories.get)
+    merchant_table = [
+        [
+            _product(factor if applies[a] and category in names else BASIS_POINTS
+                     for applies, factor, names in merchant_rules)
+            for category in merchant_columns
+        ]
+        for a in range(n_activities)
+    ]
+
+    # 행동 × 연속 구간 (구간 i: thresholds[i-1] ≤ 일수 < thresholds[i])
+    thresholds = sorted({min_days for _, _, min_days in streak_rules})
+    streak_table = [
+        [
+            _product(factor if applies[a] and min_days <= floor else BASIS_POINTS
+                     for applies, factor, min_days in streak_rules)
+            for floor in [0] + thresholds
+        ]
+        for a in range(n_activities)
+    ]
+
+    hour_table, hour_den = _reduce(hour_table, BASIS_POINTS ** len(time_rules))
+    merchant_table, merchant_den = _reduce(merchant_table, BASIS_POINTS ** len(merchant_rules))
+    streak_table, streak_den = _reduce(streak_table, BASIS_POINTS ** len(streak_rules))
+
+    return CompiledRulePlan(
+        hour_factors=hour_table,
+        merchant_codes=MappingProxyType(categories),
+        merchant_factors=merchant_table,
+        streak_thresholds=tuple(thresholds),
+        streak_factors=streak_table,
+        denominator=hour_den * merchant_den * streak_den,
+        caps=tuple(caps),
+        max_numerator=(
+            max(map(max, hour_table)) *
+            max(map(max, merchant_table)) *
+            max(map(max, streak_table))
+        )
+    )
+
+
+def _activity_code(name: Optional[str], activity_codes: Dict[str, int]) -> int:
+    """행동 이름 → 코드"""
+    if name not in activity_codes:
+        raise ValueError(f"알 수 없는 행동 유형: {name}")
+    return activity_codes[name]
+
+
+def _basis_points(value) -> int:
+    """가중치 → basis point"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        raise ValueError(f"잘못된 가중치: {value!r}")
+    return round(value * BASIS_POINTS)
+
+
+def _product(factors) -> int:
+    """가중치 곱 (미적용 규칙은 1.0 = BASIS_POINTS)"""
+    result = 1
+    for factor in factors:
+        result *= factor
+    return result
+
+
+def _reduce(table: List[List[int]], denominator: int):
+    """공통 분모 정수 표 → 최대공약수로 약분"""
+    divisor = gcd(denominator, *(value for row in table for value in row))
+    return (
+        tuple(tuple(value // divisor for value in row) for row in table),
+        denominator // divisor
+    )
+
+
+def main():
+    """규칙 평가 벤치마크 (시민 1명당 평가 시간)"""
+    import random
+
+    activity_names = [
+        "basic", "local_food", "public_transport",
+        "energy_saving", "recycling", "carbon_neutral"
+    ]
+    plan = compile_rules([
+        {"type": "streak", "min_days": 7, "multiplier": 1.1},
+        {"type": "streak", "min_days": 30, "multiplier": 1.2},
+        {"type": "time_of_day", "start_hour": 7, "end_hour": 10, "multiplier": 1.1,
+         "activities": ["public_transport"]},
+        {"type": "time_of_day", "start_hour": 22, "end_hour": 6, "multiplier": 1.05,
+         "activities": ["energy_saving"]},
+        {"type": "merchant_category", "categories": ["local_market", "farm"], "multiplier": 1.15},
+        {"type": "activity_cap", "activity": "carbon_neutral", "max_amount": 5000}
+    ], activity_names)
+
+    rng = random.Random(0)
+    n = 200_000
+    amounts = [rng.randint(500, 4000) for _ in range(n)]
+    activities = [rng.randrange(len(activity_names)) for _ in range(n)]
+    hours = [rng.randrange(24) for _ in range(n)]
+    merchants = [rng.choice([None, "local_market", "farm", "cafe"]) for _ in range(n)]
+    streaks = [rng.randrange(60) for _ in range(n)]
+
+    start = time.perf_counter()
+    for i in range(n):
+        plan.apply(
+            amounts[i], activities[i],
+            plan.multiplier(activities[i], hours[i], merchants[i], streaks[i])
+        )
+    scalar = (time.perf_counter() - start) / n
+
+    start = time.perf_counter()
+    plan.apply_batch(amounts, activities, {
+        "hour": hours, "merchant_category": merchants, "streak_days": streaks
+    })
+    batch = (time.perf_counter() - start) / n
+
+    print(f"규칙 6개, 시민 {n:,}명")
+    print(f"  단건 평가: {scalar * 1e6:.2f} µs/시민")
+    print(f"  일괄 평가: {batch * 1e6:.3f} µs/시민 ({'NumPy' if np is not None else 'Python'})")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,12 +12,14 @@ Clawback (C): 자산 회수 권한 - 2-of-2 다중서명
 
 import json
 import os
-from typing import Dict, List, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 from algosdk import account, mnemonic
 from algosdk.transaction import Multisig
 from datetime import datetime
 import hashlib
 
+from services.config_service import ConfigService, shared_config
+
 
 class KeyRole:
     """키 역할 상수"""
@@ -30,12 +32,18 @@ class KeyRole:
 class KeyManagementSystem:
     """M/R/F/C 키 관리 시스템"""
 
-    def __init__(self, config_dir: str = "./config"):
+    def __init__(
+        self,
+        config_dir: str = "./config",
+        config_service: Optional[ConfigService] = None
+    ):
         self.config_dir = config_dir
         os.makedirs(config_dir, exist_ok=True)
 
         self.keys_file = os.path.join(config_dir, "keys_secure.json")
         self.public_keys_file = os.path.join(config_dir, "keys_public.json")
+        # 키 파일은 공유 설정 서비스로 읽음 (변경 시에만 다시 파싱)
+        self.config_service = config_service or shared_config
 
     def generate_key_structure(self) -> Dict:
         """
@@ -158,6 +166,7 @@ class KeyManagementSystem:
         """보안 키 저장 (private keys 포함) - 암호화 권장"""
         with open(self.keys_file, 'w') as f:
             json.dump(key_structure, f, indent=2)
+        self.config_service.invalidate(self.keys_file)
 
         print(f"⚠️  보안 키 파일 저장: {self.keys_file}")
         print(f"   ⚠️  이 파일은 절대 공개하지 마세요!")
@@ -190,29 +199,28 @@ class KeyManagementSystem:
 
         with open(self.public_keys_file, 'w') as f:
             json.dump(public_info, f, indent=2)
+        self.config_service.invalidate(self.public_keys_file)
 
         print(f"✅ 공개 키 파일 저장: {self.public_keys_file}")
 
-    def load_keys(self) -> Dict:
-        """저장된 키 로드"""
-        if not os.path.exists(self.keys_file):
+    def load_keys(self) -> Mapping:
+        """저장된 키 로드 (변경 불가 스냅샷)"""
+        try:
+            return self.config_service.get(self.keys_file).data
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"키 파일이 없습니다. 먼저 generate_key_structure()를 실행하세요."
             )
 
-        with open(self.keys_file, 'r') as f:
-            return json.load(f)
-
-    def load_public_keys(self) -> Dict:
-        """공개 키만 로드"""
-        if not os.path.exists(self.public_keys_file):
+    def load_public_keys(self) -> Mapping:
+        """공개 키만 로드 (변경 불가 스냅샷)"""
+        try:
+            return self.config_service.get(self.public_keys_file).data
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"공개 키 파일이 없습니다."
             )
 
-        with open(self.public_keys_file, 'r') as f:
-            return json.load(f)
-
     def get_role_address(self, role: str) -> str:
         """역할별 주소 반환"""
         keys = self.load_public_keys()
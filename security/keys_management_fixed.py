@@ -7,11 +7,13 @@ PRD 3.2: Key Authority Structure Implementation
 
 import json
 import os
-from typing import Dict, List
+from typing import Dict, List, Mapping, Optional
 from algosdk import account, mnemonic
 from algosdk.transaction import Multisig
 from datetime import datetime
 
+from services.config_service import ConfigService, shared_config
+
 
 class KeyRole:
     """Key role constants"""
@@ -24,12 +26,18 @@ class KeyRole:
 class KeyManagementSystem:
     """M/R/F/C Key Management System"""
 
-    def __init__(self, config_dir: str = "./config"):
+    def __init__(
+        self,
+        config_dir: str = "./config",
+        config_service: Optional[ConfigService] = None
+    ):
         self.config_dir = config_dir
         os.makedirs(config_dir, exist_ok=True)
 
         self.keys_file = os.path.join(config_dir, "keys_secure.json")
         self.public_keys_file = os.path.join(config_dir, "keys_public.json")
+        # Key files are read through the shared config service (re-parsed only on change)
+        self.config_service = config_service or shared_config
 
     def generate_key_structure(self) -> Dict:
         """Generate M/R/F/C key structure according to PRD 3.2"""
@@ -145,6 +153,7 @@ class KeyManagementSystem:
         """Save secure keys (includes private keys)"""
         with open(self.keys_file, 'w', encoding='utf-8') as f:
             json.dump(key_structure, f, indent=2, ensure_ascii=False)
+        self.config_service.invalidate(self.keys_file)
 
         print(f"\n[WARNING] Secure keys saved: {self.keys_file}")
         print("  [WARNING] NEVER commit this file to Git!")
@@ -177,18 +186,17 @@ class KeyManagementSystem:
 
         with open(self.public_keys_file, 'w', encoding='utf-8') as f:
             json.dump(public_info, f, indent=2, ensure_ascii=False)
+        self.config_service.invalidate(self.public_keys_file)
 
         print(f"[OK] Public keys saved: {self.public_keys_file}")
 
-    def load_keys(self) -> Dict:
-        """Load saved keys"""
-        with open(self.keys_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+    def load_keys(self) -> Mapping:
+        """Load saved keys (immutable snapshot)"""
+        return self.config_service.get(self.keys_file).data
 
-    def load_public_keys(self) -> Dict:
-        """Load public keys only"""
-        with open(self.public_keys_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+    def load_public_keys(self) -> Mapping:
+        """Load public keys only (immutable snapshot)"""
+        return self.config_service.get(self.public_keys_file).data
 
     def export_for_asa_creation(self) -> Dict:
         """Export keys for ASA creation"""
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공유 설정 서비스 (mtime 기반 무효화)
+
+설정 JSON 파일(asa_config.json, accounts_config.json, keys_*.json)을
+프로세스에서 한 번만 읽고 변경 불가 스냅샷으로 공유한다.
+
+- 파일별로 check_interval마다 최대 한 번 os.stat (mtime_ns·크기·inode 비교)
+- 변경이 확인된 경우에만 다시 파싱, 간격 안의 조회는 파일시스템 호출 없음
+- 파싱 실패(쓰기 도중 등) 시 이전 스냅샷 유지
+- 파일 없음도 간격 동안 캐시 (반복 조회 시 매번 stat하지 않음)
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Tuple
+
+
+DEFAULT_CHECK_INTERVAL = 1.0  # 초
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """설정 파일 스냅샷 (변경 불가)"""
+    path: str
+    data: Mapping[str, Any]   # 중첩 dict는 MappingProxyType, list는 tuple
+    version: int              # 같은 경로에서 다시 읽을 때마다 1씩 증가
+    mtime_ns: int
+    loaded_at: float          # time.time()
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """수정 가능한 사본 (JSON 직렬화용)"""
+        return _thaw(self.data)
+
+
+class _Entry(NamedTuple):
+    """경로별 캐시 항목 (교체 방식으로 갱신)"""
+    snapshot: Optional[ConfigSnapshot]
+    signature: Optional[Tuple[int, int, int]]
+    next_check: float
+    missing: bool
+
+
+class ConfigService:
+    """설정 파일 스냅샷 캐시"""
+
+    def __init__(
+        self,
+        check_interval: float = DEFAULT_CHECK_INTERVAL,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            check_interval: 파일 변경 확인 간격 (초, 0이면 매 조회 확인)
+            clock: 단조 시계 (테스트용)
+        """
+        if check_interval < 0:
+            raise ValueError("check_interval은 0 이상이어야 합니다.")
+
+        self.check_interval = check_interval
+        self._clock = clock
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._checks = 0
+        self._loads = 0
+
+    def get(self, path: str) -> ConfigSnapshot:
+        """
+        설정 스냅샷 조회
+
+        Raises:
+            FileNotFoundError: 파일 없음
+            ValueError: 최초 로드 시 JSON 형식 오류
+        """
+        entry = self._entries.get(path)
+        if entry is not None and self._clock() < entry.next_check:
+            return self._result(path, entry)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            now = self._clock()
+            if entry is None or now >= entry.next_check:
+                entry = self._refresh(path, entry, now)
+                self._entries[path] = entry
+        return self._result(path, entry)
+
+    def invalidate(self, path: Optional[str] = None):
+        """다음 조회 시 파일을 다시 확인 (path=None이면 전체)"""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+    def stats(self) -> Dict:
+        """캐시 통계 (파일 수, stat 호출 수, 파싱 횟수)"""
+        return {
+            "files": len(self._entries),
+            "checks": self._checks,
+            "loads": self._loads,
+            "check_interval": self.check_interval
+        }
+
+    @staticmethod
+    def _result(path: str, entry: _Entry) -> ConfigSnapshot:
+        if entry.missing:
+            raise FileNotFoundError(f"설정 파일 없음: {path}")
+        return entry.snapshot
+
+    def _refresh(self, path: str, entry: Optional[_Entry], now: float) -> _Entry:
+        """stat으로 변경 확인 후 필요할 때만 다시 파싱 (_lock 보유 상태)"""
+        next_check = now + self.check_interval
+        previous = entry.snapshot if entry is not None else None
+
+        self._checks += 1
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return _Entry(None, None, next_check, True)
+
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if entry is not None and entry.signature == signature:
+            return entry._replace(next_check=next_check)
+
+        self._loads += 1
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except ValueError as e:
+            if previous is None:
+                raise ValueError(f"설정 파일 형식 오류: {path}: {e}")
+            # 쓰는 도중일 수 있으므로 이전 스냅샷 유지 (같은 내용이면 다시 파싱하지 않음)
+            print(f"[WARN] Config {path} unreadable, keeping version {previous.version}: {e}")
+            return _Entry(previous, signature, next_check, False)
+
+        snapshot = ConfigSnapshot(
+            path=path,
+            data=_freeze(data),
+            version=previous.version + 1 if previous is not None else 1,
+            mtime_ns=st.st_mtime_ns,
+            loaded_at=time.time()
+        )
+        return _Entry(snapshot, signature, next_check, False)
+
+
+def _freeze(value: Any) -> Any:
+    """JSON 값 → 변경 불가 구조"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """변경 불가 구조 → JSON 값"""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+# 프로세스 공용 인스턴스 (API·검증기·키 관리가 같은 스냅샷을 공유)
+shared_config = ConfigService()
+
+
+def main():
+    """스냅샷 조회 예시 (python -m services.config_service <file.json>)"""
+    import sys
+    if len(sys.argv) < 2:
+        print("사용법: python -m services.config_service <file.json>")
+        return
+
+    snapshot = shared_config.get(sys.argv[1])
+    for _ in range(100_000):
+        shared_config.get(sys.argv[1])
+    print(json.dumps(snapshot.to_dict(), indent=2, ensure_ascii=False))
+    print(f"version={snapshot.version} stats={shared_config.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+algod 조회 캐시 테스트
+"""
+
+import sys
+sys.path.append("..")
+
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from contracts.algod_cache import CachedAlgodClient, TTLCache
+from benchmarks.hot_paths import LocalLedger
+
+
+class FakeClock:
+    """수동 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingLedger(LocalLedger):
+    """호출 횟수를 세는 메모리 원장"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = {}
+
+    def _count(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def asset_info(self, asset_id):
+        self._count("asset_info")
+        return super().asset_info(asset_id)
+
+    def account_info(self, address):
+        self._count("account_info")
+        return super().account_info(address)
+
+    def status(self):
+        return {"last-round": 42}
+
+
+class TestCachedAlgodClient:
+    """TTL·무효화·위임 테스트"""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.ledger = CountingLedger(asset_id=7, total=100, holdings={"ADDR": 40})
+        self.client = CachedAlgodClient(self.ledger, clock=self.clock)
+
+    def test_per_kind_ttl(self):
+        """자산 파라미터는 길게, 잔액은 짧게 캐시"""
+        for _ in range(10):
+            self.client.asset_info(7)
+            self.client.account_info("ADDR")
+        assert self.ledger.calls == {"asset_info": 1, "account_info": 1}
+
+        self.clock.now = 5.0
+        self.client.asset_info(7)
+        self.client.account_info("ADDR")
+        assert self.ledger.calls == {"asset_info": 1, "account_info": 2}
+
+        stats = self.client.cache_stats()
+        assert stats["hits"] == 19
+        assert stats["misses"] == 3
+
+    def test_invalidate_account(self):
+        """전송 후 계정 캐시 제거"""
+        assert self.client.account_info("ADDR")["assets"][0]["amount"] == 40
+        self.ledger.holdings["ADDR"] = 10
+        assert self.client.account_info("ADDR")["assets"][0]["amount"] == 40
+
+        self.client.invalidate_account("ADDR")
+        assert self.client.account_info("ADDR")["assets"][0]["amount"] == 10
+
+    def test_uncached_methods_delegate(self):
+        """캐시 대상이 아닌 메서드는 원래 클라이언트로 위임"""
+        assert self.client.status() == {"last-round": 42}
+
+    def test_unknown_ttl_kind(self):
+        with pytest.raises(ValueError):
+            CachedAlgodClient(self.ledger, ttls={"block_info": 1.0})
+
+
+class TestTTLCache:
+    """LRU·요청 병합 테스트"""
+
+    def test_lru_eviction(self):
+        """상한 초과 시 가장 오래 쓰지 않은 항목 제거"""
+        cache = TTLCache(max_entries=2)
+        cache.get_or_load("a", 60, lambda: 1)
+        cache.get_or_load("b", 60, lambda: 2)
+        cache.get_or_load("a", 60, lambda: 0)   # a 최근 사용
+        cache.get_or_load("c", 60, lambda: 3)   # b 제거
+
+        assert cache.get_or_load("a", 60, lambda: -1) == 1
+        assert cache.get_or_load("b", 60, lambda: -2) == -2
+        assert cache.stats()["evictions"] == 2
+
+    def test_single_flight(self):
+        """같은 키 동시 조회는 loader 1회"""
+        cache = TTLCache()
+        release = threading.Event()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            release.wait(5)
+            return "value"
+
+        with ThreadPoolExecutor(max_workers=20) as pool:
+            futures = [pool.submit(cache.get_or_load, "k", 60, loader) for _ in range(20)]
+            while cache.stats()["coalesced"] < 19:
+                pass
+            release.set()
+            assert [f.result() for f in futures] == ["value"] * 20
+        assert len(calls) == 1
+
+    def test_errors_shared_not_cached(self):
+        """loader 예외는 캐시하지 않음"""
+        cache = TTLCache()
+
+        def failing():
+            raise ConnectionError("algod down")
+
+        with pytest.raises(ConnectionError):
+            cache.get_or_load("k", 60, failing)
+        assert cache.get_or_load("k", 60, lambda: "ok") == "ok"
+        assert cache.stats()["errors"] == 1
+
+    def test_invalidate_during_load_not_cached(self):
+        """조회 중 무효화된 결과는 캐시하지 않음"""
+        cache = TTLCache()
+
+        def loader():
+            cache.invalidate()
+            return "stale"
+
+        assert cache.get_or_load("k", 60, loader) == "stale"
+        assert cache.get_or_load("k", 60, lambda: "fresh") == "fresh"
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기 algod 클라이언트·비동기 조회 캐시 테스트
+"""
+
+import sys
+sys.path.append("..")
+
+import asyncio
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from algosdk.error import AlgodHTTPError, ConfirmationTimeoutError
+from contracts.algod_cache import AsyncCachedAlgodClient, TTLCache
+from contracts.async_algod import AsyncAlgodClient
+
+
+ADDRESS = "A" * 58
+
+
+def make_client(handler, **kwargs) -> AsyncAlgodClient:
+    return AsyncAlgodClient("token", "http://algod", transport=httpx.MockTransport(handler), **kwargs)
+
+
+class TestAsyncAlgodClient:
+    """REST 호출·오류 변환"""
+
+    def test_get_with_token_header(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"asset-holding": {"amount": 7}})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.account_asset_info(ADDRESS, 1001)
+
+        assert asyncio.run(run()) == {"asset-holding": {"amount": 7}}
+        assert seen[0].url.path == f"/v2/accounts/{ADDRESS}/assets/1001"
+        assert seen[0].headers["X-Algo-API-Token"] == "token"
+
+    def test_http_error_code(self):
+        def handler(request):
+            return httpx.Response(404, json={"message": "account asset info not found"})
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.account_asset_info(ADDRESS, 1001)
+
+        with pytest.raises(AlgodHTTPError) as exc:
+            asyncio.run(run())
+        assert exc.value.code == 404
+        assert "not found" in str(exc.value)
+
+    def test_suggested_params(self):
+        def handler(request):
+            return httpx.Response(200, json={
+                "fee": 0, "last-round": 500, "genesis-hash": "SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=",
+                "genesis-id": "testnet-v1.0", "consensus-version": "v1", "min-fee": 1000
+            })
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.suggested_params()
+
+        params = asyncio.run(run())
+        assert (params.first, params.last, params.min_fee) == (500, 1500, 1000)
+
+    def test_send_raw_transaction(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"txId": "TX1"})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.send_raw_transaction(b"\x81\xa3sig")
+
+        assert asyncio.run(run()) == "TX1"
+        assert seen[0].headers["Content-Type"] == "application/x-binary"
+        assert seen[0].content == b"\x81\xa3sig"
+
+    def test_wait_for_confirmation(self):
+        state = {"round": 100}
+
+        def handler(request):
+            path = request.url.path
+            if path == "/v2/status":
+                return httpx.Response(200, json={"last-round": state["round"]})
+            if path.startswith("/v2/status/wait-for-block-after/"):
+                state["round"] += 1
+                return httpx.Response(200, json={"last-round": state["round"]})
+            # 두 라운드 뒤 확정, 그 전에는 404 (다른 노드로 간 요청)
+            if state["round"] < 102:
+                return httpx.Response(404, json={"message": "txn not found"})
+            return httpx.Response(200, json={"confirmed-round": 102})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.wait_for_confirmation("TX1", wait_rounds=4)
+
+        assert asyncio.run(run())["confirmed-round"] == 102
+
+    def test_wait_for_confirmation_timeout(self):
+        def handler(request):
+            if request.url.path.startswith("/v2/transactions/pending/"):
+                return httpx.Response(200, json={"confirmed-round": 0, "pool-error": ""})
+            return httpx.Response(200, json={"last-round": 100})
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.wait_for_confirmation("TX1", wait_rounds=2)
+
+        with pytest.raises(ConfirmationTimeoutError):
+            asyncio.run(run())
+
+
+class TestAsyncTTLCache:
+    """코루틴 요청 병합"""
+
+    def test_single_flight(self):
+        cache = TTLCache()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"amount": 5}
+
+        async def run():
+            return await asyncio.gather(*(cache.get_or_load_async("k", 10.0, loader) for _ in range(100)))
+
+        results = asyncio.run(run())
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+        stats = cache.stats()
+        assert (stats["misses"], stats["coalesced"], stats["size"]) == (1, 99, 1)
+
+    def test_errors_shared_not_cached(self):
+        cache = TTLCache()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0)
+            raise AlgodHTTPError("boom", 500)
+
+        async def run():
+            return await asyncio.gather(
+                *(cache.get_or_load_async("k", 10.0, loader) for _ in range(10)),
+                return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+        assert len(calls) == 1
+        assert all(isinstance(r, AlgodHTTPError) for r in results)
+        assert cache.stats()["size"] == 0
+        assert cache.stats()["errors"] == 1
+
+    def test_cancelled_waiter_does_not_cancel_load(self):
+        cache = TTLCache()
+
+        async def loader():
+            await asyncio.sleep(0.05)
+            return 42
+
+        async def run():
+            impatient = asyncio.ensure_future(cache.get_or_load_async("k", 10.0, loader))
+            patient = asyncio.ensure_future(cache.get_or_load_async("k", 10.0, loader))
+            await asyncio.sleep(0.01)
+            impatient.cancel()
+            return await patient
+
+        assert asyncio.run(run()) == 42
+        assert cache.stats()["size"] == 1
+
+    def test_invalidate_during_load_not_cached(self):
+        cache = TTLCache()
+
+        async def loader():
+            await asyncio.sleep(0.01)
+            return 1
+
+        async def run():
+            task = asyncio.ensure_future(cache.get_or_load_async(("account_info", ADDRESS), 10.0, loader))
+            await asyncio.sleep(0)
+            cache.invalidate(lambda key: key[1] == ADDRESS)
+            return await task
+
+        assert asyncio.run(run()) == 1
+        assert cache.stats()["size"] == 0
+
+
+class TestAsyncCachedAlgodClient:
+    """비동기 캐시 프록시"""
+
+    def test_cached_and_invalidated(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, json={"asset-holding": {"amount": len(calls)}})
+
+        async def run():
+            client = AsyncCachedAlgodClient(make_client(handler))
+            first = await client.account_asset_info(ADDRESS, 1001)
+            cached = await client.account_asset_info(ADDRESS, 1001)
+            client.invalidate_account(ADDRESS)
+            refreshed = await client.account_asset_info(ADDRESS, 1001)
+            await client.aclose()
+            return first, cached, refreshed
+
+        first, cached, refreshed = asyncio.run(run())
+        assert first is cached
+        assert refreshed["asset-holding"]["amount"] == 2
+        assert len(calls) == 2
+
+    def test_unknown_ttl_kind(self):
+        with pytest.raises(ValueError):
+            AsyncCachedAlgodClient(object(), ttls={"status": 1.0})
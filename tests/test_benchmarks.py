@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+마이크로 벤치마크 도구 테스트
+"""
+
+import sys
+sys.path.append("..")
+
+from benchmarks.hot_paths import (
+    LocalLedger,
+    bench_reserve,
+    compare,
+    load_baseline,
+    save_baseline
+)
+
+
+class TestBenchmarkBaseline:
+    """기준선 비교 테스트"""
+
+    def test_compare_flags_only_regressions_over_threshold(self):
+        """허용 비율을 넘게 느려진 항목만 회귀"""
+        baseline = {"a": 1.0, "b": 1.0, "c": 1.0}
+        results = {"a": 1.2, "b": 1.5, "c": 0.5, "new": 9.0}
+
+        regressions = compare(results, baseline, threshold=0.25)
+        assert [r["name"] for r in regressions] == ["b"]
+        assert regressions[0]["ratio"] == 1.5
+
+    def test_baseline_round_trip(self, tmp_path):
+        """기준선 저장·로드"""
+        path = str(tmp_path / "baseline.json")
+        assert load_baseline(path) is None
+
+        save_baseline(path, {"x": 2e-6})
+        data = load_baseline(path)
+        assert data["results"] == {"x": 2e-6}
+        assert data["unit"] == "seconds_per_op"
+
+    def test_reserve_suite_runs_offline(self):
+        """소규모 적재로 발급·검증 측정 항목 생성"""
+        results = bench_reserve(200, repeat=1)
+        assert set(results) == {
+            "reserve.check_issuance_allowed[200]",
+            "reserve.record_issuance[200]",
+            "reserve.get_top_recipients[200]",
+            "invariants.verify_limit_compliance[200]"
+        }
+        assert all(seconds > 0 for seconds in results.values())
+
+
+class TestLocalLedger:
+    """메모리 원장 대역 테스트"""
+
+    def test_algod_response_shape(self):
+        """algod 응답과 같은 키 구조"""
+        ledger = LocalLedger(asset_id=7, total=100, holdings={"ADDR": 40})
+        assert ledger.asset_info(7)["params"]["total"] == 100
+        assert ledger.account_info("ADDR")["assets"] == [
+            {"asset-id": 7, "amount": 40, "is-frozen": False}
+        ]
+        assert ledger.account_info("OTHER")["assets"] == []
+        assert ledger.account_asset_info("ADDR", 7)["asset-holding"]["amount"] == 40
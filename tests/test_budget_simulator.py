@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+예산 소진 시뮬레이터 테스트
+"""
+
+import sys
+sys.path.append("..")
+
+import pytest
+import policies.budget_simulator as simulator_module
+from contracts.reserve_storage import BudgetAllocation
+from policies.budget_simulator import BudgetSimulator, PopulationDistribution
+from policies.reward_calculator import RewardCalculator
+
+
+def make_allocation(remaining: int, per_person_limit: int) -> BudgetAllocation:
+    return BudgetAllocation(
+        allocation_id="SIM-TEST",
+        period="2025-Q1",
+        total_budget=remaining,
+        allocated=0,
+        remaining=remaining,
+        per_person_limit=per_person_limit,
+        created_at="2025-01-01T00:00:00"
+    )
+
+
+class TestBudgetSimulator:
+    """예산 소진 시뮬레이터 테스트"""
+
+    def test_trial_burn_down(self):
+        """고정 수요의 소진일·한도 도달 인원"""
+        simulator = BudgetSimulator(
+            RewardCalculator(), make_allocation(remaining=900, per_person_limit=500),
+            period_days=10
+        )
+        # 일자별 누적: 100×d/10 + min(500×d/10, 500) + 500 (한도 초과 수요)
+        trial = simulator._evaluate_trial([100, 500, 2000], (50,))
+
+        assert trial["limit_hits"] == 2
+        assert trial["total_demand"] == 2600
+        assert trial["total_issued"] == 900
+        assert trial["exhaustion_day"] == 7
+        assert trial["citizen_percentiles"] == [500]
+
+    def test_numpy_and_python_trials_match(self, monkeypatch):
+        """NumPy·순수 Python 집계 결과 동일"""
+        np = pytest.importorskip("numpy")
+        simulator = BudgetSimulator(
+            RewardCalculator(), make_allocation(remaining=50_000, per_person_limit=1_500)
+        )
+        demands = np.random.default_rng(7).integers(0, 3000, size=500)
+
+        vectorized = simulator._evaluate_trial(demands, (10, 50, 90))
+        monkeypatch.setattr(simulator_module, "np", None)
+        scalar = simulator._evaluate_trial(demands.tolist(), (10, 50, 90))
+
+        assert vectorized["exhaustion_day"] == scalar["exhaustion_day"]
+        assert vectorized["limit_hits"] == scalar["limit_hits"]
+        assert vectorized["total_issued"] == scalar["total_issued"]
+        assert vectorized["citizen_percentiles"] == pytest.approx(scalar["citizen_percentiles"])
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_run_report(self, monkeypatch, use_numpy):
+        """시뮬레이션 보고서 (재현성, 예산 상한)"""
+        if not use_numpy:
+            monkeypatch.setattr(simulator_module, "np", None)
+        elif simulator_module.np is None:
+            pytest.skip("NumPy 미설치")
+
+        simulator = BudgetSimulator(
+            RewardCalculator(),
+            make_allocation(remaining=100_000, per_person_limit=800),
+            PopulationDistribution(base_amount=100)
+        )
+        report = simulator.run(n_citizens=2_000, n_trials=5, seed=1)
+
+        assert report == simulator.run(n_citizens=2_000, n_trials=5, seed=1)
+        assert report["policy_version"] == RewardCalculator.BUILTIN_POLICY_VERSION
+        assert report["exhaustion_probability"] == 1.0
+        assert 1 <= report["exhaustion_day"]["p50"] <= 90
+        assert report["total_issued"]["p99"] <= 100_000
+        assert 0 < report["limit_hit_users"]["mean"] < 2_000
+        assert report["per_citizen_issued"]["p99"] <= 800
+
+    def test_budget_not_exhausted(self):
+        """예산이 충분하면 소진되지 않음"""
+        simulator = BudgetSimulator(
+            RewardCalculator(), make_allocation(remaining=10 ** 12, per_person_limit=10 ** 6)
+        )
+        report = simulator.run(n_citizens=500, n_trials=3, seed=3)
+
+        assert report["exhaustion_probability"] == 0.0
+        assert report["exhaustion_day"] is None
+        assert report["limit_hit_users"]["mean"] == 0
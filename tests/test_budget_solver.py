@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+예산 제약 보상 조정 테스트
+"""
+
+import sys
+sys.path.append("..")
+
+import random
+
+import pytest
+from policies.budget_solver import fit_to_budget
+
+
+class TestBudgetSolver:
+    """예산 제약 보상 조정 테스트"""
+
+    def test_within_budget_unchanged(self):
+        """예산 이내면 그대로 지급"""
+        result = fit_to_budget([100, 200], 1000, method="uniform")
+
+        assert result.amounts == [100, 200]
+        assert result.factor == 1.0
+
+    def test_uniform_scaling(self):
+        """비율 조정 + 나머지 큰 순서로 1씩 배분"""
+        result = fit_to_budget([1000, 2000, 3000], 1000, method="uniform")
+
+        # 정확한 비율: 166.67, 333.33, 500
+        assert result.amounts == [167, 333, 500]
+        assert result.total == 1000
+
+    def test_water_fill_cap(self):
+        """상한 이하 보상은 그대로, 나머지는 동일 상한"""
+        result = fit_to_budget([100, 500, 3000, 4000], 3000, method="water_fill")
+
+        assert result.cap == 1200
+        assert result.amounts == [100, 500, 1200, 1200]
+
+    def test_caps_respected(self):
+        """행별 상한(1인 한도 잔여분) 적용"""
+        result = fit_to_budget([1000, 1000, 1000], 1500, caps=[100, 5000, 5000])
+
+        assert result.amounts == [100, 700, 700]
+
+    def test_remainder_tie_break_deterministic(self):
+        """남는 단위는 정렬 키 순서로 배분"""
+        result = fit_to_budget([10, 10, 10], 20, tie_keys=["c", "a", "b"])
+
+        assert result.amounts == [6, 7, 7]
+
+    @pytest.mark.parametrize("method", ["uniform", "water_fill"])
+    def test_random_batches_exhaust_budget(self, method):
+        """예산 정확히 소진, 원래 보상·상한 초과 없음"""
+        rng = random.Random(5)
+        for _ in range(50):
+            demands = [rng.randint(0, 5000) for _ in range(rng.randint(1, 200))]
+            caps = [rng.randint(0, 5000) for _ in demands]
+            budget = rng.randint(0, sum(demands))
+            result = fit_to_budget(demands, budget, caps=caps, method=method)
+
+            capped = [min(d, c) for d, c in zip(demands, caps)]
+            assert sum(result.amounts) == min(budget, sum(capped))
+            assert all(0 <= a <= c for a, c in zip(result.amounts, capped))
+
+    def test_unknown_method(self):
+        """알 수 없는 방식"""
+        with pytest.raises(ValueError):
+            fit_to_budget([100], 50, method="greedy")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시민 속성 수집 테스트
+"""
+
+import sys
+sys.path.append("..")
+
+import pytest
+import policies.citizen_ingest as ingest_module
+import policies.reward_calculator as reward_module
+from policies.citizen_ingest import CitizenIngestor
+from policies.reward_calculator import (
+    RewardCalculator,
+    IncomeLevel,
+    RegionType,
+    ActivityType
+)
+
+
+FEED = """user_id,income_decile,region_code,activity_code,base_amount
+user001,2,rural,carbon_neutral,1000
+user002,11,urban,basic,1000
+
+user003,5,SUBURBAN,local_food,
+user004,9,downtown,basic,500
+user005,7,urban,flying,500
+user006,1,urban,basic,-3
+user007,3,urban
+user008,10,urban,recycling,2000
+"""
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def numpy_mode(request, monkeypatch):
+    """NumPy 사용·미사용 두 경우 모두 확인"""
+    if request.param:
+        if ingest_module.np is None:
+            pytest.skip("NumPy 미설치")
+    else:
+        monkeypatch.setattr(ingest_module, "np", None)
+        monkeypatch.setattr(reward_module, "np", None)
+    return request.param
+
+
+class TestCitizenIngest:
+    """시민 속성 수집 테스트"""
+
+    def test_classify_income_deciles(self):
+        """분위 일괄 분류 = get_income_level, 범위 밖은 -1"""
+        calculator = RewardCalculator()
+        codes = list(calculator.classify_income_deciles([0, 1, 3, 4, 7, 8, 10, 11]))
+
+        expected = [
+            RewardCalculator.INCOME_ORDER.index(calculator.get_income_level(d))
+            for d in (1, 3, 4, 7, 8, 10)
+        ]
+        assert codes == [-1] + expected + [-1]
+
+    def test_rejects_bad_rows_with_line_numbers(self, tmp_path, numpy_mode):
+        """잘못된 행은 파일 줄 번호와 함께 제외"""
+        path = tmp_path / "feed.csv"
+        path.write_text(FEED)
+        ingestor = CitizenIngestor(RewardCalculator(), chunk_size=3)
+
+        chunks = list(ingestor.iter_rewards(str(path)))
+        accepted = [
+            (line, user, int(amount))
+            for chunk, rewards in chunks
+            for line, user, amount in zip(
+                chunk.line_numbers, chunk.user_ids, rewards["final_amounts"]
+            )
+        ]
+        rejected = [(r["line"], r["user_id"]) for chunk, _ in chunks for r in chunk.rejected]
+
+        assert accepted == [
+            (2, "user001", 3900),
+            (5, "user003", 1656),
+            (10, "user008", 3000)
+        ]
+        assert rejected == [
+            (3, "user002"), (6, "user004"), (7, "user005"), (8, "user006"), (9, "user007")
+        ]
+        assert "소득 분위" in chunks[0][0].rejected[0]["error"]
+
+    def test_custom_codes_and_default_base(self, tmp_path, numpy_mode):
+        """원천 코드 매핑, base_amount 열 없으면 기본값"""
+        path = tmp_path / "feed.csv"
+        path.write_text("user_id,income_decile,region_code,activity_code\nu1,1,R3,A6\n")
+        ingestor = CitizenIngestor(
+            RewardCalculator(),
+            default_base_amount=100,
+            region_codes={"R1": RegionType.URBAN, "R2": RegionType.SUBURBAN, "R3": RegionType.RURAL},
+            activity_codes={f"A{i + 1}": activity for i, activity in enumerate(ActivityType)}
+        )
+
+        (chunk, rewards), = ingestor.iter_rewards(str(path))
+        assert list(map(int, rewards["final_amounts"])) == [390]
+
+    def test_rejects_amount_outside_int64(self, tmp_path, numpy_mode):
+        """int64 범위를 넘는 기본 보상은 해당 행만 제외"""
+        path = tmp_path / "feed.csv"
+        path.write_text(
+            "user_id,income_decile,region_code,activity_code,base_amount\n"
+            "u1,5,urban,basic,99999999999999999999\n"
+            "u2,5,urban,basic,1000\n"
+        )
+
+        (chunk, rewards), = CitizenIngestor(RewardCalculator()).iter_rewards(str(path))
+        assert chunk.user_ids == ["u2"]
+        assert len(rewards["final_amounts"]) == 1
+        assert chunk.rejected[0]["line"] == 2
+        assert "기본 보상" in chunk.rejected[0]["error"]
+
+    def test_missing_column(self, tmp_path):
+        """필수 열 누락"""
+        path = tmp_path / "feed.csv"
+        path.write_text("user_id,income_decile\nu1,1\n")
+
+        with pytest.raises(ValueError):
+            list(CitizenIngestor(RewardCalculator()).iter_chunks(str(path)))
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공유 설정 서비스 테스트
+"""
+
+import sys
+sys.path.append("..")
+
+import json
+import os
+import pytest
+from services.config_service import ConfigService
+
+
+class FakeClock:
+    """수동 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestConfigService:
+    """mtime 무효화 스냅샷 테스트"""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.service = ConfigService(check_interval=1.0, clock=self.clock)
+
+    def write(self, path, data):
+        with open(path, 'w') as f:
+            json.dump(data, f)
+
+    def test_at_most_one_stat_per_interval(self, tmp_path):
+        """간격 안의 조회는 파일을 확인하지 않음"""
+        path = str(tmp_path / "asa_config.json")
+        self.write(path, {"asset_id": 1})
+
+        first = self.service.get(path)
+        for _ in range(100):
+            assert self.service.get(path) is first
+        assert self.service.stats()["checks"] == 1
+
+        self.clock.now = 1.5
+        assert self.service.get(path) is first
+        stats = self.service.stats()
+        assert stats["checks"] == 2
+        assert stats["loads"] == 1
+
+    def test_reload_on_change(self, tmp_path):
+        """파일 변경은 다음 확인 시점에 반영"""
+        path = str(tmp_path / "asa_config.json")
+        self.write(path, {"asset_id": 1})
+        assert self.service.get(path)["asset_id"] == 1
+
+        self.write(path, {"asset_id": 22})
+        os.utime(path, ns=(1, 1))
+        assert self.service.get(path)["asset_id"] == 1  # 간격 안
+
+        self.clock.now = 2.0
+        snapshot = self.service.get(path)
+        assert snapshot["asset_id"] == 22
+        assert snapshot.version == 2
+
+    def test_snapshot_is_immutable(self, tmp_path):
+        """중첩 구조까지 변경 불가, to_dict는 사본"""
+        path = str(tmp_path / "accounts_config.json")
+        self.write(path, {"citizen_addresses": ["A", "B"], "nested": {"x": 1}})
+
+        snapshot = self.service.get(path)
+        assert snapshot["citizen_addresses"] == ("A", "B")
+        with pytest.raises(TypeError):
+            snapshot.data["nested"]["x"] = 2
+        copy = snapshot.to_dict()
+        copy["nested"]["x"] = 2
+        assert snapshot["nested"]["x"] == 1
+        assert json.loads(json.dumps(copy))["citizen_addresses"] == ["A", "B"]
+
+    def test_invalid_json_keeps_previous(self, tmp_path):
+        """쓰기 도중 등 형식 오류 시 이전 스냅샷 유지"""
+        path = str(tmp_path / "asa_config.json")
+        self.write(path, {"asset_id": 1})
+        previous = self.service.get(path)
+
+        with open(path, 'w') as f:
+            f.write('{"asset_id": ')
+        self.clock.now = 2.0
+        assert self.service.get(path) is previous
+
+        broken = str(tmp_path / "broken.json")
+        with open(broken, 'w') as f:
+            f.write("{")
+        with pytest.raises(ValueError):
+            self.service.get(broken)
+
+    def test_missing_file_cached_until_interval(self, tmp_path):
+        """파일 없음도 간격 동안 캐시, invalidate 시 즉시 재확인"""
+        path = str(tmp_path / "asa_config.json")
+        for _ in range(3):
+            with pytest.raises(FileNotFoundError):
+                self.service.get(path)
+        assert self.service.stats()["checks"] == 1
+
+        self.write(path, {"asset_id": 7})
+        with pytest.raises(FileNotFoundError):
+            self.service.get(path)
+        self.service.invalidate(path)
+        assert self.service.get(path)["asset_id"] == 7
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기 쿠폰 API 발급 테스트 (온체인 전송은 대체 함수 사용)
+"""
+
+import sys
+sys.path.append("..")
+
+import asyncio
+import functools
+import importlib
+import json
+import httpx
+import pytest
+from contracts.reserve_manager import ReserveManager
+
+
+TX_ID = "TXSENT"
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    """비동기 API 모듈 (예산 저장소는 임시 디렉토리)"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "config").mkdir()
+    module = importlib.import_module("api.coupon_api_async")
+    manager = ReserveManager(config_file=str(tmp_path / "budget_config.json"))
+    monkeypatch.setattr(module, "reserve_manager", manager)
+    monkeypatch.setattr(sys.modules["api.coupon_api"], "reserve_manager", manager)
+
+    async def send_from_reserve(recipient_address, amount, asset_id):
+        return TX_ID
+
+    monkeypatch.setattr(module, "send_from_reserve", send_from_reserve)
+    monkeypatch.setattr(module.shared_config, "get", lambda path: {"asset_id": 7})
+    return module
+
+
+def issue_request() -> dict:
+    return {"body": json.dumps({"user_id": "user001", "base_amount": 100}).encode()}
+
+
+class TestIssueCoupon:
+    """예약 → 전송 → 기록 순서 테스트"""
+
+    def test_cancel_after_send_still_records(self, api, monkeypatch):
+        """전송 후 요청이 취소되어도 tx_id로 기록"""
+        confirming = None
+
+        async def confirm_transfer(tx_id, recipient_address):
+            confirming.set()
+            await asyncio.sleep(10)
+
+        monkeypatch.setattr(api, "confirm_transfer", confirm_transfer)
+
+        async def cancel_while_confirming():
+            nonlocal confirming
+            confirming = asyncio.Event()
+            task = asyncio.ensure_future(api.issue_coupon(issue_request()))
+            await confirming.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_while_confirming())
+
+        records = list(api.reserve_manager.issuance_records)
+        assert [r.tx_id for r in records] == [TX_ID]
+        assert api.reserve_manager._holds == {}
+
+    def test_expired_hold_after_send_still_records(self, api, monkeypatch):
+        """전송 후 예약이 만료되어도 tx_id로 기록"""
+        manager = api.reserve_manager
+        monkeypatch.setattr(
+            manager, "reserve_issuance", functools.partial(manager.reserve_issuance, ttl=0.01)
+        )
+
+        async def confirm_transfer(tx_id, recipient_address):
+            await asyncio.sleep(0.03)
+
+        monkeypatch.setattr(api, "confirm_transfer", confirm_transfer)
+        payload, status = asyncio.run(api.issue_coupon(issue_request()))
+
+        assert status == 200
+        assert payload["data"]["tx_id"] == TX_ID
+        assert [r.tx_id for r in manager.issuance_records] == [TX_ID]
+        assert manager._held_by_period.get("2025-Q1", 0) == 0
+
+    def test_failed_send_releases_hold(self, api, monkeypatch):
+        """전송 실패 시 예약 해제, 기록 없음"""
+        async def send_from_reserve(recipient_address, amount, asset_id):
+            raise ConnectionError("algod unreachable")
+
+        monkeypatch.setattr(api, "send_from_reserve", send_from_reserve)
+        payload, status = asyncio.run(api.issue_coupon(issue_request()))
+
+        assert status == 500
+        assert not payload["success"]
+        assert list(api.reserve_manager.issuance_records) == []
+        assert api.reserve_manager._holds == {}
+
+
+class TestWsgiBridge:
+    """Flask 위임 경로 테스트 (스레드 풀 WSGI 어댑터)"""
+
+    def request(self, api, method, url, **kwargs):
+        async def send():
+            transport = httpx.ASGITransport(app=api.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.request(method, url, **kwargs)
+
+        return asyncio.run(send())
+
+    def test_post_body_delegated(self, api):
+        """요청 본문·헤더가 Flask 앱에 전달"""
+        response = self.request(
+            api, "POST", "/api/coupon/calculate-reward",
+            json={"base_amount": 100, "income_level": "low"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["data"]["final_amount"] > 100
+
+    def test_streaming_response_with_query(self, api):
+        """스트리밍 응답을 모두 전달, 쿼리 문자열 유지"""
+        for i in range(3):
+            api.reserve_manager.record_issuance(f"user{i}", 100, "recycling", f"TX{i}", "2025-Q1")
+
+        response = self.request(api, "GET", "/api/coupon/issuances?user_id=user1")
+
+        assert response.status_code == 200
+        assert [r["tx_id"] for r in response.json()["data"]] == ["TX1"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
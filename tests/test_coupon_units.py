@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+쿠폰 금액 단위 테스트
+"""
+
+import sys
+sys.path.append("..")
+
+import pytest
+from contracts.coupon_units import CouponUnits
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestCouponUnits:
+    """고정소수점 변환 테스트"""
+
+    def test_to_base_exact(self):
+        """정수·문자열·float → 기본 단위 정수"""
+        units = CouponUnits(decimals=6)
+        assert units.scale == 1_000_000
+        assert units.to_base(12) == 12_000_000
+        assert units.to_base("12.5") == 12_500_000
+        assert units.to_base(" .000001 ") == 1
+        assert units.to_base("-3.250000") == -3_250_000
+        assert units.to_base(0.1) == 100_000
+        assert CouponUnits().to_base("1000") == 1000
+
+    def test_to_base_rejects_excess_precision(self):
+        """decimals보다 정밀한 금액·형식 오류"""
+        units = CouponUnits(decimals=2)
+        for value in ("1.001", 0.125, "abc", "", ".", True, None, float("nan")):
+            with pytest.raises(ValueError):
+                units.to_base(value)
+        with pytest.raises(ValueError):
+            CouponUnits().to_base("1.5")
+
+    def test_decimals_range(self):
+        """ASA decimals 범위 (0~19)"""
+        CouponUnits(decimals=19)
+        for decimals in (-1, 20, 2.0):
+            with pytest.raises(ValueError):
+                CouponUnits(decimals=decimals)
+
+    def test_format(self):
+        """기본 단위 → 쿠폰 단위 문자열"""
+        units = CouponUnits(decimals=6)
+        assert units.format(12_500_000) == "12.500000"
+        assert units.format(1) == "0.000001"
+        assert units.format(-1) == "-0.000001"
+        assert CouponUnits().format(1000) == "1000"
+
+    def test_to_base_array_matches_scalar(self):
+        """배열 변환이 단건 변환과 동일"""
+        units = CouponUnits(decimals=3)
+        values = ["1.5", "0.001", "2", "1.5"]
+        expected = [units.to_base(v) for v in values]
+        assert list(units.to_base_array(values)) == expected
+        assert list(units.to_base_array([1.5, 0.001, 2.0, 1.5])) == expected
+        assert list(units.to_base_array([1, 2, 3])) == [1000, 2000, 3000]
+        with pytest.raises(ValueError):
+            units.to_base_array([0.0001])
+
+    @pytest.mark.skipif(np is None, reason="NumPy 미설치")
+    def test_to_base_array_numpy(self):
+        """NumPy 배열 열 단위 변환 (int64)"""
+        units = CouponUnits(decimals=6)
+        result = units.to_base_array(np.array([1, 2, 3], dtype=np.int32))
+        assert result.dtype == np.int64
+        assert result.tolist() == [1_000_000, 2_000_000, 3_000_000]
+        with pytest.raises(ValueError):
+            units.to_base_array(np.array([10 ** 13], dtype=np.int64))
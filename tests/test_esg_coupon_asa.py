@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ESG 쿠폰 ASA 조회 테스트 (메모리 원장)
+"""
+
+import sys
+sys.path.append("..")
+
+import threading
+from algosdk import account, transaction
+from algosdk.error import AlgodHTTPError
+from contracts.esg_coupon_asa import ESGCouponASA
+from benchmarks.hot_paths import LocalLedger
+
+
+def new_address() -> str:
+    return account.generate_account()[1]
+
+
+class TestBalanceLookups:
+    """잔액 단건·일괄 조회 테스트"""
+
+    def setup_method(self):
+        self.holder = new_address()
+        self.other = new_address()
+        self.outsider = new_address()
+        self.ledger = LocalLedger(
+            asset_id=7, total=1000, holdings={self.holder: 40, self.other: 0}
+        )
+        self.asa = ESGCouponASA(algod_client=self.ledger, lookup_workers=4)
+
+    def test_single_balance(self):
+        """opt-in 계정 잔액, 미 opt-in 계정은 None"""
+        assert self.asa.get_account_asset_balance(self.holder, 7) == 40
+        assert self.asa.get_account_asset_balance(self.outsider, 7) is None
+
+    def test_batch_partial_results(self):
+        """입력 순서·중복 유지, 주소별 오류"""
+        results = self.asa.get_account_asset_balances(
+            [self.holder, "not-an-address", self.outsider, self.other, self.holder], 7
+        )
+        assert [r["address"] for r in results] == [
+            self.holder, "not-an-address", self.outsider, self.other, self.holder
+        ]
+        assert [r["success"] for r in results] == [True, False, False, True, True]
+        assert results[0]["balance"] == 40
+        assert results[3]["balance"] == 0
+        assert "opt-in" in results[2]["error"]
+
+    def test_batch_deadline(self):
+        """기한을 넘긴 주소는 실패, 끝난 주소는 결과 반환"""
+        release = threading.Event()
+        slow = new_address()
+        self.ledger.holdings[slow] = 5
+        original = self.ledger.account_asset_info
+
+        def account_asset_info(address, asset_id):
+            if address == slow:
+                release.wait(5)
+            return original(address, asset_id)
+
+        self.ledger.account_asset_info = account_asset_info
+        try:
+            results = self.asa.get_account_asset_balances(
+                [self.holder, slow], 7, timeout=0.2
+            )
+        finally:
+            release.set()
+
+        assert results[0] == {"address": self.holder, "success": True, "balance": 40}
+        assert results[1]["success"] is False
+        assert "시간 초과" in results[1]["error"]
+
+
+class SendLedger:
+    """전송·확인만 흉내 내는 algod 대역 (모든 전송은 다음 라운드에 확정)"""
+
+    def __init__(self, rejected=()):
+        self.rejected = set(rejected)
+        self.sent = []
+        self._lock = threading.Lock()
+
+    def suggested_params(self):
+        return transaction.SuggestedParams(0, 100, 1100, "SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=", "testnet-v1.0", False, "v1", 1000)
+
+    def send_transaction(self, signed_txn):
+        if signed_txn.transaction.group:
+            raise AssertionError("그룹 트랜잭션을 전송하면 안 됩니다.")
+        if signed_txn.transaction.receiver in self.rejected:
+            raise AlgodHTTPError("receiver error: must optin", 400)
+        tx_id = signed_txn.get_txid()
+        with self._lock:
+            if tx_id in self.sent:
+                raise AlgodHTTPError("transaction already in ledger", 400)
+            self.sent.append(tx_id)
+        return tx_id
+
+    def status(self):
+        return {"last-round": 100}
+
+    def pending_transaction_info(self, tx_id):
+        return {"confirmed-round": 101, "pool-error": ""}
+
+    def status_after_block(self, round_num):
+        return {"last-round": round_num + 1}
+
+
+class TestReserveBatchTransfer:
+    """일괄 발급 테스트"""
+
+    def setup_method(self):
+        self.reserve_key, self.reserve = account.generate_account()
+
+    def test_failure_reported_per_recipient(self):
+        """거절된 수령자만 실패, 나머지는 확정"""
+        recipients = [new_address() for _ in range(40)]
+        ledger = SendLedger(rejected={recipients[3], recipients[20]})
+        asa = ESGCouponASA(algod_client=ledger, lookup_workers=4)
+
+        results = asa.transfer_from_reserve_batch(
+            self.reserve, self.reserve_key, [(r, 10) for r in recipients], 7
+        )
+
+        assert [r["recipient"] for r in results] == recipients
+        assert [i for i, r in enumerate(results) if not r["success"]] == [3, 20]
+        assert "optin" in results[3]["error"]
+        assert results[3]["tx_id"] is None
+        assert len(ledger.sent) == 38
+        assert {r["tx_id"] for r in results if r["success"]} == set(ledger.sent)
+
+    def test_repeated_transfer_not_duplicate(self):
+        """같은 수령자·수량을 여러 번 지급해도 모두 전송"""
+        recipient = new_address()
+        ledger = SendLedger()
+        asa = ESGCouponASA(algod_client=ledger, lookup_workers=4)
+
+        results = asa.transfer_from_reserve_batch(
+            self.reserve, self.reserve_key, [(recipient, 5)] * 3, 7
+        )
+
+        assert all(r["success"] for r in results)
+        assert len(set(ledger.sent)) == 3
+
+    def test_unconfirmed_transfer_keeps_tx_id(self):
+        """확인 실패 건은 실패로 표시하되 트랜잭션 ID 유지"""
+        recipients = [new_address() for _ in range(3)]
+        ledger = SendLedger()
+        pending = ledger.pending_transaction_info
+        unconfirmed = []
+
+        def pending_transaction_info(tx_id):
+            if tx_id == unconfirmed[0]:
+                return {"confirmed-round": 0, "pool-error": "overspend"}
+            return pending(tx_id)
+
+        def send_transaction(signed_txn):
+            tx_id = SendLedger.send_transaction(ledger, signed_txn)
+            if signed_txn.transaction.receiver == recipients[1]:
+                unconfirmed.append(tx_id)
+            return tx_id
+
+        ledger.pending_transaction_info = pending_transaction_info
+        ledger.send_transaction = send_transaction
+        asa = ESGCouponASA(algod_client=ledger, lookup_workers=4)
+
+        results = asa.transfer_from_reserve_batch(
+            self.reserve, self.reserve_key, [(r, 1) for r in recipients], 7
+        )
+
+        assert [r["success"] for r in results] == [True, False, True]
+        assert results[1]["tx_id"] == unconfirmed[0]
+        assert "overspend" in results[1]["error"]
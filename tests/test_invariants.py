@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+불변식 검증 테스트
+"""
+
+import sys
+sys.path.append("..")
+
+from contracts.reserve_manager import ReserveManager
+from verification.invariants import InvariantVerifier
+
+
+class StubLedger:
+    """algod 대역 (한도 검증은 algod를 조회하지 않음)"""
+
+    def asset_info(self, asset_id):
+        raise AssertionError("한도 검증에서 algod를 조회하면 안 됩니다.")
+
+    account_info = asset_info
+
+
+class TestLimitCompliance:
+    """한도 불변식 테스트"""
+
+    def _verifier(self, tmp_path, manager):
+        return InvariantVerifier(
+            StubLedger(), 1,
+            config_file=str(tmp_path / "accounts_config.json"),
+            reserve_manager=manager
+        )
+
+    def _manager(self, tmp_path):
+        return ReserveManager(
+            config_file=str(tmp_path / "budget_config.json"),
+            journal_file=str(tmp_path / "budget_journal.jsonl")
+        )
+
+    def test_passes_within_limit(self, tmp_path):
+        """한도 이하 발급은 통과"""
+        manager = self._manager(tmp_path)
+        manager.set_budget("2025-Q1", total_budget=1_000_000, per_person_limit=5000)
+        for i in range(50):
+            manager.record_issuance(f"user{i:03d}", 5000, "test", f"TX{i}", "2025-Q1")
+
+        result = self._verifier(tmp_path, manager).verify_limit_compliance()
+        assert result["passed"] is True
+        assert result["violations_count"] == 0
+
+    def test_reports_each_violating_user_once_per_period(self, tmp_path):
+        """한도 초과 사용자는 기간별로 한 번만 보고"""
+        manager = self._manager(tmp_path)
+        manager.set_budget("2025-Q1", total_budget=1_000_000, per_person_limit=1000)
+        manager.set_budget("2025-Q2", total_budget=1_000_000, per_person_limit=1000)
+        # 기록 저장은 한도를 확인하지 않으므로 위반 상태를 직접 만든다
+        for i in range(40):
+            user_id = f"user{i:03d}"
+            manager.record_issuance(user_id, 600, "test", f"TXA{i}", "2025-Q1")
+            manager.record_issuance(user_id, 600 if i < 20 else 100, "test", f"TXB{i}", "2025-Q1")
+        manager.record_issuance("user000", 800, "test", "TXC", "2025-Q2")
+
+        result = self._verifier(tmp_path, manager).verify_limit_compliance()
+        assert result["passed"] is False
+        assert result["violations_count"] == 20
+        assert {v["period"] for v in result["violations"]} == {"2025-Q1"}
+        assert len({v["user_id"] for v in result["violations"]}) == 20
+        assert all(v["total_issued"] == 1200 and v["excess"] == 200 for v in result["violations"])
+
+    def test_finds_violations_beyond_first_leaderboard_page(self, tmp_path):
+        """위반 사용자가 순위표 첫 조회 크기보다 많아도 모두 보고"""
+        manager = self._manager(tmp_path)
+        manager.set_budget("2025-Q1", total_budget=10_000_000, per_person_limit=1000)
+        for i in range(100):
+            manager.record_issuance(f"over{i:03d}", 1001 + i, "test", f"TXO{i}", "2025-Q1")
+        for i in range(100):
+            manager.record_issuance(f"ok{i:03d}", 1000, "test", f"TXK{i}", "2025-Q1")
+
+        result = self._verifier(tmp_path, manager).verify_limit_compliance()
+        assert result["violations_count"] == 100
+        assert {v["user_id"] for v in result["violations"]} == {f"over{i:03d}" for i in range(100)}
+
+    def test_each_period_uses_its_own_limit(self, tmp_path):
+        """기간별 한도로 판정 (다른 기간 한도를 적용하지 않음)"""
+        manager = self._manager(tmp_path)
+        manager.set_budget("2025-Q1", total_budget=1_000_000, per_person_limit=5000)
+        manager.set_budget("2025-Q2", total_budget=1_000_000, per_person_limit=500)
+        manager.record_issuance("alice", 3000, "test", "TX1", "2025-Q1")
+        manager.record_issuance("alice", 600, "test", "TX2", "2025-Q2")
+
+        result = self._verifier(tmp_path, manager).verify_limit_compliance()
+        assert result["violations"] == [{
+            "user_id": "alice",
+            "period": "2025-Q2",
+            "total_issued": 600,
+            "limit": 500,
+            "excess": 100
+        }]
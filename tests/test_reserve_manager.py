@@ -0,0 +1,773 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Reserve 관리자 테스트
+"""
+
+import sys
+sys.path.append("..")
+
+import base64
+import heapq
+import json
+import os
+import threading
+import time
+import pytest
+from contracts.coupon_units import CouponUnits
+from contracts.reserve_manager import ReserveManager, IssuanceHoldError
+from contracts.reserve_storage import (
+    SQLiteReserveStorage,
+    JsonReserveStorage,
+    IssuanceRecord
+)
+from contracts.issuance_columns import IssuanceColumns
+from contracts.issuance_journal import IssuanceJournal
+from contracts.leaderboard import Leaderboard
+
+
+class TestReserveJournal:
+    """저널 모드 테스트"""
+
+    def _manager(self, tmp_path, **kwargs):
+        """임시 디렉토리에 저널 모드 관리자 생성"""
+        self.config_file = str(tmp_path / "budget_config.json")
+        self.journal_file = str(tmp_path / "budget_journal.jsonl")
+        return ReserveManager(
+            config_file=self.config_file,
+            journal_file=self.journal_file,
+            **kwargs
+        )
+
+    def test_issuance_appends_without_rewriting_snapshot(self, tmp_path):
+        """발급 시 스냅샷은 그대로, 저널에 한 줄 추가"""
+        manager = self._manager(tmp_path)
+        with open(self.config_file) as f:
+            snapshot_before = f.read()
+
+        manager.record_issuance("user001", 1000, "carbon_reduction", "TX1", "2025-Q1")
+        manager.record_issuance("user002", 500, "recycling", "TX2", "2025-Q1")
+        manager.close()
+
+        with open(self.config_file) as f:
+            assert f.read() == snapshot_before
+        with open(self.journal_file) as f:
+            entries = [json.loads(line) for line in f]
+        assert [e["op"] for e in entries].count("issuance") == 2
+
+    def test_restart_replays_journal(self, tmp_path):
+        """재시작 시 스냅샷 + 저널 재생"""
+        manager = self._manager(tmp_path)
+        manager.set_budget("2025-Q2", 10000, 3000)
+        manager.record_issuance("user001", 1000, "carbon_reduction", "TX1", "2025-Q2")
+        manager.close()
+
+        restored = self._manager(tmp_path)
+        assert len(restored.issuance_records) == 1
+        assert restored.budget_allocations["2025-Q2"].remaining == 9000
+
+    def test_checkpoint_truncates_journal(self, tmp_path):
+        """스냅샷 저장 후 저널 비움, 중복 재생 없음"""
+        manager = self._manager(tmp_path)
+        manager.record_issuance("user001", 1000, "carbon_reduction", "TX1", "2025-Q1")
+        manager.checkpoint()
+        manager.record_issuance("user001", 200, "recycling", "TX2", "2025-Q1")
+        manager.close()
+
+        restored = self._manager(tmp_path)
+        assert len(restored.issuance_records) == 2
+        assert restored.budget_allocations["2025-Q1"].allocated == 1200
+
+    def test_checkpoint_syncs_snapshot_before_truncating(self, tmp_path, monkeypatch):
+        """스냅샷 파일·디렉토리 fsync 후에만 저널을 비움"""
+        manager = self._manager(tmp_path)
+        manager.record_issuance("user001", 1000, "carbon_reduction", "TX1", "2025-Q1")
+
+        events = []
+        real_fsync, real_replace = os.fsync, os.replace
+
+        def fsync(fd):
+            events.append(("fsync", os.readlink(f"/proc/self/fd/{fd}")))
+            real_fsync(fd)
+
+        def replace(src, dst):
+            events.append(("replace", dst))
+            real_replace(src, dst)
+
+        monkeypatch.setattr(os, "fsync", fsync)
+        monkeypatch.setattr(os, "replace", replace)
+        manager.checkpoint()
+
+        assert events.index(("fsync", self.config_file + ".tmp")) < events.index(("replace", self.config_file))
+        directory_synced = events.index(("fsync", str(tmp_path)))
+        assert directory_synced > events.index(("replace", self.config_file))
+        assert events[-1] == ("fsync", self.journal_file)
+        assert directory_synced < len(events) - 1
+
+    def test_append_returns_after_fsync(self, tmp_path, monkeypatch):
+        """기록은 자기 항목을 포함한 fsync가 끝난 뒤 반환"""
+        journal_file = str(tmp_path / "journal.jsonl")
+        journal = IssuanceJournal(journal_file)
+        synced_sizes = []
+        real_fsync = os.fsync
+
+        def fsync(fd):
+            real_fsync(fd)
+            synced_sizes.append(os.fstat(fd).st_size)
+
+        monkeypatch.setattr(os, "fsync", fsync)
+        journal.append({"op": "issuance", "seq": 1})
+
+        assert synced_sizes == [os.path.getsize(journal_file)]
+        journal.close()
+
+    def test_concurrent_appends_share_fsync(self, tmp_path, monkeypatch):
+        """fsync 진행 중에 들어온 기록은 다음 fsync 한 번으로 확정"""
+        journal = IssuanceJournal(str(tmp_path / "journal.jsonl"))
+        synced = []
+        real_fsync = os.fsync
+
+        def slow_fsync(fd):
+            time.sleep(0.05)
+            real_fsync(fd)
+            synced.append(fd)
+
+        monkeypatch.setattr(os, "fsync", slow_fsync)
+        threads = [
+            threading.Thread(target=journal.append, args=({"op": "issuance", "seq": i},))
+            for i in range(20)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert journal._synced == journal._written == 20
+        assert len(synced) < 20
+        assert len(list(journal.replay())) == 20
+        journal.close()
+
+    def test_torn_last_entry_is_skipped(self, tmp_path):
+        """기록 도중 잘린 마지막 줄은 무시"""
+        manager = self._manager(tmp_path)
+        manager.record_issuance("user001", 1000, "carbon_reduction", "TX1", "2025-Q1")
+        manager.close()
+        with open(self.journal_file, 'a') as f:
+            f.write('{"op": "issuance", "se')
+
+        restored = self._manager(tmp_path)
+        assert len(restored.issuance_records) == 1
+        restored.record_issuance("user002", 300, "recycling", "TX2", "2025-Q1")
+        restored.close()
+
+        assert len(self._manager(tmp_path).issuance_records) == 2
+
+
+class TestCouponUnits:
+    """기본 단위 금액 테스트"""
+
+    def test_micro_coupon_issuance(self, tmp_path):
+        """소수 쿠폰을 기본 단위 정수로 한도·잔액 계산"""
+        units = CouponUnits(decimals=6)
+        manager = ReserveManager(
+            config_file=str(tmp_path / "budget_config.json"),
+            journal_file=str(tmp_path / "budget_journal.jsonl"),
+            units=units
+        )
+        manager.set_budget("2025-Q2", units.to_base(100), units.to_base("2.5"))
+
+        manager.record_issuance("user001", units.to_base("2.499999"), "test", "TX1", "2025-Q2")
+        assert manager.check_issuance_allowed("user001", units.to_base("0.000001"), "2025-Q2")["allowed"]
+        assert not manager.check_issuance_allowed("user001", units.to_base("0.000002"), "2025-Q2")["allowed"]
+        manager.close()
+
+        restored = ReserveManager(
+            config_file=str(tmp_path / "budget_config.json"),
+            journal_file=str(tmp_path / "budget_journal.jsonl"),
+            units=units
+        )
+        assert units.format(restored.get_budget_status("2025-Q2")["remaining"]) == "97.500001"
+        with pytest.raises(ValueError):
+            ReserveManager(
+                config_file=str(tmp_path / "budget_config.json"),
+                journal_file=str(tmp_path / "budget_journal.jsonl")
+            )
+
+
+class TestUserPeriodIndex:
+    """(user_id, period) 누적 인덱스 테스트"""
+
+    def setup_method(self):
+        """테스트 초기화"""
+        self.period = "2025-Q1"
+
+    def test_limit_is_checked_per_period(self, tmp_path):
+        """다른 기간의 발급량은 한도에 합산되지 않음"""
+        manager = ReserveManager(config_file=str(tmp_path / "budget_config.json"))
+        manager.set_budget("2025-Q2", 100000, 5000)
+        manager.record_issuance("user001", 5000, "carbon_reduction", "TX1", self.period)
+
+        assert not manager.check_issuance_allowed("user001", 1, self.period)["allowed"]
+        assert manager.check_issuance_allowed("user001", 5000, "2025-Q2")["allowed"]
+
+    def test_index_rebuilt_on_load(self, tmp_path):
+        """재시작 시 인덱스 재구성"""
+        config_file = str(tmp_path / "budget_config.json")
+        manager = ReserveManager(config_file=config_file)
+        manager.record_issuance("user001", 3000, "carbon_reduction", "TX1", self.period)
+        manager.record_issuance("user001", 1500, "recycling", "TX2", self.period)
+
+        restored = ReserveManager(config_file=config_file)
+        assert restored.issuance_records[0].period == self.period
+        check = restored.check_issuance_allowed("user001", 1000, self.period)
+        assert not check["allowed"]
+        assert "4500" in check["reason"]
+
+    def test_legacy_record_period_inferred(self, tmp_path):
+        """기간 정보 없는 기존 기록은 timestamp로 기간 추정"""
+        config_file = tmp_path / "budget_config.json"
+        ReserveManager(config_file=str(config_file))
+        data = json.loads(config_file.read_text())
+        data["issuance_records"] = [{
+            "record_id": "ISS-000001",
+            "user_id": "user001",
+            "amount": 4000,
+            "reason": "carbon_reduction",
+            "tx_id": "TX1",
+            "timestamp": "2025-02-10T09:00:00"
+        }]
+        config_file.write_text(json.dumps(data))
+
+        manager = ReserveManager(config_file=str(config_file))
+        assert manager.issuance_records[0].period == self.period
+        assert not manager.check_issuance_allowed("user001", 2000, self.period)["allowed"]
+
+
+class TestSQLiteStorage:
+    """SQLite 저장소 테스트"""
+
+    def _manager(self, tmp_path):
+        """임시 DB로 SQLite 저장소 관리자 생성"""
+        storage = SQLiteReserveStorage(db_file=str(tmp_path / "reserve.db"))
+        return ReserveManager(storage=storage)
+
+    def test_wal_mode_and_indexes(self, tmp_path):
+        """WAL 모드 및 user_id/period/timestamp 인덱스"""
+        manager = self._manager(tmp_path)
+        conn = manager.storage._conn
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        indexed = {
+            row[2]
+            for idx in conn.execute("PRAGMA index_list(issuance_records)")
+            for row in conn.execute(f"PRAGMA index_info({idx[1]})")
+        }
+        assert {"user_id", "period", "timestamp"} <= indexed
+
+    def test_aggregates_match_issuances(self, tmp_path):
+        """요약·상위 수혜자·예산 현황 SQL 집계"""
+        manager = self._manager(tmp_path)
+        manager.record_issuance("user001", 1000, "carbon_reduction", "TX1", "2025-Q1")
+        manager.record_issuance("user002", 3000, "recycling", "TX2", "2025-Q1")
+        manager.record_issuance("user001", 500, "local_food", "TX3", "2025-Q1")
+
+        summary = manager.get_user_issuance_summary("user001")
+        assert summary["total_issued"] == 1500
+        assert summary["issuance_count"] == 2
+        assert [r["tx_id"] for r in summary["records"]] == ["TX1", "TX3"]
+
+        assert manager.get_top_recipients(1) == [
+            {"user_id": "user002", "total_issued": 3000}
+        ]
+        assert manager.get_budget_status("2025-Q1")["allocated"] == 4500
+        assert manager.issuance_records[2].record_id == "ISS-000003"
+
+    def test_restart_keeps_state(self, tmp_path):
+        """재시작 시 이력을 읽지 않고 예산·한도 유지"""
+        manager = self._manager(tmp_path)
+        manager.record_issuance("user001", 4500, "carbon_reduction", "TX1", "2025-Q1")
+        manager.close()
+
+        restored = self._manager(tmp_path)
+        assert restored.budget_allocations["2025-Q1"].remaining == 995500
+        assert not restored.check_issuance_allowed("user001", 1000, "2025-Q1")["allowed"]
+
+    def test_allocation_units_persisted(self, tmp_path):
+        """예산 금액 단위(decimals) 저장·검증"""
+        units = CouponUnits(decimals=6)
+        storage = SQLiteReserveStorage(db_file=str(tmp_path / "reserve.db"))
+        manager = ReserveManager(storage=storage, units=units)
+        assert manager.budget_allocations["2025-Q1"].per_person_limit == 5000 * 10 ** 6
+        manager.close()
+
+        storage = SQLiteReserveStorage(db_file=str(tmp_path / "reserve.db"))
+        assert ReserveManager(storage=storage, units=units).get_budget_status(
+            "2025-Q1"
+        )["decimals"] == 6
+        storage = SQLiteReserveStorage(db_file=str(tmp_path / "reserve.db"))
+        with pytest.raises(ValueError):
+            ReserveManager(storage=storage)
+
+
+class TestIssuanceHolds:
+    """발급 예약(hold) 테스트"""
+
+    def setup_method(self):
+        """테스트 초기화"""
+        self.period = "2025-Q1"
+
+    def test_concurrent_holds_never_exceed_limits(self, tmp_path):
+        """동시 예약이 1인 한도·예산을 초과하지 않음"""
+        manager = ReserveManager(config_file=str(tmp_path / "budget_config.json"))
+        manager.set_budget(self.period, 10000, 5000)
+        results = []
+
+        def worker(user_id):
+            hold = manager.reserve_issuance(user_id, 1000, self.period)
+            if hold["allowed"]:
+                record = manager.commit_hold(hold["hold_id"], "carbon_reduction", "TX")
+                results.append(record.record_id)
+
+        threads = [
+            threading.Thread(target=worker, args=(f"user{i % 3}",))
+            for i in range(30)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(results) == 10
+        assert len(set(results)) == 10
+        assert manager.budget_allocations[self.period].remaining == 0
+        for i in range(3):
+            assert manager._get_user_total_issuance(f"user{i}", self.period) <= 5000
+
+    def test_hold_counts_until_released(self, tmp_path):
+        """예약 금액은 확정 전에도 한도에 포함, 취소 시 반환"""
+        manager = ReserveManager(config_file=str(tmp_path / "budget_config.json"))
+        hold = manager.reserve_issuance("user001", 5000, self.period)
+
+        assert hold["allowed"]
+        assert not manager.check_issuance_allowed("user001", 1, self.period)["allowed"]
+        assert manager.release_hold(hold["hold_id"])
+        assert manager.check_issuance_allowed("user001", 5000, self.period)["allowed"]
+
+    def test_expired_hold_cannot_commit(self, tmp_path):
+        """만료된 예약은 자동 해제, 확정 불가"""
+        manager = ReserveManager(config_file=str(tmp_path / "budget_config.json"))
+        hold = manager.reserve_issuance("user001", 5000, self.period, ttl=0.01)
+        time.sleep(0.02)
+
+        assert manager.check_issuance_allowed("user001", 5000, self.period)["allowed"]
+        with pytest.raises(IssuanceHoldError):
+            manager.commit_hold(hold["hold_id"], "carbon_reduction", "TX1")
+
+    def test_user_total_checked_outside_budget_lock(self, tmp_path):
+        """1인 누적 조회(저장소 조회)는 예산 잠금 밖에서 수행"""
+        manager = ReserveManager(config_file=str(tmp_path / "budget_config.json"))
+        lookup = manager._get_user_total_issuance
+        budget_locked = []
+
+        def checked_lookup(user_id, period):
+            budget_locked.append(manager._budget_lock.locked())
+            return lookup(user_id, period)
+
+        manager._get_user_total_issuance = checked_lookup
+        assert manager.reserve_issuance("user001", 1000, self.period)["allowed"]
+        assert budget_locked == [False]
+
+    def test_hold_does_not_expire_while_committing(self, tmp_path):
+        """확정 중인 예약은 만료·취소되지 않고, 저장은 예산 잠금 밖에서 수행"""
+        manager = ReserveManager(config_file=str(tmp_path / "budget_config.json"))
+        manager.set_budget(self.period, 1000, 1000)
+        hold = manager.reserve_issuance("user001", 1000, self.period, ttl=0.01)
+        append_issuance = manager.storage.append_issuance
+        during_commit = {}
+
+        def slow_append(record):
+            time.sleep(0.03)  # 예약 만료 시각 경과
+            during_commit["budget_locked"] = manager._budget_lock.locked()
+            during_commit["other"] = manager.reserve_issuance("user002", 1000, self.period)
+            during_commit["released"] = manager.release_hold(hold["hold_id"])
+            append_issuance(record)
+            # 저장소 잔액이 먼저 차감돼도 예약과 이중 계산되지 않음
+            during_commit["other_after_append"] = manager.check_issuance_allowed(
+                "user002", 1, self.period
+            )
+
+        manager.storage.append_issuance = slow_append
+        manager.commit_hold(hold["hold_id"], "carbon_reduction", "TX1")
+
+        assert during_commit["budget_locked"] is False
+        assert not during_commit["other"]["allowed"]
+        assert during_commit["released"] is False
+        assert not during_commit["other_after_append"]["allowed"]
+        assert manager.budget_allocations[self.period].allocated == 1000
+        assert manager._available_budget(self.period) == 0
+
+    def test_failed_commit_keeps_hold(self, tmp_path):
+        """저장 실패 시 예약 유지 (만료 또는 취소로 해제)"""
+        manager = ReserveManager(config_file=str(tmp_path / "budget_config.json"))
+        hold = manager.reserve_issuance("user001", 5000, self.period, ttl=0.05)
+
+        def failing_append(record):
+            raise OSError("disk full")
+
+        manager.storage.append_issuance = failing_append
+        with pytest.raises(OSError):
+            manager.commit_hold(hold["hold_id"], "carbon_reduction", "TX1")
+        assert not manager.check_issuance_allowed("user001", 1, self.period)["allowed"]
+
+        time.sleep(0.06)
+        assert manager.check_issuance_allowed("user001", 5000, self.period)["allowed"]
+
+
+class TestLeaderboard:
+    """증분 순위표 테스트"""
+
+    def test_top_matches_full_sort(self):
+        """증감 반복 후 상위 K가 전체 정렬 결과와 일치"""
+        board = Leaderboard()
+        totals = {}
+        for i in range(2000):
+            user_id = f"user{(i * 7919) % 150:03d}"
+            amount = (i * 31) % 500 - (100 if i % 5 == 0 else 0)
+            board.add(user_id, amount)
+            totals[user_id] = totals.get(user_id, 0) + amount
+
+        expected = sorted(totals.items(), key=lambda x: (-x[1], x[0]))
+        for limit in (1, 10, 150, 500):
+            assert board.top(limit) == expected[:limit]
+
+    def test_hot_user_does_not_grow_heap(self, monkeypatch):
+        """한 사용자의 잦은 갱신이 힙 크기·상위 K 조회 비용을 늘리지 않음"""
+        board = Leaderboard()
+        for i in range(1000):
+            board.add(f"user{i:04d}", i)
+        for _ in range(10000):
+            board.add("hot", 1)
+            board.add("hot", -1)
+        board.add("hot", 5000)
+
+        assert len(board._heap) == len(board) == 1001
+        pops = 0
+        heappop = heapq.heappop
+
+        def counting_pop(heap):
+            nonlocal pops
+            pops += 1
+            return heappop(heap)
+
+        monkeypatch.setattr(heapq, "heappop", counting_pop)
+        assert board.top(3) == [("hot", 5000), ("user0999", 999), ("user0998", 998)]
+        assert pops == 3
+
+    def test_clawback_reorders_recipients(self, tmp_path):
+        """회수 시 순위 갱신, 기간·지역별 순위표"""
+        manager = ReserveManager(config_file=str(tmp_path / "budget_config.json"))
+        manager.set_budget("2025-Q2", 100000, 5000)
+        manager.record_issuance("user001", 3000, "carbon_reduction", "TX1", "2025-Q1", region="rural")
+        manager.record_issuance("user002", 2000, "recycling", "TX2", "2025-Q1", region="urban")
+        manager.record_issuance("user003", 2500, "recycling", "TX3", "2025-Q2", region="rural")
+
+        assert manager.get_top_recipients(1)[0]["user_id"] == "user001"
+        manager.record_clawback("user001", 2500, "TX4", "2025-Q1", region="rural")
+
+        assert [r["user_id"] for r in manager.get_top_recipients(3)] == [
+            "user003", "user002", "user001"
+        ]
+        assert manager.get_top_recipients(5, period="2025-Q1") == [
+            {"user_id": "user002", "total_issued": 2000},
+            {"user_id": "user001", "total_issued": 500}
+        ]
+        assert [r["user_id"] for r in manager.get_top_recipients(5, region="rural")] == [
+            "user003", "user001"
+        ]
+        assert manager.get_budget_status("2025-Q1")["allocated"] == 2500
+
+
+class TestBulkIssuance:
+    """대량 발급 테스트"""
+
+    def setup_method(self):
+        """테스트 초기화"""
+        self.period = "2025-Q1"
+
+    def test_rows_validated_in_order(self, tmp_path):
+        """행 순서대로 예산·1인 한도 누적 반영"""
+        manager = ReserveManager(config_file=str(tmp_path / "budget_config.json"))
+        manager.set_budget(self.period, 10000, 5000)
+        manager.record_issuance("user001", 2000, "carbon_reduction", "TX0", self.period)
+
+        results = manager.record_issuances_bulk([
+            {"user_id": "user001", "amount": 3000},
+            {"user_id": "user001", "amount": 1},
+            {"user_id": "user002", "amount": 4000},
+            {"user_id": "user003", "amount": 2000},
+            {"user_id": "user004", "amount": 1000},
+        ], self.period)
+
+        assert [r["success"] for r in results] == [True, False, True, False, True]
+        assert "1인 한도 초과" in results[1]["error"]
+        assert "예산 부족" in results[3]["error"]
+        assert [r.get("record_id") for r in results if r["success"]] == [
+            "ISS-000002", "ISS-000003", "ISS-000004"
+        ]
+        assert manager.budget_allocations[self.period].remaining == 0
+
+    def test_bulk_journal_survives_restart(self, tmp_path):
+        """저널 모드 대량 발급은 재시작 후에도 유지"""
+        config_file = str(tmp_path / "budget_config.json")
+        journal_file = str(tmp_path / "budget_journal.jsonl")
+        manager = ReserveManager(config_file=config_file, journal_file=journal_file)
+        rows = [{"user_id": f"user{i:04d}", "amount": 100} for i in range(500)]
+
+        results = manager.record_issuances_bulk(rows, self.period)
+        manager.close()
+
+        assert all(r["success"] for r in results)
+        restored = ReserveManager(config_file=config_file, journal_file=journal_file)
+        assert len(restored.issuance_records) == 500
+        assert restored.budget_allocations[self.period].allocated == 50000
+
+    def test_bulk_scaling_fits_budget(self, tmp_path):
+        """예산 초과 시 상한 조정으로 예산·1인 한도 내 전액 배분"""
+        manager = ReserveManager(config_file=str(tmp_path / "budget_config.json"))
+        manager.set_budget(self.period, 10000, 5000)
+        manager.record_issuance("user001", 4000, "carbon_reduction", "TX0", self.period)
+
+        results = manager.record_issuances_bulk([
+            {"user_id": "user001", "amount": 3000},
+            {"user_id": "user002", "amount": 500},
+            {"user_id": "user003", "amount": 5000},
+            {"user_id": "user004", "amount": 5000},
+        ], self.period, scaling="water_fill")
+
+        # 잔액 6000: user001은 한도 잔여 1000, 나머지는 상한 2250
+        assert [r["amount"] for r in results] == [1000, 500, 2250, 2250]
+        assert [r["requested_amount"] for r in results] == [3000, 500, 5000, 5000]
+        assert all(r["success"] for r in results)
+        assert manager.budget_allocations[self.period].remaining == 0
+
+    def test_bulk_scaling_per_user_not_per_row(self, tmp_path):
+        """같은 사용자의 여러 행은 합산해 한 사람 몫으로 조정"""
+        manager = ReserveManager(config_file=str(tmp_path / "budget_config.json"))
+        manager.set_budget(self.period, 6000, 10000)
+
+        results = manager.record_issuances_bulk(
+            [{"user_id": "user001", "amount": 1000}] * 4 + [
+                {"user_id": "user002", "amount": 4000},
+                {"user_id": "user003", "amount": 4000},
+            ],
+            self.period,
+            scaling="water_fill"
+        )
+
+        # 사용자별 요청 4000씩, 잔액 6000 → 1인 2000 (user001은 행별 500)
+        assert [r["amount"] for r in results] == [500, 500, 500, 500, 2000, 2000]
+        assert all(r["success"] for r in results)
+        assert manager._get_user_total_issuance("user001", self.period) == 2000
+
+    def test_bulk_uniform_split_keeps_row_ratio(self, tmp_path):
+        """비율 조정 시 사용자 배분액을 행 요청 비율로 나눔"""
+        manager = ReserveManager(config_file=str(tmp_path / "budget_config.json"))
+        manager.set_budget(self.period, 3000, 10000)
+
+        results = manager.record_issuances_bulk([
+            {"user_id": "user001", "amount": 3000},
+            {"user_id": "user002", "amount": 2000},
+            {"user_id": "user001", "amount": 1000},
+        ], self.period, scaling="uniform")
+
+        assert [r["amount"] for r in results] == [1500, 1000, 500]
+        assert manager.budget_allocations[self.period].remaining == 0
+
+
+class TestIssuanceColumns:
+    """컬럼형 발급 이력 테스트"""
+
+    def test_records_round_trip(self):
+        """컬럼 분해 후 원래 기록과 동일하게 복원"""
+        records = [
+            IssuanceRecord("ISS-000001", "user001", 1000, "carbon_reduction",
+                           "TX1", "2025-02-10T09:00:00", "2025-Q1", "rural"),
+            IssuanceRecord("LEGACY-7", "user002", -300, "clawback",
+                           "TX_SIMULATED", "2025-02-10T09:00:00.123456", "2025-Q1"),
+            IssuanceRecord("ISS-000003", "user001", 500, "recycling",
+                           "TX_SIMULATED", "2025-03-01T00:00:00+09:00", "2025-Q1", "urban"),
+        ]
+        columns = IssuanceColumns(IssuanceRecord)
+        for record in records:
+            columns.append(record)
+
+        assert list(columns) == records
+        assert columns[-1] == records[-1]
+        assert len(columns.users) == 2
+        assert list(columns.rows_for_user("user001")) == [0, 2]
+        assert list(columns.rows_for_user("unknown")) == []
+
+
+class TestIssuanceQueries:
+    """시각 범위 조회 테스트"""
+
+    RECORDS = [
+        ("user001", 100, "2025-02-27T10:00:00"),
+        ("user002", 200, "2025-03-01T00:00:00"),
+        ("user001", 300, "2025-03-15T12:30:00"),
+        ("user002", 400, "2025-03-31T23:59:59.999999"),
+        ("user001", 500, "2025-04-01T00:00:00"),
+    ]
+
+
+    def test_algorand_tx_ids_stored_as_hashes(self):
+        """Algorand 트랜잭션 ID는 인터닝하지 않고 32바이트 해시로 보관 후 복원"""
+        tx_ids = [
+            base64.b32encode(bytes([i]) * 32).decode().rstrip("=") for i in range(3)
+        ] + ["TX_SIMULATED", "TX_SIMULATED", "a" * 52]
+        columns = IssuanceColumns(IssuanceRecord)
+        for i, tx_id in enumerate(tx_ids):
+            columns.append(IssuanceRecord(
+                f"ISS-{i + 1:06d}", "user001", 100, "recycling",
+                tx_id, "2025-02-10T09:00:00", "2025-Q1"
+            ))
+
+        assert [record.tx_id for record in columns] == tx_ids
+        assert len(columns.tx_ids) == 2  # TX_SIMULATED, 소문자(비정규) ID만 인터닝
+    def _expected(self, start, end, user_id=None):
+        return [
+            amount for uid, amount, ts in sorted(self.RECORDS, key=lambda r: r[2])
+            if start <= ts < end and (user_id is None or uid == user_id)
+        ]
+
+    @pytest.mark.parametrize("order", [[0, 1, 2, 3, 4], [4, 2, 0, 3, 1]])
+    def test_json_range_queries(self, tmp_path, order):
+        """시각 인덱스·사용자 인덱스 범위 조회 (역순 추가 포함)"""
+        manager = ReserveManager(config_file=str(tmp_path / "budget_config.json"))
+        manager.storage.append_issuances([
+            IssuanceRecord(f"ISS-{i + 1:06d}", self.RECORDS[j][0], self.RECORDS[j][1],
+                           "carbon_reduction", "TX", self.RECORDS[j][2], "2025-Q1")
+            for i, j in enumerate(order)
+        ])
+
+        march = ("2025-03-01", "2025-04-01")
+        records = manager.query_issuances(*march)
+        assert not isinstance(records, list)
+        assert [r.amount for r in records] == self._expected(*march)
+        assert [r.amount for r in manager.query_issuances(*march, user_id="user001")] == [300]
+        assert [r.amount for r in manager.query_issuances(user_id="user001")] == [100, 300, 500]
+        assert list(manager.query_issuances(*march, period="2025-Q4")) == []
+
+    def test_sqlite_range_queries(self, tmp_path):
+        """SQLite 저장소 범위 조회"""
+        storage = SQLiteReserveStorage(db_file=str(tmp_path / "reserve.db"))
+        manager = ReserveManager(storage=storage)
+        storage.append_issuances([
+            IssuanceRecord(f"ISS-{i + 1:06d}", uid, amount, "carbon_reduction",
+                           "TX", ts, "2025-Q1")
+            for i, (uid, amount, ts) in enumerate(self.RECORDS)
+        ])
+
+        march = ("2025-03-01", "2025-04-01")
+        assert [r.amount for r in manager.query_issuances(*march)] == self._expected(*march)
+        assert [r.amount for r in manager.query_issuances(*march, user_id="user002")] == [200, 400]
+
+
+class TestUserSummary:
+    """사용자 요약 (링 버퍼) 테스트"""
+
+    def test_summary_uses_recent_ring(self, tmp_path):
+        """누적 합계·건수와 최근 10건"""
+        manager = ReserveManager(config_file=str(tmp_path / "budget_config.json"))
+        rows = [
+            {"user_id": "user001" if i % 2 else "user002", "amount": i + 1, "tx_id": f"TX{i}"}
+            for i in range(50)
+        ]
+        manager.record_issuances_bulk(rows, "2025-Q1")
+        manager.record_clawback("user001", 10, "TX_CB", "2025-Q1")
+
+        summary = manager.get_user_issuance_summary("user001")
+        assert summary["total_issued"] == sum(i + 1 for i in range(1, 50, 2)) - 10
+        assert summary["issuance_count"] == 26
+        assert [r["tx_id"] for r in summary["records"]] == [
+            f"TX{i}" for i in range(33, 50, 2)
+        ] + ["TX_CB"]
+        assert manager.get_user_issuance_summary("nobody")["issuance_count"] == 0
+
+    def test_recent_beyond_ring_falls_back_to_index(self, tmp_path):
+        """링 크기보다 많은 최근 기록 요청 시 사용자 인덱스 사용"""
+        storage = JsonReserveStorage(
+            config_file=str(tmp_path / "budget_config.json"),
+            recent_ring_size=3
+        )
+        manager = ReserveManager(storage=storage)
+        manager.record_issuances_bulk(
+            [{"user_id": "user001", "amount": 10, "tx_id": f"TX{i}"} for i in range(8)],
+            "2025-Q1"
+        )
+
+        _, count, recent = storage.user_summary("user001", recent=3)
+        assert (count, [r.tx_id for r in recent]) == (8, ["TX5", "TX6", "TX7"])
+        _, _, recent = storage.user_summary("user001", recent=5)
+        assert [r.tx_id for r in recent] == ["TX3", "TX4", "TX5", "TX6", "TX7"]
+
+
+class TestLazyHistory:
+    """지연 이력 적재 테스트"""
+
+    def _populate(self, tmp_path, **kwargs):
+        config_file = str(tmp_path / "budget_config.json")
+        manager = ReserveManager(config_file=config_file, **kwargs)
+        manager.record_issuances_bulk([
+            {"user_id": f"user{i % 4}", "amount": 100 * (i % 4 + 1), "tx_id": f"TX{i}"}
+            for i in range(40)
+        ], "2025-Q1")
+        manager.checkpoint()
+        manager.close()
+        return config_file
+
+    def test_snapshot_is_valid_json(self, tmp_path):
+        """한 줄당 기록 형식도 표준 JSON으로 읽힘"""
+        config_file = self._populate(tmp_path)
+        with open(config_file) as f:
+            data = json.load(f)
+        assert len(data["issuance_records"]) == 40
+        assert data["aggregates"]["issuance_count"] == 40
+
+    def test_startup_loads_only_aggregates(self, tmp_path):
+        """시작 시 이력 미적재, 한도 확인·저널 기록은 집계값 사용"""
+        journal_file = str(tmp_path / "budget_journal.jsonl")
+        config_file = self._populate(tmp_path, journal_file=journal_file)
+        manager = ReserveManager(
+            config_file=config_file, journal_file=journal_file, lazy_history=True
+        )
+
+        assert len(manager.storage.records) == 0
+        check = manager.check_issuance_allowed("user3", 1001, "2025-Q1")
+        assert not check["allowed"] and "4000" in check["reason"]
+        record = manager.record_issuance("user0", 50, "recycling", "TX40", "2025-Q1")
+        assert record.record_id == "ISS-000041"
+        assert len(manager.storage.records) == 0
+
+        summary = manager.get_user_issuance_summary("user0")
+        assert summary["issuance_count"] == 11
+        assert summary["records"][-1]["tx_id"] == "TX40"
+        assert len(manager.storage.records) == 41
+
+    def test_lazy_history_with_journal(self, tmp_path):
+        """저널 재생 기록은 스냅샷 이력 뒤에 적재"""
+        journal_file = str(tmp_path / "budget_journal.jsonl")
+        config_file = self._populate(tmp_path, journal_file=journal_file)
+        manager = ReserveManager(config_file=config_file, journal_file=journal_file)
+        manager.record_issuance("user1", 10, "recycling", "TX_J", "2025-Q1")
+        manager.close()
+
+        lazy = ReserveManager(
+            config_file=config_file, journal_file=journal_file, lazy_history=True
+        )
+        assert lazy.budget_allocations["2025-Q1"].allocated == 10010
+        assert [r.tx_id for r in lazy.issuance_records][-2:] == ["TX39", "TX_J"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -4,7 +4,10 @@
 차등 보상 계산기 테스트
 """
 
+import json
+import os
 import sys
+import time
 sys.path.append("..")
 
 import pytest
@@ -88,6 +91,24 @@ class TestRewardCalculator:
         assert result["total_multiplier"] == 3.9
         assert result["final_amount"] == 3900
 
+    def test_integer_multiplier_exact(self):
+        """정수 조회표: 모든 조합이 십진 곱 결과와 일치 (부동소수 오차 없음)"""
+        from decimal import Decimal
+
+        for income in IncomeLevel:
+            for region in RegionType:
+                for activity in ActivityType:
+                    expected = (
+                        Decimal(str(RewardCalculator.INCOME_MULTIPLIERS[income])) *
+                        Decimal(str(RewardCalculator.REGION_MULTIPLIERS[region])) *
+                        Decimal(str(RewardCalculator.ACTIVITY_MULTIPLIERS[activity]))
+                    )
+                    for base in (1000, 3333, 10000):
+                        result = self.calculator.calculate_reward(
+                            base, income, region, activity
+                        )
+                        assert result["final_amount"] == int(base * expected)
+
     def test_income_decile_conversion(self):
         """소득 10분위 → 레벨 변환"""
         assert self.calculator.get_income_level(1) == IncomeLevel.LOW
@@ -120,5 +141,272 @@ class TestRewardCalculator:
         assert result["final_amount"] == 3900000
 
 
+class TestRewardBatch:
+    """일괄 보상 계산 테스트"""
+
+    def setup_method(self):
+        """테스트 초기화"""
+        self.calculator = RewardCalculator()
+
+    def test_batch_matches_scalar(self):
+        """모든 조합에서 단건 계산과 동일"""
+        rows = [
+            (base, income, region, activity)
+            for base in (0, 1, 7, 999, 1000, 12345, 1000000)
+            for income in IncomeLevel
+            for region in RegionType
+            for activity in ActivityType
+        ]
+        result = self.calculator.calculate_rewards_batch(
+            [row[0] for row in rows],
+            [row[1] for row in rows],
+            [row[2].value for row in rows],
+            [RewardCalculator.ACTIVITY_ORDER.index(row[3]) for row in rows]
+        )
+
+        for i, (base, income, region, activity) in enumerate(rows):
+            expected = self.calculator.calculate_reward(base, income, region, activity)
+            assert int(result["final_amounts"][i]) == expected["final_amount"]
+            assert int(result["bonus_amounts"][i]) == expected["bonus_amount"]
+
+    def test_batch_without_numpy(self, monkeypatch):
+        """NumPy 미설치 환경 (순수 Python 배치)"""
+        import policies.reward_calculator as reward_module
+        monkeypatch.setattr(reward_module, "np", None)
+
+        result = self.calculator.calculate_rewards_batch(
+            [1000, 1000, 999], ["low", "middle", "high"], [2, 1, 0],
+            [ActivityType.CARBON_NEUTRAL, ActivityType.LOCAL_FOOD, ActivityType.BASIC]
+        )
+        assert list(result["final_amounts"]) == [3900, 1656, 999]
+        assert list(result["bonus_amounts"]) == [2900, 656, 0]
+
+    def test_batch_micro_units_beyond_int64_product(self):
+        """기본 단위 금액이 커서 int64 곱이 넘치는 행도 단건 계산과 동일"""
+        bases = [10 ** 16 + 7, 3 * 10 ** 15 + 1, 5]
+        result = self.calculator.calculate_rewards_batch(
+            bases, ["low"] * 3, ["rural"] * 3, ["carbon_neutral"] * 3
+        )
+        for i, base in enumerate(bases):
+            expected = self.calculator.calculate_reward(
+                base, IncomeLevel.LOW, RegionType.RURAL, ActivityType.CARBON_NEUTRAL
+            )
+            assert int(result["final_amounts"][i]) == expected["final_amount"]
+
+    def test_string_array_encoding(self):
+        """문자열 ndarray는 목록과 같은 코드, 알 수 없는 값은 거부"""
+        np = pytest.importorskip("numpy")
+        values = ["rural", "urban", "suburban", "rural"]
+
+        codes = RewardCalculator.encode(np.array(values), RewardCalculator.REGION_ORDER)
+        assert codes.tolist() == list(
+            RewardCalculator.encode(values, RewardCalculator.REGION_ORDER)
+        )
+        with pytest.raises(ValueError, match="'moon'"):
+            RewardCalculator.encode(np.array(["urban", "moon"]), RewardCalculator.REGION_ORDER)
+
+    def test_batch_invalid_input(self):
+        """알 수 없는 유형·길이 불일치"""
+        with pytest.raises(ValueError):
+            self.calculator.calculate_rewards_batch(
+                [1000], ["low"], ["moon"], ["basic"]
+            )
+        with pytest.raises(ValueError):
+            self.calculator.calculate_rewards_batch(
+                [1000], ["low"], ["urban"], [99]
+            )
+        with pytest.raises(ValueError):
+            self.calculator.calculate_rewards_batch(
+                [1000, 2000], ["low"], ["urban"], ["basic"]
+            )
+
+    @pytest.mark.parametrize("use_numpy", [True, False], ids=["numpy", "python"])
+    def test_batch_rejects_non_int_codes(self, monkeypatch, use_numpy):
+        """bool·float는 정수 코드로 받지 않음"""
+        if not use_numpy:
+            import policies.reward_calculator as reward_module
+            monkeypatch.setattr(reward_module, "np", None)
+
+        with pytest.raises(ValueError):
+            self.calculator.calculate_rewards_batch([100], [True], [1.0], [0])
+        with pytest.raises(ValueError):
+            self.calculator.calculate_rewards_batch([100], [0], [1.0], [0])
+        with pytest.raises(ValueError):
+            self.calculator.calculate_rewards_batch([100], [False], [1], [0])
+
+        result = self.calculator.calculate_rewards_batch([1000], [0], ["rural"], [ActivityType.BASIC])
+        assert list(map(int, result["final_amounts"])) == [
+            self.calculator.calculate_reward(
+                1000, IncomeLevel.LOW, RegionType.RURAL, ActivityType.BASIC
+            )["final_amount"]
+        ]
+
+
+class TestRewardPolicy:
+    """가중치 정책 파일 테스트"""
+
+    def write_policy(self, path, version, low=1.5):
+        policy = {
+            "version": version,
+            "income_multipliers": {"low": low, "middle": 1.2, "high": 1.0},
+            "region_multipliers": {"urban": 1.0, "suburban": 1.15, "rural": 1.3},
+            "activity_multipliers": {
+                "basic": 1.0, "local_food": 1.2, "public_transport": 1.3,
+                "energy_saving": 1.4, "recycling": 1.5, "carbon_neutral": 2.0
+            }
+        }
+        path.write_text(json.dumps(policy))
+
+    def test_builtin_policy_version(self):
+        """정책 파일이 없으면 기본 가중치"""
+        result = RewardCalculator().calculate_reward(
+            1000, IncomeLevel.LOW, RegionType.URBAN, ActivityType.BASIC
+        )
+        assert result["policy_version"] == RewardCalculator.BUILTIN_POLICY_VERSION
+        assert result["final_amount"] == 1500
+
+    def test_reload_on_change(self, tmp_path):
+        """파일 변경 시 새 스냅샷 적용, 변경 없으면 유지"""
+        policy_file = tmp_path / "reward_policy.json"
+        self.write_policy(policy_file, "v1")
+        calculator = RewardCalculator(policy_file=str(policy_file))
+        first = calculator.policy
+
+        assert calculator.calculate_reward(
+            1000, IncomeLevel.LOW, RegionType.URBAN, ActivityType.BASIC
+        )["policy_version"] == "v1"
+        assert calculator.reload_policy() is False
+        assert calculator.policy is first
+
+        self.write_policy(policy_file, "v2", low=1.8)
+        os.utime(policy_file, ns=(0, os.stat(policy_file).st_mtime_ns + 10 ** 9))
+        assert calculator.reload_policy() is True
+
+        result = calculator.calculate_reward(
+            1000, IncomeLevel.LOW, RegionType.URBAN, ActivityType.BASIC
+        )
+        assert result["policy_version"] == "v2"
+        assert result["final_amount"] == 1800
+        assert calculator.calculate_rewards_batch(
+            [1000], ["low"], ["urban"], ["basic"]
+        )["policy_version"] == "v2"
+
+        # 이전 스냅샷은 그대로 유지 (불변)
+        assert first.version == "v1"
+        assert first.income_bp[0] == 15000
+
+    def test_invalid_policy_keeps_previous(self, tmp_path):
+        """잘못된 정책 파일은 무시하고 기존 정책 유지"""
+        policy_file = tmp_path / "reward_policy.json"
+        self.write_policy(policy_file, "v1")
+        calculator = RewardCalculator(policy_file=str(policy_file))
+
+        self.write_policy(policy_file, "v2", low=-1)
+        assert calculator.reload_policy(force=True) is False
+        assert calculator.policy.version == "v1"
+
+        policy_file.write_text("{not json")
+        assert calculator.reload_policy(force=True) is False
+        assert calculator.policy.version == "v1"
+
+    def test_wrong_shape_policy_keeps_previous(self, tmp_path):
+        """형식이 다른 JSON(목록, 객체가 아닌 규칙)도 무시하고 기존 정책 유지"""
+        policy_file = tmp_path / "reward_policy.json"
+        self.write_policy(policy_file, "v1")
+        calculator = RewardCalculator(policy_file=str(policy_file))
+
+        policy_file.write_text("[1, 2]")
+        assert calculator.reload_policy(force=True) is False
+        assert calculator.policy.version == "v1"
+
+        self.write_policy(policy_file, "v2")
+        policy = json.loads(policy_file.read_text())
+        for rules in (["oops"], {"type": "streak"}):
+            policy_file.write_text(json.dumps({**policy, "rules": rules}))
+            assert calculator.reload_policy(force=True) is False
+            assert calculator.policy.version == "v1"
+
+    def test_watcher_survives_unexpected_error(self, tmp_path, monkeypatch):
+        """감시 중 예상하지 못한 오류가 나도 다음 주기에 다시 확인"""
+        policy_file = tmp_path / "reward_policy.json"
+        self.write_policy(policy_file, "v1")
+        calculator = RewardCalculator(policy_file=str(policy_file), reload_interval=0.01)
+        reload_policy = calculator.reload_policy
+        calls = []
+
+        def flaky_reload(force=False):
+            calls.append(force)
+            if len(calls) == 1:
+                raise TypeError("unexpected")
+            return reload_policy(force)
+
+        monkeypatch.setattr(calculator, "reload_policy", flaky_reload)
+        calculator.start_policy_watcher()
+        try:
+            self.write_policy(policy_file, "v2", low=1.8)
+            os.utime(policy_file, ns=(0, os.stat(policy_file).st_mtime_ns + 10 ** 9))
+            deadline = time.monotonic() + 2
+            while calculator.policy.version != "v2" and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            calculator.stop_policy_watcher()
+
+        assert len(calls) > 1
+        assert calculator.policy.version == "v2"
+
+
+class TestRewardQuoteCache:
+    """보상 견적 캐시 테스트"""
+
+    def test_quote_hits_and_body(self):
+        """같은 입력은 캐시 적중, 직렬화 본문 포함"""
+        calculator = RewardCalculator()
+        first = calculator.quote(1000, "low", "rural", "carbon_neutral")
+        second = calculator.quote(1000, "low", "rural", "carbon_neutral")
+
+        assert second is first
+        assert first.result["final_amount"] == 3900
+        assert json.loads(first.body) == {"success": True, "data": first.result}
+        stats = calculator.quote_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_quote_lru_bound(self):
+        """최대 항목 수 초과 시 가장 오래된 견적 제거"""
+        calculator = RewardCalculator(quote_cache_size=2)
+        a = calculator.quote(1000, "low", "urban", "basic")
+        calculator.quote(2000, "low", "urban", "basic")
+        calculator.quote(1000, "low", "urban", "basic")
+        calculator.quote(3000, "low", "urban", "basic")
+
+        assert calculator.quote_cache_stats()["size"] == 2
+        assert calculator.quote(1000, "low", "urban", "basic") is a
+        assert calculator.quote_cache_stats()["misses"] == 3
+
+    def test_quote_invalid_input(self):
+        """잘못된 입력은 오류, 캐시하지 않음"""
+        calculator = RewardCalculator()
+        with pytest.raises(ValueError):
+            calculator.quote(1000, "low", "moon", "basic")
+        with pytest.raises(ValueError):
+            calculator.quote("1000", "low", "urban", "basic")
+        assert calculator.quote_cache_stats()["size"] == 0
+
+    def test_quote_invalidated_on_policy_change(self, tmp_path):
+        """정책 교체 시 캐시 무효화"""
+        policy_file = tmp_path / "reward_policy.json"
+        TestRewardPolicy().write_policy(policy_file, "v1")
+        calculator = RewardCalculator(policy_file=str(policy_file))
+        assert calculator.quote(1000, "low", "urban", "basic").result["final_amount"] == 1500
+
+        TestRewardPolicy().write_policy(policy_file, "v2", low=1.8)
+        assert calculator.reload_policy(force=True) is True
+
+        quote = calculator.quote(1000, "low", "urban", "basic")
+        assert quote.policy_version == "v2"
+        assert quote.result["final_amount"] == 1800
+        assert calculator.quote_cache_stats()["size"] == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
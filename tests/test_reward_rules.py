@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+보상 규칙 엔진 테스트
+"""
+
+import json
+import random
+import sys
+sys.path.append("..")
+
+import pytest
+import policies.reward_rules as rules_module
+from policies.reward_calculator import (
+    RewardCalculator,
+    IncomeLevel,
+    RegionType,
+    ActivityType
+)
+from policies.reward_rules import compile_rules, parse_context
+
+
+ACTIVITY_NAMES = [activity.value for activity in ActivityType]
+
+RULES = [
+    {"type": "streak", "min_days": 7, "multiplier": 1.1},
+    {"type": "streak", "min_days": 30, "multiplier": 1.2},
+    {"type": "time_of_day", "start_hour": 7, "end_hour": 10, "multiplier": 1.1,
+     "activities": ["public_transport"]},
+    {"type": "time_of_day", "start_hour": 22, "end_hour": 6, "multiplier": 1.05},
+    {"type": "merchant_category", "categories": ["local_market"], "multiplier": 1.15},
+    {"type": "activity_cap", "activity": "carbon_neutral", "max_amount": 3000}
+]
+
+
+def evaluate(plan, amount, activity, **context):
+    code = ACTIVITY_NAMES.index(activity)
+    return plan.apply(amount, code, plan.multiplier(code, **context))
+
+
+class TestRewardRules:
+    """보상 규칙 엔진 테스트"""
+
+    def setup_method(self):
+        """테스트 초기화"""
+        self.plan = compile_rules(RULES, ACTIVITY_NAMES)
+
+    def test_no_rules(self):
+        """규칙이 없으면 계획 없음"""
+        assert compile_rules([], ACTIVITY_NAMES) is None
+
+    def test_rule_factors(self):
+        """규칙별 가중치·대상 행동·상한"""
+        assert evaluate(self.plan, 1000, "basic") == 1000
+        assert evaluate(self.plan, 1000, "basic", streak_days=7) == 1100
+        assert evaluate(self.plan, 1000, "basic", streak_days=30) == 1320
+        assert evaluate(self.plan, 1000, "public_transport", hour=8) == 1100
+        assert evaluate(self.plan, 1000, "basic", hour=8) == 1000
+        assert evaluate(self.plan, 1000, "basic", hour=23) == 1050
+        assert evaluate(self.plan, 1000, "basic", hour=5) == 1050
+        assert evaluate(self.plan, 1000, "basic", merchant_category="local_market") == 1150
+        assert evaluate(self.plan, 1000, "basic", merchant_category="cafe") == 1000
+        assert evaluate(self.plan, 5000, "carbon_neutral") == 3000
+        assert evaluate(
+            self.plan, 1000, "public_transport",
+            hour=8, merchant_category="local_market", streak_days=40
+        ) == 1669  # 1.1 × 1.15 × 1.1 × 1.2 = 1.6698
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_batch_matches_scalar(self, monkeypatch, use_numpy):
+        """일괄 평가와 단건 평가 결과 동일"""
+        if not use_numpy:
+            monkeypatch.setattr(rules_module, "np", None)
+        elif rules_module.np is None:
+            pytest.skip("NumPy 미설치")
+
+        rng = random.Random(3)
+        n = 500
+        amounts = [rng.randint(0, 5000) for _ in range(n)]
+        activities = [rng.randrange(len(ACTIVITY_NAMES)) for _ in range(n)]
+        contexts = {
+            "hour": [rng.choice([None] + list(range(24))) for _ in range(n)],
+            "merchant_category": [rng.choice([None, "local_market", "cafe"]) for _ in range(n)],
+            "streak_days": [rng.choice([None, 0, 7, 29, 30, 90]) for _ in range(n)]
+        }
+
+        finals, _ = self.plan.apply_batch(amounts, activities, contexts)
+
+        for i in range(n):
+            assert int(finals[i]) == self.plan.apply(
+                amounts[i], activities[i],
+                self.plan.multiplier(
+                    activities[i], contexts["hour"][i],
+                    contexts["merchant_category"][i], contexts["streak_days"][i]
+                )
+            )
+
+    def test_invalid_rules(self):
+        """잘못된 규칙"""
+        for rule in (
+            {"type": "lottery"},
+            {"type": "streak", "min_days": 0, "multiplier": 1.1},
+            {"type": "time_of_day", "start_hour": 7, "end_hour": 25, "multiplier": 1.1},
+            {"type": "merchant_category", "categories": [], "multiplier": 1.1},
+            {"type": "activity_cap", "activity": "flying", "max_amount": 10},
+            {"type": "streak", "min_days": 3, "multiplier": -1},
+            "streak",
+            ["streak", 7]
+        ):
+            with pytest.raises(ValueError):
+                compile_rules([rule], ACTIVITY_NAMES)
+
+    def test_parse_context(self):
+        """요청 규칙 평가 정보 검증"""
+        assert parse_context(None) == {}
+        assert parse_context({"hour": 8})["hour"] == 8
+        for context in ({"hour": 24}, {"streak_days": -1}, {"merchant_category": 3}):
+            with pytest.raises(ValueError):
+                parse_context(context)
+
+    def test_calculator_applies_policy_rules(self, tmp_path):
+        """정책 파일 규칙이 단건·일괄 계산에 적용"""
+        policy_file = tmp_path / "reward_policy.json"
+        policy_file.write_text(json.dumps({
+            "version": "rules-v1",
+            "income_multipliers": {"low": 1.5, "middle": 1.2, "high": 1.0},
+            "region_multipliers": {"urban": 1.0, "suburban": 1.15, "rural": 1.3},
+            "activity_multipliers": {
+                "basic": 1.0, "local_food": 1.2, "public_transport": 1.3,
+                "energy_saving": 1.4, "recycling": 1.5, "carbon_neutral": 2.0
+            },
+            "rules": RULES
+        }))
+        calculator = RewardCalculator(policy_file=str(policy_file))
+
+        result = calculator.calculate_reward(
+            1000, IncomeLevel.LOW, RegionType.URBAN, ActivityType.BASIC,
+            context={"streak_days": 30}
+        )
+        assert result["final_amount"] == 1980
+        assert result["rule_multiplier"] == pytest.approx(1.32)
+
+        capped = calculator.calculate_reward(
+            1000, IncomeLevel.LOW, RegionType.RURAL, ActivityType.CARBON_NEUTRAL
+        )
+        assert capped["final_amount"] == 3000
+
+        batch = calculator.calculate_rewards_batch(
+            [1000, 1000], ["low", "low"], ["urban", "rural"], ["basic", "carbon_neutral"],
+            contexts={"streak_days": [30, None]}
+        )
+        assert list(map(int, batch["final_amounts"])) == [1980, 3000]
+        assert list(map(int, batch["bonus_amounts"])) == [980, 2000]
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+불변식 검증 작업 테스트
+"""
+
+import sys
+sys.path.append("..")
+
+import threading
+import pytest
+from benchmarks.hot_paths import LocalLedger
+from contracts.reserve_manager import ReserveManager
+from services.config_service import ConfigService
+from verification.invariants import InvariantVerifier
+from verification.verification_jobs import VerificationJobManager, COMPLETED, FAILED, RUNNING
+
+
+class BlockingVerifier:
+    """release 전까지 끝나지 않는 검증기"""
+
+    def __init__(self, release: threading.Event, started: threading.Event):
+        self.release = release
+        self.started = started
+
+    def verify_all_invariants(self, progress=None):
+        progress({"step": "asset_conservation", "checks_completed": 0, "checks_total": 4})
+        self.started.set()
+        self.release.wait(5)
+        return {"all_passed": True}
+
+
+class StaticConfig(ConfigService):
+    """고정 계정 설정"""
+
+    def __init__(self, data):
+        super().__init__()
+        self.data = data
+
+    def get(self, path):
+        return self.data
+
+
+def wait_done(manager, job_id):
+    for _ in range(500):
+        job = manager.get(job_id)
+        if job["status"] in (COMPLETED, FAILED):
+            return job
+        threading.Event().wait(0.01)
+    raise AssertionError("작업이 끝나지 않았습니다.")
+
+
+class TestVerificationJobManager:
+    """작업 등록·공유·결과 보관"""
+
+    def test_concurrent_submits_share_running_job(self):
+        release, started = threading.Event(), threading.Event()
+        created_count = []
+
+        def factory(asset_id):
+            created_count.append(asset_id)
+            return BlockingVerifier(release, started)
+
+        manager = VerificationJobManager(factory)
+        first, created = manager.submit(1001)
+        assert created is True
+        started.wait(5)
+
+        second, created_again = manager.submit(1001)
+        assert created_again is False
+        assert second["job_id"] == first["job_id"]
+        assert second["status"] == RUNNING
+        assert second["progress"]["step"] == "asset_conservation"
+
+        release.set()
+        job = wait_done(manager, first["job_id"])
+        manager.shutdown()
+        assert job["status"] == COMPLETED
+        assert job["result"] == {"all_passed": True}
+        assert created_count == [1001]
+
+    def test_new_job_after_completion(self):
+        release, started = threading.Event(), threading.Event()
+        release.set()
+        manager = VerificationJobManager(lambda asset_id: BlockingVerifier(release, started))
+
+        first, _ = manager.submit(1001)
+        wait_done(manager, first["job_id"])
+        second, created = manager.submit(1001)
+        wait_done(manager, second["job_id"])
+        manager.shutdown()
+        assert created is True
+        assert second["job_id"] != first["job_id"]
+        assert manager.latest(1001)["job_id"] == second["job_id"]
+
+    def test_latest_reports_age(self):
+        now = [1000.0]
+        release, started = threading.Event(), threading.Event()
+        release.set()
+        manager = VerificationJobManager(
+            lambda asset_id: BlockingVerifier(release, started), clock=lambda: now[0]
+        )
+
+        assert manager.latest(1001) is None
+        job, _ = manager.submit(1001)
+        wait_done(manager, job["job_id"])
+        now[0] += 42.0
+        latest = manager.latest(1001)
+        manager.shutdown()
+        assert latest["age_seconds"] == 42.0
+        assert latest["result"] == {"all_passed": True}
+
+    def test_failed_job_not_cached_as_latest(self):
+        def factory(asset_id):
+            raise FileNotFoundError("accounts_config.json")
+
+        manager = VerificationJobManager(factory)
+        job, _ = manager.submit(1001)
+        job = wait_done(manager, job["job_id"])
+        manager.shutdown()
+        assert job["status"] == FAILED
+        assert "accounts_config.json" in job["error"]
+        assert manager.latest(1001) is None
+
+    def test_old_jobs_trimmed(self):
+        release, started = threading.Event(), threading.Event()
+        release.set()
+        manager = VerificationJobManager(
+            lambda asset_id: BlockingVerifier(release, started), max_jobs=3
+        )
+
+        job_ids = []
+        for asset_id in range(5):
+            job, _ = manager.submit(asset_id)
+            wait_done(manager, job["job_id"])
+            job_ids.append(job["job_id"])
+        manager.shutdown()
+        assert manager.stats()["jobs"] == 3
+        assert manager.get(job_ids[0]) is None
+        # 보관 기간이 지나도 자산별 최근 결과는 유지
+        assert manager.latest(0)["job_id"] == job_ids[0]
+
+    def test_invalid_max_jobs(self):
+        with pytest.raises(ValueError):
+            VerificationJobManager(lambda asset_id: None, max_jobs=0)
+
+
+class TestVerifierProgress:
+    """InvariantVerifier 진행 상황 보고"""
+
+    def test_progress_counts_addresses(self, tmp_path):
+        citizens = [f"CITIZEN{i:02d}" for i in range(30)]
+        merchants = [f"MERCHANT{i:02d}" for i in range(10)]
+        holdings = {address: 100 for address in citizens + merchants}
+        holdings["RESERVE"] = 1000
+        ledger = LocalLedger(asset_id=1, total=5000, holdings=holdings)
+        manager = ReserveManager(
+            config_file=str(tmp_path / "budget_config.json"),
+            journal_file=str(tmp_path / "budget_journal.jsonl")
+        )
+        verifier = InvariantVerifier(
+            ledger, 1,
+            reserve_manager=manager,
+            config_service=StaticConfig({
+                "reserve_address": "RESERVE",
+                "citizen_addresses": tuple(citizens),
+                "merchant_addresses": tuple(merchants + ["NOT_OPTED_IN"])
+            })
+        )
+
+        updates = []
+        results = verifier.verify_all_invariants(progress=updates.append)
+        assert results["all_passed"] is True
+        assert results["asset_conservation"]["citizen_sum"] == 3000
+        assert results["asset_conservation"]["merchant_sum"] == 1000
+        assert max(u["addresses_checked"] for u in updates) == 41
+        assert updates[-1]["checks_completed"] == 4
+        assert updates[-1]["addresses_total"] == 41
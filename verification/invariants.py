@@ -11,10 +11,21 @@ PRD 4.2: 필수 불변식 구현
 4. 감사 검증: 정책버전별_증빙해시 ≥ 1건
 """
 
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence
+from algosdk.error import AlgodHTTPError
 from algosdk.v2client import algod
 import json
 
+from services.config_service import ConfigService, shared_config
+
+
+# 검증 항목 (verify_all_invariants 실행 순서)
+INVARIANT_CHECKS = ("asset_conservation", "limit_compliance", "clawback_compliance", "audit_trail")
+
+# 자산 보존 검증 시 잔액 동시 조회 수
+BALANCE_LOOKUP_WORKERS = 8
+
 
 class InvariantViolationError(Exception):
     """불변식 위반 예외"""
@@ -28,22 +39,38 @@ class InvariantVerifier:
         self,
         algod_client: algod.AlgodClient,
         asset_id: int,
-        config_file: str = "../config/accounts_config.json"
+        config_file: str = "../config/accounts_config.json",
+        reserve_manager=None,
+        config_service: Optional[ConfigService] = None,
+        lookup_workers: int = BALANCE_LOOKUP_WORKERS
     ):
+        """
+        Args:
+            algod_client: Algorand 클라이언트
+            asset_id: 검증 대상 ASA ID
+            config_file: 계정 설정 파일 경로
+            reserve_manager: 한도 검증에 사용할 ReserveManager (None이면 기본 설정으로 생성)
+            config_service: 설정 서비스 (None이면 프로세스 공용 인스턴스)
+            lookup_workers: 시민·가맹점 잔액 동시 조회 수
+        """
         self.algod_client = algod_client
         self.asset_id = asset_id
         self.config_file = config_file
+        self.reserve_manager = reserve_manager
+        self.config_service = config_service or shared_config
+        self.lookup_workers = lookup_workers
+        self._progress: Optional[Callable[[Dict], None]] = None
+        self._progress_state: Dict = {}
         self._load_accounts_config()
 
     def _load_accounts_config(self):
-        """계정 설정 로드"""
+        """계정 설정 로드 (공유 스냅샷, 주소 목록은 tuple)"""
         try:
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
-                self.reserve_address = config.get("reserve_address")
-                self.citizen_addresses = config.get("citizen_addresses", [])
-                self.merchant_addresses = config.get("merchant_addresses", [])
-                self.clawback_address = config.get("clawback_address")
+            config = self.config_service.get(self.config_file)
+            self.reserve_address = config.get("reserve_address")
+            self.citizen_addresses = config.get("citizen_addresses", ())
+            self.merchant_addresses = config.get("merchant_addresses", ())
+            self.clawback_address = config.get("clawback_address")
         except FileNotFoundError:
             print("⚠️  계정 설정 파일 없음. 기본값 사용.")
             self.reserve_address = None
@@ -51,38 +78,42 @@ class InvariantVerifier:
             self.merchant_addresses = []
             self.clawback_address = None
 
-    def verify_all_invariants(self) -> Dict:
-        """모든 불변식 검증"""
+    def verify_all_invariants(self, progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """
+        모든 불변식 검증
+
+        Args:
+            progress: 진행 상황 콜백 (검증 항목·조회한 주소 수가 바뀔 때마다 사본 dict로 호출)
+                      {"step", "checks_completed", "checks_total", "addresses_checked", "addresses_total"}
+        """
         print("🔍 불변식 검증 시작...")
 
-        results = {
-            "asset_conservation": None,
-            "limit_compliance": None,
-            "clawback_compliance": None,
-            "audit_trail": None,
-            "all_passed": False
+        results = {name: None for name in INVARIANT_CHECKS}
+        results["all_passed"] = False
+
+        self._progress = progress
+        self._progress_state = {
+            "step": None,
+            "checks_completed": 0,
+            "checks_total": len(INVARIANT_CHECKS),
+            "addresses_checked": 0,
+            "addresses_total": len(self.citizen_addresses) + len(self.merchant_addresses)
+        }
+        checks = {
+            "asset_conservation": self.verify_asset_conservation,   # 1. 자산 보존 검증
+            "limit_compliance": self.verify_limit_compliance,       # 2. 한도 검증
+            "clawback_compliance": self.verify_clawback_compliance, # 3. 회수 검증
+            "audit_trail": self.verify_audit_trail                  # 4. 감사 검증
         }
 
         try:
-            # 1. 자산 보존 검증
-            results["asset_conservation"] = self.verify_asset_conservation()
-
-            # 2. 한도 검증
-            results["limit_compliance"] = self.verify_limit_compliance()
-
-            # 3. 회수 검증
-            results["clawback_compliance"] = self.verify_clawback_compliance()
-
-            # 4. 감사 검증
-            results["audit_trail"] = self.verify_audit_trail()
+            for completed, name in enumerate(INVARIANT_CHECKS):
+                self._report(step=name, checks_completed=completed)
+                results[name] = checks[name]()
+            self._report(step=None, checks_completed=len(INVARIANT_CHECKS))
 
             # 전체 결과
-            results["all_passed"] = all([
-                results["asset_conservation"]["passed"],
-                results["limit_compliance"]["passed"],
-                results["clawback_compliance"]["passed"],
-                results["audit_trail"]["passed"]
-            ])
+            results["all_passed"] = all(results[name]["passed"] for name in INVARIANT_CHECKS)
 
             if results["all_passed"]:
                 print("✅ 모든 불변식 검증 통과!")
@@ -93,8 +124,17 @@ class InvariantVerifier:
             print(f"❌ 불변식 검증 실패: {e}")
             results["error"] = str(e)
 
+        finally:
+            self._progress = None
+
         return results
 
+    def _report(self, **fields):
+        """진행 상황 갱신 후 콜백 호출"""
+        self._progress_state.update(fields)
+        if self._progress is not None:
+            self._progress(dict(self._progress_state))
+
     def verify_asset_conservation(self) -> Dict:
         """
         불변식 1: 자산 보존
@@ -110,17 +150,12 @@ class InvariantVerifier:
             # Reserve 잔액
             reserve_balance = self._get_asset_balance(self.reserve_address) or 0
 
-            # 시민 지갑 합계
-            citizen_sum = sum(
-                self._get_asset_balance(addr) or 0
-                for addr in self.citizen_addresses
-            )
-
-            # 가맹점 합계
-            merchant_sum = sum(
-                self._get_asset_balance(addr) or 0
-                for addr in self.merchant_addresses
+            # 시민 지갑·가맹점 잔액 (동시 조회)
+            balances = self._get_asset_balances(
+                tuple(self.citizen_addresses) + tuple(self.merchant_addresses)
             )
+            citizen_sum = sum(b or 0 for b in balances[:len(self.citizen_addresses)])
+            merchant_sum = sum(b or 0 for b in balances[len(self.citizen_addresses):])
 
             # 회수 계정
             clawback_sum = self._get_asset_balance(self.clawback_address) or 0
@@ -165,31 +200,17 @@ class InvariantVerifier:
 
         try:
             # Reserve Manager에서 데이터 로드
-            from contracts.reserve_manager import ReserveManager
-            manager = ReserveManager()
+            manager = self.reserve_manager
+            if manager is None:
+                from contracts.reserve_manager import ReserveManager
+                manager = ReserveManager()
 
             violations = []
 
-            # 모든 발급 기록 확인
-            for record in manager.issuance_records:
-                user_id = record.user_id
-
-                # 사용자 총 발급량
-                user_summary = manager.get_user_issuance_summary(user_id)
-                total_issued = user_summary["total_issued"]
-
-                # 한도 확인 (임시로 2025-Q1 사용)
-                allocation = manager.budget_allocations.get("2025-Q1")
-                if allocation:
-                    limit = allocation.per_person_limit
-
-                    if total_issued > limit:
-                        violations.append({
-                            "user_id": user_id,
-                            "total_issued": total_issued,
-                            "limit": limit,
-                            "excess": total_issued - limit
-                        })
+            # 기간별로 누적 발급 상위 사용자부터 확인 (한도 이하가 나오면 중단)
+            for period, allocation in manager.budget_allocations.items():
+                limit = allocation.per_person_limit
+                violations.extend(self._limit_violations(manager, period, limit))
 
             passed = (len(violations) == 0)
 
@@ -215,6 +236,32 @@ class InvariantVerifier:
                 "error": str(e)
             }
 
+    @staticmethod
+    def _limit_violations(manager, period: str, limit: int) -> List[Dict]:
+        """
+        기간 한도 초과 사용자
+
+        순위표를 2배씩 넓혀 가며 조회하므로 위반 사용자 수에 비례해 끝나며,
+        전체 발급 기록을 훑지 않는다.
+        """
+        size = 16
+        while True:
+            ranked = manager.get_top_recipients(limit=size, period=period)
+            if len(ranked) < size or ranked[-1]["total_issued"] <= limit:
+                break
+            size *= 2
+
+        return [
+            {
+                "user_id": row["user_id"],
+                "period": period,
+                "total_issued": row["total_issued"],
+                "limit": limit,
+                "excess": row["total_issued"] - limit
+            }
+            for row in ranked if row["total_issued"] > limit
+        ]
+
     def verify_clawback_compliance(self) -> Dict:
         """
         불변식 3: 회수 검증
@@ -289,24 +336,36 @@ class InvariantVerifier:
             }
 
     def _get_asset_balance(self, address: str) -> Optional[int]:
-        """계정의 ASA 잔액 조회"""
+        """계정의 ASA 잔액 조회 (opt-in 전이면 0, 조회 실패 시 None)"""
         if not address:
             return None
 
         try:
-            account_info = self.algod_client.account_info(address)
-            assets = account_info.get("assets", [])
-
-            for asset in assets:
-                if asset["asset-id"] == self.asset_id:
-                    return asset["amount"]
+            info = self.algod_client.account_asset_info(address, self.asset_id)
+            return info["asset-holding"]["amount"]
 
-            return 0
+        except AlgodHTTPError as e:
+            if e.code == 404:
+                return 0
+            print(f"⚠️  잔액 조회 실패 ({address[:10]}...): {e}")
+            return None
 
         except Exception as e:
             print(f"⚠️  잔액 조회 실패 ({address[:10]}...): {e}")
             return None
 
+    def _get_asset_balances(self, addresses: Sequence[str]) -> List[Optional[int]]:
+        """여러 계정의 ASA 잔액 동시 조회 (addresses 순서, 조회할 때마다 진행 상황 보고)"""
+        if not addresses:
+            return []
+
+        with ThreadPoolExecutor(max_workers=self.lookup_workers) as pool:
+            balances = []
+            for balance in pool.map(self._get_asset_balance, addresses):
+                balances.append(balance)
+                self._report(addresses_checked=self._progress_state.get("addresses_checked", 0) + 1)
+        return balances
+
     def generate_compliance_report(self) -> str:
         """규정 준수 리포트 생성"""
         results = self.verify_all_invariants()
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+불변식 검증 작업 (백그라운드 실행)
+PRD 4.2: 필수 불변식 - 주소 수가 많을 때 요청 안에서 검증하지 않음
+
+- submit: 작업 ID를 즉시 반환하고 백그라운드 스레드가 검증 실행
+- 같은 자산의 검증이 대기·실행 중이면 새 작업을 만들지 않고 그 작업을 공유
+- get: 상태(queued/running/completed/failed)와 진행 상황 조회
+- latest: 자산별 가장 최근 완료 결과를 경과 시간과 함께 즉시 반환
+- 완료된 작업은 최근 max_jobs개만 보관
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Tuple
+
+
+# 작업 상태
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+DEFAULT_MAX_JOBS = 100      # 보관할 작업 수 (대기·실행 중 작업은 제외하고 오래된 순 제거)
+DEFAULT_WORKERS = 2         # 동시에 실행할 검증 수 (자산 단위)
+
+
+@dataclass
+class VerificationJob:
+    """검증 작업 (필드는 VerificationJobManager의 잠금 안에서만 변경)"""
+    job_id: str
+    asset_id: int
+    status: str
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    progress: Dict = field(default_factory=dict)
+    result: Optional[Dict] = None
+    error: Optional[str] = None
+
+    @property
+    def active(self) -> bool:
+        return self.status in (QUEUED, RUNNING)
+
+
+class VerificationJobManager:
+    """불변식 검증 작업 관리자"""
+
+    def __init__(
+        self,
+        verifier_factory: Callable[[int], object],
+        max_workers: int = DEFAULT_WORKERS,
+        max_jobs: int = DEFAULT_MAX_JOBS,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            verifier_factory: asset_id → InvariantVerifier (작업마다 새로 생성, 설정 변경 반영)
+            max_workers: 동시에 실행할 검증 수
+            max_jobs: 보관할 작업 수
+            clock: 시계 (테스트용)
+        """
+        if max_jobs <= 0:
+            raise ValueError("max_jobs는 1 이상이어야 합니다.")
+
+        self.verifier_factory = verifier_factory
+        self.max_jobs = max_jobs
+        self._clock = clock
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="invariant-job")
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, VerificationJob]" = OrderedDict()
+        self._active: Dict[int, str] = {}                  # asset_id → 대기·실행 중 작업 ID
+        self._latest_jobs: Dict[int, VerificationJob] = {}  # asset_id → 최근 완료 작업
+
+    def submit(self, asset_id: int) -> Tuple[Dict, bool]:
+        """
+        검증 작업 등록
+
+        Returns:
+            (작업 정보, 새로 만든 작업이면 True / 진행 중인 작업을 공유하면 False)
+        """
+        with self._lock:
+            job_id = self._active.get(asset_id)
+            if job_id is not None:
+                return self._view(self._jobs[job_id]), False
+
+            job = VerificationJob(
+                job_id=uuid.uuid4().hex,
+                asset_id=asset_id,
+                status=QUEUED,
+                created_at=self._clock()
+            )
+            self._jobs[job.job_id] = job
+            self._active[asset_id] = job.job_id
+            self._trim()
+            view = self._view(job)
+
+        self._pool.submit(self._run, job)
+        return view, True
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """작업 상태 조회 (없거나 보관 기간이 지났으면 None)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return self._view(job) if job is not None else None
+
+    def latest(self, asset_id: int) -> Optional[Dict]:
+        """자산의 가장 최근 완료 결과 (age_seconds 포함, 없으면 None)"""
+        with self._lock:
+            job = self._latest_jobs.get(asset_id)
+            if job is None:
+                return None
+            return {**self._view(job), "age_seconds": round(self._clock() - job.finished_at, 3)}
+
+    def stats(self) -> Dict:
+        """작업 수 통계"""
+        with self._lock:
+            counts = {QUEUED: 0, RUNNING: 0, COMPLETED: 0, FAILED: 0}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+            return {"jobs": len(self._jobs), "max_jobs": self.max_jobs, **counts}
+
+    def shutdown(self, wait: bool = True):
+        """작업 스레드 종료"""
+        self._pool.shutdown(wait=wait)
+
+    def _run(self, job: VerificationJob):
+        """백그라운드 검증 실행"""
+        with self._lock:
+            job.status = RUNNING
+            job.started_at = self._clock()
+
+        def on_progress(progress: Dict):
+            with self._lock:
+                job.progress = progress
+
+        try:
+            verifier = self.verifier_factory(job.asset_id)
+            result = verifier.verify_all_invariants(progress=on_progress)
+        except Exception as e:
+            with self._lock:
+                job.status = FAILED
+                job.error = str(e)
+                job.finished_at = self._clock()
+                self._active.pop(job.asset_id, None)
+            return
+
+        with self._lock:
+            job.status = COMPLETED
+            job.result = result
+            job.finished_at = self._clock()
+            self._active.pop(job.asset_id, None)
+            self._latest_jobs[job.asset_id] = job
+
+    def _trim(self):
+        """오래된 완료 작업 제거 (_lock 보유 상태, 최근 완료 결과는 latest로 계속 제공)"""
+        excess = len(self._jobs) - self.max_jobs
+        if excess <= 0:
+            return
+        for job_id in [j.job_id for j in self._jobs.values() if not j.active][:excess]:
+            del self._jobs[job_id]
+
+    @staticmethod
+    def _view(job: VerificationJob) -> Dict:
+        """작업 정보 사본 (_lock 보유 상태, 결과 dict는 완료 후 변경되지 않으므로 공유)"""
+        view = {
+            "job_id": job.job_id,
+            "asset_id": job.asset_id,
+            "status": job.status,
+            "created_at": job.created_at,
+            "started_at": job.started_at,
+            "finished_at": job.finished_at,
+            "progress": dict(job.progress)
+        }
+        if job.status == COMPLETED:
+            view["result"] = job.result
+        if job.status == FAILED:
+            view["error"] = job.error
+        return view
+
+
+def main():
+    """
+    작업 등록·공유·조회 예시 (python -m verification.verification_jobs)
+
+    algod 대신 조회마다 10ms 걸리는 메모리 원장(시민 주소 200개)을 사용한다.
+    """
+    import tempfile
+
+    from algosdk.error import AlgodHTTPError
+    from contracts.reserve_manager import ReserveManager
+    from services.config_service import ConfigService
+    from verification.invariants import InvariantVerifier
+
+    citizens = [f"CITIZEN{i:03d}" for i in range(200)]
+
+    class DemoLedger:
+        """algod 대역 (자산 정보·계정별 보유량 조회만 제공)"""
+
+        def asset_info(self, asset_id):
+            return {"index": asset_id, "params": {"total": 200_000, "metadata-hash": "ZGVtbw=="}}
+
+        def account_asset_info(self, address, asset_id):
+            time.sleep(0.01)
+            if address not in citizens:
+                raise AlgodHTTPError("account asset information not found", code=404)
+            return {"asset-holding": {"asset-id": asset_id, "amount": 1000, "is-frozen": False}}
+
+    class DemoConfig(ConfigService):
+        def get(self, path):
+            return {"citizen_addresses": citizens}
+
+    workdir = tempfile.mkdtemp()
+    reserve = ReserveManager(
+        config_file=f"{workdir}/budget_config.json",
+        journal_file=f"{workdir}/budget_journal.jsonl"
+    )
+    ledger = DemoLedger()
+    manager = VerificationJobManager(
+        lambda asset_id: InvariantVerifier(
+            ledger, asset_id, reserve_manager=reserve, config_service=DemoConfig()
+        )
+    )
+    first, created = manager.submit(1001)
+    second, shared = manager.submit(1001)
+    print(f"작업 {first['job_id'][:8]} 생성={created}, 두 번째 요청 공유={not shared and second['job_id'] == first['job_id']}")
+
+    while manager.get(first["job_id"])["status"] in (QUEUED, RUNNING):
+        progress = manager.get(first["job_id"])["progress"]
+        print(f"  진행: {progress.get('step')} {progress.get('addresses_checked', 0)}/{progress.get('addresses_total', 0)}")
+        time.sleep(0.1)
+
+    latest = manager.latest(1001)
+    print(f"최근 결과: status={latest['status']}, age={latest['age_seconds']}s")
+    manager.shutdown()
+
+
+if __name__ == "__main__":
+    main()